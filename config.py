@@ -14,6 +14,14 @@ DATA_DIR = BASE_DIR / "data"
 RAW_DIR = DATA_DIR / "raw"
 PROCESSED_DIR = DATA_DIR / "processed"
 ARCHIVE_DIR = DATA_DIR / "archive"
+CACHE_DIR = DATA_DIR / "cache"
+HTTP_CACHE_PATH = CACHE_DIR / "http_validators.json"  # ETag / Last-Modified / 본문 해시
+
+# ── Record Sink (data/raw, data/processed JSONL) ──────────────────────────────
+RECORD_SINK_COMPRESSION: str = os.getenv("RECORD_SINK_COMPRESSION", "gzip")  # gzip | zstd | none
+RECORD_SINK_MAX_BYTES: int = 64 * 1024 * 1024   # 파일 회전 크기 (압축 후)
+RECORD_SINK_MAX_AGE_SEC: float = 3600.0         # 파일 회전 주기
+RECORD_SINK_FLUSH_EVERY: int = 20               # N건마다 디스크 기록 (기본값 — 분석 결과 sink 는 1건마다, scout 은 소스별 즉시 flush)
 
 # ── Secrets: Streamlit Cloud secrets.toml 우선, 없으면 env var 사용 ──────────
 def _get_secret(key: str, default: str = "") -> str:
@@ -42,6 +50,56 @@ CLAUDE_ANALYSIS_MODEL: str = "claude-haiku-4-5-20251001"  # 개별 신호 분석
 CLAUDE_MAX_TOKENS: int = 1024                     # 신호 분석 JSON 출력 상한
 CLAUDE_REPORT_MAX_TOKENS: int = 8192             # 주간 리포트 출력 상한
 CLAUDE_MONTHLY_MAX_TOKENS: int = 12000           # 월간 리포트 출력 상한
+CLAUDE_CONCURRENCY_INITIAL: int = 4              # 동시 호출 시작값 (rate limit 헤더 기반 자동 증감)
+CLAUDE_CONCURRENCY_MAX: int = 16                 # 동시 호출 상한 (분석 스레드 풀 크기)
+CLAUDE_MAX_RETRIES: int = 4                      # 429/529/5xx/연결 오류 재시도 횟수
+CLAUDE_ANALYSIS_MODE: str = os.getenv("CLAUDE_ANALYSIS_MODE", "realtime")  # realtime | packed (K건/요청) | batch (Message Batches)
+CLAUDE_BATCH_STATE_DIR = CACHE_DIR / "message_batches"  # 제출 배치 ID + 대기 신호 (재시작 후 재개)
+CLAUDE_BATCH_POLL_SEC: float = 60.0              # 배치 상태 폴링 간격
+CLAUDE_BATCH_MAX_WAIT_SEC: float = float(os.getenv("CLAUDE_BATCH_MAX_WAIT_SEC", str(24 * 3600)))  # 실행당 최대 대기 (초과 시 다음 실행에서 수집)
+CLAUDE_PACK_MAX_SIGNALS: int = 10                # packed 모드 요청당 신호 수(K) 상한
+CLAUDE_PACK_INPUT_TOKENS: int = 6000             # packed 요청당 신호 입력 토큰 예산 (추정치)
+CLAUDE_PACK_MAX_TOKENS: int = 8192               # packed 응답 출력 상한 (K × 신호당 출력 추정치 ≤ 이 값)
+CLAUDE_PACK_OUTPUT_TOKENS_PER_SIGNAL: int = 700  # 신호당 출력 토큰 초기 추정치 (실제 usage 로 갱신)
+CLAUDE_STRICT_TOOLS: bool = os.getenv("CLAUDE_STRICT_TOOLS", "true").lower() != "false"  # 분석 도구 스키마 서버 측 검증 (미지원 모델이면 false)
+CLAUDE_REPAIR_ENABLED: bool = True               # 필수 필드 누락 응답에 검증 오류를 돌려주고 1회 재요청
+CLAUDE_LITE_MODEL: str = "claude-haiku-4-5-20251001"  # triage lite 등급 간이 분석
+CLAUDE_LITE_MAX_TOKENS: int = 400                # lite 분석 출력 상한 (요약 2문장 + 분류)
+
+# ── LLM Response Cache (pipeline/llm_cache.py) ────────────────────────────────
+LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() != "false"
+LLM_CACHE_PATH = CACHE_DIR / "llm_responses.sqlite3"   # 분석·주간·월간 리포트 응답 공용
+LLM_CACHE_MAX_BYTES: int = 256 * 1024 * 1024           # 초과 시 LRU 정리 (압축 후 크기)
+
+# ── LLM Call Ledger (pipeline/llm_ledger.py) ──────────────────────────────────
+LLM_LEDGER_ENABLED: bool = os.getenv("LLM_LEDGER_ENABLED", "true").lower() != "false"
+LLM_LEDGER_FLUSH_ROWS: int = 200                # 버퍼가 이 행 수에 도달하면 DB 일괄 기록
+# 모델 ID 접두어별 USD / 1M 토큰 (input, output, cache_write=5분 캐시 기록, cache_read)
+CLAUDE_PRICING_PER_MTOK: dict[str, dict[str, float]] = {
+    "claude-opus-4":   {"input": 15.0, "output": 75.0, "cache_write": 18.75, "cache_read": 1.50},
+    "claude-sonnet-4": {"input": 3.0,  "output": 15.0, "cache_write": 3.75,  "cache_read": 0.30},
+    "claude-haiku-4":  {"input": 1.0,  "output": 5.0,  "cache_write": 1.25,  "cache_read": 0.10},
+}
+CLAUDE_BATCH_DISCOUNT: float = 0.5              # Message Batches 과금 배율
+# 모델별 prompt cache 최소 접두부 길이 (tools + system, 토큰, 모델 ID 접두어 매칭) — 미만이면 cache_control 미부착 (붙여도 캐시 안 됨)
+CLAUDE_CACHE_MIN_TOKENS: dict[str, int] = {
+    "claude-opus-4-5": 4096,
+    "claude-opus-4":   1024,
+    "claude-sonnet-4": 1024,
+    "claude-haiku-4-5": 4096,
+    "claude-haiku-4":  2048,
+}
+
+# ── Report Generation (pipeline/report_mapreduce.py, report_sections.py) ──────
+REPORT_INPUT_MODE: str = os.getenv("REPORT_INPUT_MODE", "mapreduce")  # mapreduce (전체 신호 부분 요약) | topk (스코프별 상위 신호만)
+REPORT_MAP_MODEL: str = CLAUDE_ANALYSIS_MODEL    # 부분 요약(map·collapse) 호출 모델
+REPORT_MAP_MAX_SIGNALS: int = 12                 # map 호출 1회당 신호 수 상한 (같은 주·스코프·기업 묶음 분할 기준)
+REPORT_MAP_MAX_TOKENS: int = 1024                # 부분 요약 출력 상한
+REPORT_REDUCE_INPUT_TOKENS: int = 24000          # 최종 리포트 입력(부분 요약 합) 토큰 예산 — 초과 시 스코프·기업 단위 재요약
+REPORT_PARTIAL_CACHE_DIR = CACHE_DIR / "report_partials"  # {iso_week}/{scope}__{company}__{digest 앞 16자}.json
+REPORT_GENERATION_MODE: str = os.getenv("REPORT_GENERATION_MODE", "sectioned")  # sectioned (섹션별 동시 생성) | single (6개 섹션 1회 생성)
+REPORT_SECTION_MAX_TOKENS: int = 2048            # sectioned 모드 섹션당 출력 상한 (잘리면 해당 섹션만 2배로 재요청)
+REPORT_SECTION_MAX_ATTEMPTS: int = 2             # 섹션별 최대 시도 횟수 (실패·잘림·형식 오류 시 해당 섹션만 재시도)
 
 # ── Research Taxonomy (from CLAUDE.md) ────────────────────────────────────────
 SCOPES: list[str] = ["Market", "Tech", "Case", "Policy"]
@@ -67,14 +125,40 @@ STRATEGIC_KEYWORDS: list[str] = [
     "sim2real", "transfer learning robotics",
 ]
 
+# 뉴스 카테고리 분류 키워드 (선언 순서 = 분류 우선순위, 대소문자 무시 부분 일치)
+NEWS_CATEGORY_KEYWORDS: dict[str, list[str]] = {
+    "Investment": ["investment", "funding", "raise", "series", "m&a", "acqui"],
+    "PoC Deployment": ["deploy", "factory", "warehouse", "logistics", "poc"],
+    "Partnership": ["partner", "collaboration", "joint", "deal"],
+    "Regulation": ["regulation", "policy", "standard", "act", "law"],
+}
+
 # ── arXiv Config ──────────────────────────────────────────────────────────────
 ARXIV_CATEGORIES: list[str] = ["cs.RO", "cs.AI", "cs.CV", "cs.LG"]
-ARXIV_MAX_RESULTS: int = 15
+ARXIV_MAX_RESULTS: int = 200        # 쿼리 샤드당 상한 (cutoff 도달 시 조기 종료)
+ARXIV_MAX_TOTAL: int = 150          # 실행당 arXiv 레코드 상한 (샤드 병합·관련성 필터 후 최신순) — 분석 비용 상한
+ARXIV_PAGE_SIZE: int = 100          # HTTP 페이지당 결과 수
+ARXIV_KEYWORD_SHARD_SIZE: int = 6   # 쿼리 1건당 OR 결합 키워드 수
 ARXIV_RATE_LIMIT_SEC: float = 3.0  # 1 req per 3 seconds
+# 수집 모드: "search" (검색 API, days_back 창) | "oai" (OAI-PMH 증분, 일일 운영용)
+ARXIV_SOURCE_MODE: str = os.getenv("ARXIV_SOURCE_MODE", "search")
+ARXIV_OAI_URL: str = "https://oaipmh.arxiv.org/oai"
+ARXIV_OAI_SET: str = "cs"                                   # 카테고리 필터는 로컬 적용
+ARXIV_OAI_STATE_PATH = CACHE_DIR / "arxiv_oai_state.json"   # 마지막 성공 datestamp
 
 # ── SEC EDGAR Config ──────────────────────────────────────────────────────────
 SEC_FORM_TYPES: list[str] = ["10-K", "8-K", "S-1"]
-SEC_RATE_LIMIT_SEC: float = 0.1  # max 10 req/sec
+SEC_RATE_LIMIT_SEC: float = 0.1  # max 10 req/sec (모든 EDGAR 요청 공유 예산)
+SEC_MAX_WORKERS: int = 6            # 키워드 × form 쿼리 동시 실행 수
+SEC_MAX_PAGES_PER_QUERY: int = 10   # 쿼리당 페이지 상한 (페이지당 100건)
+# 기업명 → CIK 고정 매핑 (company_tickers.json 이름 매칭보다 우선)
+SEC_CIK_OVERRIDES: dict[str, str] = {
+    "Tesla": "1318605",
+    "NVIDIA": "1045810",
+    "Amazon": "1018724",
+}
+SEC_CIK_MAP_PATH = CACHE_DIR / "sec_cik_map.json"                  # 기업명 → CIK 캐시
+SEC_SEEN_ACCESSIONS_PATH = CACHE_DIR / "sec_seen_accessions.json"  # 처리 완료 accession 인덱스
 
 # ── News RSS Feeds ────────────────────────────────────────────────────────────
 NEWS_RSS_FEEDS: list[dict] = [
@@ -85,6 +169,13 @@ NEWS_RSS_FEEDS: list[dict] = [
     {"name": "The Robot Report", "url": "https://www.therobotreport.com/feed/", "scope": "Case"},
 ]
 
+# ── Feed Fetch Engine (동시 다운로드) ─────────────────────────────────────────
+FEED_FETCH_MAX_WORKERS: int = 16        # 전체 동시 요청 상한
+FEED_FETCH_PER_HOST_LIMIT: int = 4      # 호스트별 동시 요청 상한 (news.google.com 등)
+FEED_FETCH_TIMEOUT_SEC: float = 20.0    # 요청 1건 타임아웃 (연결 + 본문 수신)
+FEED_FETCH_DEADLINE_SEC: float = 60.0   # 전체 다운로드 마감 시간
+FEED_USER_AGENT: str = "PASIS-Research/1.0 (+research@lguplus.com)"
+
 # ── Key Players (News Feed) ───────────────────────────────────────────────────
 KEY_PLAYERS: list[dict] = [
     {"name": "NVIDIA",            "category_label": "Brain & Platform",       "color": "#76B900",
@@ -132,6 +223,45 @@ SCHEDULE_DAY: str = os.getenv("SCHEDULE_DAY", "monday")
 SCHEDULE_HOUR: int = int(os.getenv("SCHEDULE_HOUR", "9"))
 SCHEDULE_TIMEZONE: str = os.getenv("SCHEDULE_TIMEZONE", "Asia/Seoul")
 
+# ── Near-Duplicate Detection (pipeline/dedup.py) ──────────────────────────────
+NEAR_DUP_TITLE_JACCARD: float = 0.75    # 제목 단어 집합 Jaccard 이상 + 제목 개체(기업·숫자) 일치 → 동일 기사
+NEAR_DUP_CONTENT_JACCARD: float = 0.5   # 본문 앞부분 3-gram Jaccard 이상 → 동일 기사 (제목 재작성 대응)
+NEAR_DUP_CONTENT_CHARS: int = 500       # 본문 비교 대상 앞부분 길이
+URL_TRACKING_PARAMS: frozenset[str] = frozenset({  # 정규 URL에서 제거 (utm_* 는 접두사로 제거)
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ocid", "cmpid",
+    "ref", "ref_src", "ref_url", "guccounter", "guce_referrer", "guce_referrer_sig",
+    "_hsenc", "_hsmi", "mkt_tok", "ncid", "sr_share", "taid", "smid", "cid",
+})
+
+# ── Seen Index (pipeline/seen_index.py) ───────────────────────────────────────
+SEEN_BLOOM_CAPACITY: int = 1_000_000    # Bloom filter 최소 용량 (로드 시 지문 수 × 2 이상으로 자동 확장)
+SEEN_BLOOM_ERROR_RATE: float = 0.01     # 오탐률 (오탐은 DB 확인으로 제거)
+
+# ── Replay (run_pipeline.py --replay) ─────────────────────────────────────────
+REPLAY_CHUNK_SIZE: int = 200     # 스트리밍 처리 단위 (DB 필터 → 분석 → 저장)
+REPLAY_MAX_WORKERS: int = CLAUDE_CONCURRENCY_MAX  # 청크 내 신호 분석 스레드 수
+
+# ── Analysis Checkpoint (pipeline/checkpoint.py) ──────────────────────────────
+ANALYSIS_CHECKPOINT_ENABLED: bool = os.getenv("ANALYSIS_CHECKPOINT_ENABLED", "true").lower() != "false"
+ANALYSIS_CHECKPOINT_DIR = CACHE_DIR / "analysis_checkpoint"  # 실행별 분석 결과 저널 (중단 후 재개)
+ANALYSIS_CHECKPOINT_FSYNC: bool = True      # 신호 1건 기록마다 fsync (프로세스·러너 강제 종료 대비)
+ANALYSIS_ARCHIVE_MICRO_BATCH: int = int(os.getenv("ANALYSIS_ARCHIVE_MICRO_BATCH", "25"))  # N건마다 DB 저장
+
+# ── Triage (pipeline/triage.py) ───────────────────────────────────────────────
+TRIAGE_ENABLED: bool = os.getenv("TRIAGE_ENABLED", "true").lower() != "false"
+TRIAGE_WEIGHTS: dict[str, float] = {"quality": 0.3, "relevance": 0.5, "novelty": 0.2}  # priority 가중치
+TRIAGE_FULL_MIN_PRIORITY: float = 0.55   # 이상 → full (전체 분석)
+TRIAGE_LITE_MIN_PRIORITY: float = 0.35   # 이상 → lite (간이 분석), 미만 → local (LLM 미사용)
+TRIAGE_NOVELTY_LOOKBACK_DAYS: int = 30   # novelty 비교 대상: 최근 N일 저장 신호 제목
+TRIAGE_NOVELTY_MAX_REFERENCES: int = 5000
+
+# ── Extractive Summarizer (pipeline/summarizer.py) ────────────────────────────
+SUMMARIZER_ENABLED: bool = os.getenv("SUMMARIZER_ENABLED", "true").lower() != "false"  # false → 본문 앞부분 자르기 (같은 예산)
+# 예산은 영문 본문 기준 토큰 (ASCII 4자 ≈ 1토큰). 한글 등 비 ASCII 본문은 본문별로 확대해 같은 글자 수 유지 (summarizer.script_budget)
+SUMMARIZER_SIGNAL_TOKENS: int = 160   # 신호 분석 입력 본문 (기존 앞 600자 → 약 640자)
+SUMMARIZER_LITE_TOKENS: int = 80      # triage lite 등급 (기존 앞 300자 → 약 320자)
+SUMMARIZER_REPORT_TOKENS: int = 130   # 리포트 입력 신호 본문 (기존 앞 500자 → 약 520자)
+
 # ── Quality Thresholds ────────────────────────────────────────────────────────
 MIN_QUALITY_SCORE: float = 0.5
 MIN_CONFIDENCE_SCORE: float = 0.3
@@ -1,8 +1,8 @@
-from .models import Base, MarketSignal, WeeklyReport
+from .models import Base, MarketSignal, WeeklyReport, SignalFingerprint, SignalDuplicate, LlmCallLedger
 from .init_db import init_db, get_engine, get_session
 try:
     from .models import MonthlyReport
 except ImportError:
     MonthlyReport = None  # type: ignore
 
-__all__ = ["Base", "MarketSignal", "WeeklyReport", "MonthlyReport", "init_db", "get_engine", "get_session"]
\ No newline at end of file
+__all__ = ["Base", "MarketSignal", "WeeklyReport", "MonthlyReport", "SignalFingerprint", "SignalDuplicate", "LlmCallLedger", "init_db", "get_engine", "get_session"]
\ No newline at end of file
@@ -162,4 +162,86 @@ class MonthlyReport(Base):
     __table_args__ = (
         Index("idx_month_start", "month_start"),
         Index("idx_month_key", "month_key"),
-    )
\ No newline at end of file
+    )
+
+
+class SignalFingerprint(Base):
+    """
+    "Already seen" index for collected signals (pipeline/seen_index.py)
+    Grain: 1 record per canonical URL — includes signals dropped by quality filter
+    """
+    __tablename__ = "signal_fingerprints"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url_hash = Column(String(64), unique=True, nullable=False)   # sha256(canonical URL)
+    content_hash = Column(String(64), nullable=False)            # sha256(title | date | publisher | body shingles), url_hash if no body
+    event_id = Column(String(36), nullable=True)
+
+    first_seen_at = Column(DateTime, default=datetime.utcnow)
+    last_seen_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_fp_content_hash", "content_hash"),
+    )
+
+
+class SignalDuplicate(Base):
+    """
+    Near-duplicate copies linked to a representative signal (pipeline/dedup.py cluster `duplicates`)
+    Grain: 1 record per canonical URL of a copy
+    """
+    __tablename__ = "signal_duplicates"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url_hash = Column(String(64), unique=True, nullable=False)   # sha256(canonical URL), same as signal_fingerprints
+    event_id = Column(String(36), nullable=False)                # representative MarketSignal.event_id
+    title = Column(Text, nullable=True)
+    url = Column(Text, nullable=False)
+    publisher = Column(String(200), nullable=True)
+    published_at = Column(String(40), nullable=True)             # as collected (ISO string)
+
+    linked_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_dup_event_id", "event_id"),
+    )
+
+
+class LlmCallLedger(Base):
+    """
+    Per-call Claude usage ledger (pipeline/llm_ledger.py)
+    Grain: 1 record per messages.create call — analysis, repair, weekly/monthly report
+    """
+    __tablename__ = "llm_call_ledger"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(String(36), nullable=False)
+    purpose = Column(
+        String(30), nullable=False,
+        comment="signal_analysis|signal_analysis_lite|packed_analysis|packed_retry|repair|weekly_report|monthly_report"
+                "|report_map|report_collapse"
+    )
+    model = Column(String(60), nullable=True)
+
+    # Tokens
+    input_tokens = Column(Integer, default=0)
+    output_tokens = Column(Integer, default=0)
+    cache_creation_input_tokens = Column(Integer, default=0)
+    cache_read_input_tokens = Column(Integer, default=0)
+
+    # Call outcome
+    latency_ms = Column(Integer, nullable=True)           # 재시도 대기 포함, Message Batch 는 NULL
+    retries = Column(Integer, default=0)
+    stop_reason = Column(String(30), nullable=True)       # end_turn|tool_use|max_tokens|...|error
+    signal_count = Column(Integer, default=0)             # 분석 대상 신호 수 (repair·리포트는 0)
+    cached = Column(Boolean, default=False)               # LLM 응답 캐시 적중 (과금 없음)
+    batch = Column(Boolean, default=False)                # Message Batches API (할인 과금)
+    cost_usd = Column(Float, default=0.0)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_ledger_run_id", "run_id"),
+        Index("idx_ledger_created_at", "created_at"),
+        Index("idx_ledger_purpose", "purpose"),
+    )
@@ -10,7 +10,7 @@ import pandas as pd
 from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
-from database.models import MarketSignal, WeeklyReport
+from database.models import LlmCallLedger, MarketSignal, SignalDuplicate, WeeklyReport
 try:
     from database.models import MonthlyReport
 except ImportError:
@@ -162,6 +162,115 @@ def get_news_feed_df(
     } for r in rows])
 
 
+# ── LLM call ledger (pipeline/llm_ledger.py) ─────────────────────────────────
+
+_REPORT_PURPOSES = ("weekly_report", "monthly_report", "report_map", "report_collapse")
+# signal_count = 분석 신호 수 (packed_retry 는 묶음 행에서 이미 센 신호의 재처리 → 분모 제외)
+_SIGNAL_PURPOSES = ("signal_analysis", "signal_analysis_lite", "packed_analysis")
+
+
+def get_llm_calls_df(session: Session, days_back: int = 90) -> pd.DataFrame:
+    """Claude call ledger rows (1 row per call) within the window."""
+    cutoff = datetime.utcnow() - timedelta(days=days_back)
+    rows = session.query(
+        LlmCallLedger.run_id, LlmCallLedger.purpose, LlmCallLedger.model,
+        LlmCallLedger.input_tokens, LlmCallLedger.output_tokens,
+        LlmCallLedger.cache_creation_input_tokens, LlmCallLedger.cache_read_input_tokens,
+        LlmCallLedger.latency_ms, LlmCallLedger.retries, LlmCallLedger.stop_reason,
+        LlmCallLedger.signal_count, LlmCallLedger.cached, LlmCallLedger.batch,
+        LlmCallLedger.cost_usd, LlmCallLedger.created_at,
+    ).filter(
+        LlmCallLedger.created_at >= cutoff
+    ).all()
+
+    columns = [
+        "run_id", "purpose", "model", "input_tokens", "output_tokens",
+        "cache_creation_input_tokens", "cache_read_input_tokens", "latency_ms", "retries",
+        "stop_reason", "signal_count", "cached", "batch", "cost_usd", "created_at",
+    ]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _llm_call_stats(df: pd.DataFrame) -> dict:
+    """
+    Ledger rows → cost / latency / truncation aggregates.
+    - cost_per_signal: all analysis-side cost (incl. repair, packed retries) / distinct signals analyzed by a
+      billed call — response-cache hits, failed calls and packed_retry singles (already counted on their
+      pack row) are excluded from the denominator; report calls excluded
+    - latency p50/p95: live API calls only (response-cache hits and Message Batch excluded)
+    - report_truncation_rate: share of weekly/monthly report responses with stop_reason == max_tokens
+    """
+    is_report = df["purpose"].isin(_REPORT_PURPOSES)
+    analyzed = df["purpose"].isin(_SIGNAL_PURPOSES) & ~df["cached"].astype(bool) & (df["stop_reason"] != "error")
+    signals = int(df.loc[analyzed, "signal_count"].sum())
+    analysis_cost = float(df.loc[~is_report, "cost_usd"].sum())
+    latency = df.loc[~df["cached"].astype(bool), "latency_ms"].dropna()
+    reports = df.loc[is_report & (df["stop_reason"] != "error"), "stop_reason"]
+    return {
+        "calls": len(df),
+        "cost_usd": round(float(df["cost_usd"].sum()), 4),
+        "signals": signals,
+        "cost_per_signal": round(analysis_cost / signals, 5) if signals else None,
+        "latency_p50_ms": float(latency.quantile(0.50)) if len(latency) else None,
+        "latency_p95_ms": float(latency.quantile(0.95)) if len(latency) else None,
+        "report_calls": len(reports),
+        "report_truncation_rate": float((reports == "max_tokens").mean()) if len(reports) else None,
+        "error_rate": float((df["stop_reason"] == "error").mean()) if len(df) else None,
+        "cache_hit_rate": float(df["cached"].astype(bool).mean()) if len(df) else None,
+    }
+
+
+def get_llm_cost_summary(session: Session, days_back: int = 7) -> dict:
+    """Claude cost, cost per signal, p50/p95 latency and report truncation rate for the window."""
+    df = get_llm_calls_df(session, days_back=days_back)
+    if df.empty:
+        return {}
+    return _llm_call_stats(df)
+
+
+def get_llm_weekly_costs(session: Session, weeks: int = 12) -> pd.DataFrame:
+    """Weekly Claude cost split into analysis / report, with cost per signal and latency percentiles."""
+    df = get_llm_calls_df(session, days_back=weeks * 7)
+    if df.empty:
+        return pd.DataFrame()
+
+    df["week"] = pd.to_datetime(df["created_at"]).dt.to_period("W").dt.start_time
+    df["kind"] = df["purpose"].isin(_REPORT_PURPOSES).map({True: "report", False: "analysis"})
+    rows = []
+    for week, group in df.groupby("week"):
+        stats = _llm_call_stats(group)
+        rows.append({
+            "week": week,
+            "analysis_cost_usd": float(group.loc[group["kind"] == "analysis", "cost_usd"].sum()),
+            "report_cost_usd": float(group.loc[group["kind"] == "report", "cost_usd"].sum()),
+            **stats,
+        })
+    return pd.DataFrame(rows)
+
+
+def get_llm_purpose_stats(session: Session, days_back: int = 28) -> pd.DataFrame:
+    """Per-purpose call count, cost, latency percentiles and truncation rate."""
+    df = get_llm_calls_df(session, days_back=days_back)
+    if df.empty:
+        return pd.DataFrame()
+
+    rows = []
+    for purpose, group in df.groupby("purpose"):
+        latency = group.loc[~group["cached"].astype(bool), "latency_ms"].dropna()
+        answered = group.loc[group["stop_reason"] != "error", "stop_reason"]
+        rows.append({
+            "purpose": purpose,
+            "calls": len(group),
+            "cost_usd": round(float(group["cost_usd"].sum()), 4),
+            "output_tokens": int(group["output_tokens"].sum()),
+            "latency_p50_ms": float(latency.quantile(0.50)) if len(latency) else None,
+            "latency_p95_ms": float(latency.quantile(0.95)) if len(latency) else None,
+            "retries": int(group["retries"].sum()),
+            "truncation_rate": float((answered == "max_tokens").mean()) if len(answered) else None,
+        })
+    return pd.DataFrame(rows).sort_values("cost_usd", ascending=False).reset_index(drop=True)
+
+
 def upsert_signal(session: Session, signal_data: dict) -> tuple[bool, str]:
     """
     Idempotent upsert by event_id.
@@ -188,4 +297,24 @@ def upsert_signal(session: Session, signal_data: dict) -> tuple[bool, str]:
             if hasattr(MarketSignal, k)
         })
         session.add(new_signal)
-        return True, event_id
\ No newline at end of file
+        return True, event_id
+
+
+def upsert_signal_duplicates(session: Session, event_id: str, links: list[dict]) -> int:
+    """
+    Store near-duplicate links of a representative signal, keyed by url_hash.
+    A copy already linked elsewhere is re-pointed to this representative.
+    links: [{"url_hash", "url", "title", "publisher", "published_at"}]
+    Returns: number of new links
+    """
+    added = 0
+    for link in links:
+        existing = session.query(SignalDuplicate).filter_by(url_hash=link["url_hash"]).first()
+        if existing:
+            existing.event_id = event_id
+            continue
+        session.add(SignalDuplicate(event_id=event_id, **link))
+        added += 1
+    if added:
+        session.flush()  # sessions do not autoflush — later links to the same copy in this batch must see the row
+    return added
@@ -0,0 +1,133 @@
+"""
+Analysis Schema - 신호 분석 결과의 tool-use 출력 계약 + 검증
+Claude 는 자유 텍스트 JSON 대신 tool_choice 로 강제된 도구 호출(input_schema)로 결과를 제출.
+CLAUDE_STRICT_TOOLS=True 이면 strict 모드로 서버 측 스키마 검증 (필수 필드·enum·타입 보장).
+
+클라이언트 검증 (validate_analysis):
+  strict 미적용 모델, max_tokens 잘림, 거부 응답 등에 대비해 필드별로 검증하고
+  유효한 필드는 살림 (부분 복구). summary / strategic_implication 이 없을 때만 repair 재요청 대상.
+"""
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import CLAUDE_STRICT_TOOLS
+
+CATEGORIES: list[str] = [
+    "Investment", "M&A", "PoC Deployment", "Partnership", "VLA Models",
+    "World Models", "Humanoid Locomotion", "Regulation", "Standard", "Industry News",
+]
+RELEVANCE_TYPES: list[str] = [
+    "Direct Impact", "Future Opportunity", "Competitive Threat", "Partnership Potential",
+]
+
+# 없으면 분석 결과로 쓸 수 없는 필드 → repair 재요청
+REPAIR_FIELDS: tuple[str, ...] = ("summary", "strategic_implication")
+
+_ANALYSIS_PROPERTIES: dict = {
+    "summary": {
+        "type": "string",
+        "description": "결론 우선 요약 (3-5문장, 한국어)",
+    },
+    "strategic_implication": {
+        "type": "string",
+        "description": "LGU+ 관점의 전략적 시사점과 권고 액션 (한국어)",
+    },
+    "key_insights": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "인사이트 3개 — 1: 기술 성숙도 평가, 2: 시장 타이밍, 3: 파트너십/사업 기회",
+    },
+    "category": {"type": "string", "enum": CATEGORIES},
+    "lgu_relevance_type": {"type": "string", "enum": RELEVANCE_TYPES},
+}
+_ANALYSIS_FIELDS = list(_ANALYSIS_PROPERTIES)
+
+
+def _tool(name: str, description: str, schema: dict) -> dict:
+    tool = {"name": name, "description": description, "input_schema": schema}
+    if CLAUDE_STRICT_TOOLS:
+        tool["strict"] = True
+    return tool
+
+
+ANALYSIS_TOOL: dict = _tool(
+    "record_signal_analysis",
+    "신호 1건의 전략 분석 결과를 기록합니다.",
+    {
+        "type": "object",
+        "properties": _ANALYSIS_PROPERTIES,
+        "required": _ANALYSIS_FIELDS,
+        "additionalProperties": False,
+    },
+)
+
+PACKED_ANALYSIS_TOOL: dict = _tool(
+    "record_signal_analyses",
+    "신호 목록의 신호별 전략 분석 결과를 기록합니다 (입력 신호마다 원소 1개).",
+    {
+        "type": "object",
+        "properties": {
+            "analyses": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "event_id": {"type": "string", "description": "입력 신호의 event_id 그대로"},
+                        **_ANALYSIS_PROPERTIES,
+                    },
+                    "required": ["event_id", *_ANALYSIS_FIELDS],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["analyses"],
+        "additionalProperties": False,
+    },
+)
+
+
+def tool_choice(tool: dict) -> dict:
+    return {"type": "tool", "name": tool["name"]}
+
+
+def tool_input(message: object, tool: dict) -> Optional[dict]:
+    """응답에서 해당 도구 호출 input 추출 (없으면 None)."""
+    for block in getattr(message, "content", None) or []:
+        if getattr(block, "type", "") == "tool_use" and block.name == tool["name"]:
+            return block.input if isinstance(block.input, dict) else None
+    return None
+
+
+def validate_analysis(data: object) -> tuple[dict, list[str]]:
+    """
+    필드별 검증 → (유효 필드만 담은 dict, 누락·오류 필드 목록).
+    key_insights 는 문자열 원소만 남김. 빈 summary·strategic_implication 은 오류.
+    """
+    if not isinstance(data, dict):
+        return {}, list(_ANALYSIS_FIELDS)
+
+    valid: dict = {}
+    for name in REPAIR_FIELDS:
+        value = data.get(name)
+        if isinstance(value, str) and value.strip():
+            valid[name] = value.strip()
+
+    insights = data.get("key_insights")
+    if isinstance(insights, list):
+        strings = [i.strip() for i in insights if isinstance(i, str) and i.strip()]
+        if strings:
+            valid["key_insights"] = strings
+
+    if data.get("category") in CATEGORIES:
+        valid["category"] = data["category"]
+    if data.get("lgu_relevance_type") in RELEVANCE_TYPES:
+        valid["lgu_relevance_type"] = data["lgu_relevance_type"]
+
+    return valid, [name for name in _ANALYSIS_FIELDS if name not in valid]
+
+
+def needs_repair(problems: list[str]) -> bool:
+    return any(name in REPAIR_FIELDS for name in problems)
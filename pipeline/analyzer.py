@@ -9,19 +9,47 @@ strategic-analysis SKILL.md 구현체
 """
 import json
 import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
 from config import (
-    ANTHROPIC_API_KEY, CLAUDE_MODEL,
+    ANTHROPIC_API_KEY, CLAUDE_MODEL, CLAUDE_CACHE_MIN_TOKENS,
     CLAUDE_MAX_TOKENS, CLAUDE_REPORT_MAX_TOKENS, PROCESSED_DIR,
+    CLAUDE_CONCURRENCY_INITIAL, CLAUDE_CONCURRENCY_MAX, CLAUDE_MAX_RETRIES,
+    CLAUDE_ANALYSIS_MODE, LLM_CACHE_ENABLED, CLAUDE_PACK_MAX_TOKENS,
+    CLAUDE_LITE_MODEL, CLAUDE_LITE_MAX_TOKENS, CLAUDE_REPAIR_ENABLED,
+    REPORT_INPUT_MODE, REPORT_MAP_MODEL, REPORT_MAP_MAX_TOKENS, REPORT_REDUCE_INPUT_TOKENS,
+    REPORT_GENERATION_MODE, REPORT_SECTION_MAX_TOKENS, REPORT_SECTION_MAX_ATTEMPTS,
+    SUMMARIZER_SIGNAL_TOKENS, SUMMARIZER_LITE_TOKENS, SUMMARIZER_REPORT_TOKENS,
+)
+from pipeline.analysis_schema import (
+    ANALYSIS_TOOL, PACKED_ANALYSIS_TOOL, needs_repair, tool_choice, tool_input, validate_analysis,
+)
+from pipeline.checkpoint import AnalysisCheckpoint
+from pipeline.dedup import event_id_for_url
+from pipeline.jsonl_sink import JsonlSink
+from pipeline.llm_cache import LlmResponseCache, request_key
+from pipeline.llm_ledger import CallLedger
+from pipeline.message_batch import BatchWaitTimeout, MessageBatchRunner
+from pipeline.ratelimit import AdaptiveConcurrencyLimiter
+from pipeline.report_mapreduce import (
+    COLLAPSED_BUCKET, PARTIAL_SUMMARY_TOOL, ReportPartialCache, SignalGroup,
+    collapse_digest, collapse_groups, collapsed_header, group_signals, local_partial, validate_partial,
+)
+from pipeline.report_sections import (
+    MONTHLY_SECTIONS, WEEKLY_SECTIONS, ReportSection,
+    SectionStreamSplitter, check_section, clean_report_html, placeholder, section_instruction,
 )
+from pipeline.signal_pack import PackPlanner, estimate_tokens, parse_packed_response
+from pipeline.summarizer import ExtractiveSummarizer
 try:
     from config import CLAUDE_MONTHLY_MAX_TOKENS
 except ImportError:
@@ -33,33 +61,58 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+
+def _retry_after(headers: object) -> Optional[float]:
+    try:
+        return float(headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+# 응답 캐시 키에 포함 — 응답 해석 방식(JSON 스키마 등)이 바뀌면 올려서 기존 캐시 무효화
+_PROMPT_VERSION = "v3"
+
 # Claude API 분석 프롬프트 (Business Korean, 피라미드 원칙)
-_SIGNAL_ANALYSIS_PROMPT = """당신은 LG유플러스 포트폴리오 전략팀의 Physical AI 시장 전략 분석가입니다.
-아래 Physical AI 관련 신호(signal)를 분석하여 정형화된 JSON을 반환하십시오.
+_ANALYSIS_ROLE = "당신은 LG유플러스 포트폴리오 전략팀의 Physical AI 시장 전략 분석가입니다."
 
-분석 원칙:
+_ANALYSIS_PRINCIPLES = """분석 원칙:
 1. 피라미드 원칙: 결론 → 근거 → 액션 순서로 작성
 2. LGU+ 관점: Direct Impact / Future Opportunity / Competitive Threat / Partnership Potential 중 가장 관련 있는 것 명시
 3. 결론 문장은 반드시 "LGU+ 관점:" 또는 구체적 시사점으로 시작
-4. Business Korean 사용 (기술 용어는 영어 유지)
-
-입력 신호:
-{signal_json}
-
-다음 JSON 형식으로만 응답하십시오 (다른 텍스트 없이):
-{{
-  "summary": "결론 우선 요약 (3-5문장, 한국어)",
-  "strategic_implication": "LGU+ 관점의 전략적 시사점과 권고 액션 (한국어)",
-  "key_insights": [
-    "인사이트 1: 기술 성숙도 평가",
-    "인사이트 2: 시장 타이밍",
-    "인사이트 3: 파트너십/사업 기회"
-  ],
-  "category": "Investment|M&A|PoC Deployment|Partnership|VLA Models|World Models|Humanoid Locomotion|Regulation|Standard|Industry News",
-  "lgu_relevance_type": "Direct Impact|Future Opportunity|Competitive Threat|Partnership Potential"
-}}"""
-
-_WEEKLY_REPORT_PROMPT = """당신은 LG유플러스 포트폴리오 전략팀의 Physical AI 수석 인텔리전스 분석가입니다.
+4. Business Korean 사용 (기술 용어는 영어 유지)"""
+
+# 신호 1건 분석 (실시간·Message Batch) — 결과는 ANALYSIS_TOOL 도구 호출로 제출
+_SIGNAL_ANALYSIS_SYSTEM = f"""{_ANALYSIS_ROLE}
+사용자 메시지의 Physical AI 관련 신호(signal)를 분석하여 {ANALYSIS_TOOL["name"]} 도구로 결과를 제출하십시오.
+
+{_ANALYSIS_PRINCIPLES}"""
+
+_SIGNAL_ANALYSIS_INPUT = """입력 신호:
+{signal_json}"""
+
+# triage lite 등급 간이 분석 — 같은 도구, 짧은 입력·출력
+_LITE_ANALYSIS_SYSTEM = f"""{_ANALYSIS_ROLE}
+사용자 메시지의 Physical AI 관련 신호(signal)를 간결하게 분석하여 {ANALYSIS_TOOL["name"]} 도구로 결과를 제출하십시오.
+
+{_ANALYSIS_PRINCIPLES}
+5. 간결성: summary 2문장, strategic_implication 1문장, key_insights 최대 2개"""
+
+# 신호 K건 묶음 분석 (packed 모드) — 원소별 event_id 로 입력과 대조
+_PACKED_ANALYSIS_SYSTEM = f"""{_ANALYSIS_ROLE}
+사용자 메시지의 Physical AI 관련 신호 목록을 신호별로 각각 독립 분석하여 {PACKED_ANALYSIS_TOOL["name"]} 도구로 제출하십시오.
+입력 신호마다 analyses 원소 1개, event_id 는 입력 값 그대로 복사하십시오.
+
+{_ANALYSIS_PRINCIPLES}
+5. 신호 간 내용을 섞지 말 것 — 각 원소는 해당 event_id 신호만 근거로 작성"""
+
+_PACKED_ANALYSIS_INPUT = """입력 신호 {count}건:
+{signals_json}"""
+
+# repair 재요청 — 검증 실패 필드를 tool_result 오류로 돌려줌
+_REPAIR_FEEDBACK = """검증 실패: {fields} 필드가 없거나 비어 있습니다.
+같은 신호에 대해 모든 필드를 채워 {tool} 도구로 다시 제출하십시오."""
+
+_WEEKLY_REPORT_SYSTEM = """당신은 LG유플러스 포트폴리오 전략팀의 Physical AI 수석 인텔리전스 분석가입니다.
 임원이 "5분 브리핑"으로 이번 주 Physical AI 시장 전체를 파악할 수 있는 HTML 보고서를 작성하십시오.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -79,9 +132,6 @@ _WEEKLY_REPORT_PROMPT = """당신은 LG유플러스 포트폴리오 전략팀의
 - 신호를 단순 제목 리스트로 나열 → 금지
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-[신호 데이터 — 이번 주 수집 {total}건 중 주요 신호]
-{signals_json}
-
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 [필수 HTML 구조 — 6개 섹션, 순서와 제목 그대로]
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -153,7 +203,7 @@ source_url이 있는 경우 기업명·논문명에 반드시 <a href="URL" targ
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"""
 
 
-_MONTHLY_REPORT_PROMPT = """당신은 LG유플러스 포트폴리오 전략팀의 Physical AI 수석 전략 파트너입니다.
+_MONTHLY_REPORT_SYSTEM = """당신은 LG유플러스 포트폴리오 전략팀의 Physical AI 수석 전략 파트너입니다.
 Bain & Company 스타일로 이번 달 Physical AI 시장 전체를 담은 HTML 월간 리포트를 작성하십시오.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -175,9 +225,6 @@ Bain & Company 스타일로 이번 달 Physical AI 시장 전체를 담은 HTML
 - 모호한 표현("검토 필요", "관심 권고") → 금지. 구체적 수치·기업명 필수.
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-[신호 데이터 — 이번 달 수집 {total}건 중 주요 신호]
-{signals_json}
-
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 [필수 HTML 구조 — 6개 섹션, 순서와 제목 그대로]
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -258,18 +305,114 @@ LGU+ 액션:
 source_url이 있는 경우 기업명·논문명에 반드시 <a href="URL" target="_blank">하이퍼링크</a> 삽입.
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"""
 
+# 리포트 사용자 메시지 (가변 부분) — 지침은 system 블록에서 캐시
+_WEEKLY_REPORT_INPUT = """[신호 데이터 — 이번 주 수집 {total}건 중 주요 신호]
+{signals_json}
+
+위 지침의 6개 섹션 HTML 구조 그대로 이번 주 브리핑을 작성하십시오."""
+
+_MONTHLY_REPORT_INPUT = """[신호 데이터 — 이번 달 수집 {total}건 중 주요 신호]
+{signals_json}
+
+위 지침의 6개 섹션 HTML 구조 그대로 이번 달 리포트를 작성하십시오."""
+
+# mapreduce 입력 — 전체 신호를 (주, 스코프, 기업) 묶음별로 요약한 부분 요약
+_REPORT_PARTIALS_NOTE = """각 묶음: iso_week / scope / company / signal_count(묶음 신호 수) / headline / key_facts(사실·source_url·published_at) / implication
+signal_count 는 비중 판단에만 사용 (통계 나열 금지). 하이퍼링크는 key_facts 의 source_url 을 사용."""
+
+_WEEKLY_REPORT_PARTIALS_INPUT = """[신호 데이터 — 이번 주 수집 {total}건 전체를 {count}개 묶음으로 요약]
+""" + _REPORT_PARTIALS_NOTE + """
+{signals_json}
+
+위 지침의 6개 섹션 HTML 구조 그대로 이번 주 브리핑을 작성하십시오."""
+
+_MONTHLY_REPORT_PARTIALS_INPUT = """[신호 데이터 — 이번 달 수집 {total}건 전체를 {count}개 묶음으로 요약]
+""" + _REPORT_PARTIALS_NOTE + """
+{signals_json}
+
+위 지침의 6개 섹션 HTML 구조 그대로 이번 달 리포트를 작성하십시오."""
+
+# 리포트 map 단계 — (주, 스코프, 기업) 신호 묶음 → 부분 요약
+_REPORT_DIGEST_PRINCIPLES = f"""요약 원칙:
+1. headline: 묶음 전체에서 가장 중요한 결론 1문장 (기업명·수치 포함)
+2. key_facts: 리포트에 인용할 가치가 있는 사실 최대 5개 — 각 사실의 source_url·published_at 은 입력 값 그대로 복사
+3. implication: LGU+ 관점 시사점 1~2문장
+4. 입력에 없는 사실 추가 금지. Business Korean 사용 (기술 용어는 영어 유지)
+결과는 {PARTIAL_SUMMARY_TOOL["name"]} 도구로 제출하십시오."""
+
+_REPORT_MAP_SYSTEM = f"""{_ANALYSIS_ROLE}
+사용자 메시지는 같은 주·스코프·기업으로 묶인 Physical AI 신호 목록입니다.
+주간·월간 전략 리포트의 근거 자료가 될 요약을 작성하십시오.
+
+{_REPORT_DIGEST_PRINCIPLES}"""
+
+_REPORT_COLLAPSE_SYSTEM = f"""{_ANALYSIS_ROLE}
+사용자 메시지는 같은 스코프·기업에 대한 주별 부분 요약 목록입니다.
+기간 전체를 아우르는 하나의 요약으로 통합하십시오 (주별 변화·추세가 있으면 headline 에 반영).
+
+{_REPORT_DIGEST_PRINCIPLES}"""
+
+_REPORT_DIGEST_INPUT = """[{label}]
+{items_json}"""
+
+
+class ReportIncomplete(Exception):
+    """리포트 스트림이 일부 조각을 내보낸 뒤 실패 — 이어 붙인 조각은 불완전하므로 저장하지 않음."""
+
+
+def _cache_min_tokens(model: str) -> int:
+    """가장 긴 접두어가 일치하는 prompt cache 최소 길이 (미등록 모델은 1024)."""
+    matches = [prefix for prefix in CLAUDE_CACHE_MIN_TOKENS if model.startswith(prefix)]
+    return CLAUDE_CACHE_MIN_TOKENS[max(matches, key=len)] if matches else 1024
+
+
+def _cached_system(text: str, model: str, tools: Optional[list[dict]] = None) -> list[dict]:
+    """
+    고정 지침 system 블록. 캐시 접두부는 tools → system 순이므로 도구 스키마 + 지침 합이
+    모델별 최소 길이(CLAUDE_CACHE_MIN_TOKENS) 이상일 때만 cache_control 부착.
+    신호 분석·packed·부분 요약 (도구 스키마 포함 약 0.5K 토큰) 은 미달 → 캐시 없이 정가, 리포트 지침만 캐시.
+    """
+    block = {"type": "text", "text": text}
+    prefix = estimate_tokens(text) + (estimate_tokens(json.dumps(tools, ensure_ascii=False)) if tools else 0)
+    if prefix >= _cache_min_tokens(model):
+        block["cache_control"] = {"type": "ephemeral"}
+    return [block]
+
 
 class StrategicAnalyzer:
     """Claude API 기반 전략 분석 에이전트."""
 
-    def __init__(self) -> None:
+    def __init__(self, run_id: Optional[str] = None) -> None:
+        """run_id: 호출 원장(llm_call_ledger) 실행 식별자 — 미지정 시 인스턴스마다 새 UUID."""
         self._client: Optional[object] = None
         self._available = bool(ANTHROPIC_API_KEY)
+        self._limiter = AdaptiveConcurrencyLimiter(
+            initial=CLAUDE_CONCURRENCY_INITIAL, maximum=CLAUDE_CONCURRENCY_MAX,
+        )
+
+        self._usage_lock = threading.Lock()
+        self.usage = {
+            "calls": 0, "input_tokens": 0, "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0, "output_tokens": 0,
+        }
+        self._pack_planner = PackPlanner()
+        self._summarizer = ExtractiveSummarizer()
+        self.pack_stats = {"packs": 0, "signals": 0, "fallback": 0}
+        self.parse_stats = {"ok": 0, "salvaged": 0, "repaired": 0, "failed": 0}
+        self._ledger = CallLedger(run_id)
+        self.run_id = self._ledger.run_id
+        self._cache: Optional[LlmResponseCache] = None
+        if self._available and LLM_CACHE_ENABLED:
+            try:
+                self._cache = LlmResponseCache()
+            except sqlite3.Error as e:
+                log.warning(f"LLM 응답 캐시 열기 실패, 캐시 없이 진행: {e}")
 
         if self._available:
             try:
                 import anthropic
-                self._client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+                # 재시도는 _call_claude 가 담당 (429/529 를 limiter 가 관측해야 함)
+                self._client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY, max_retries=0)
                 log.info(f"Claude API 연결 완료 (모델: {CLAUDE_MODEL})")
             except ImportError:
                 log.warning("anthropic 패키지 미설치. pip install anthropic")
@@ -277,243 +420,982 @@ class StrategicAnalyzer:
         else:
             log.warning("ANTHROPIC_API_KEY 미설정. 분석 없이 기본 메타데이터만 저장됩니다.")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=4, max=30),
-    )
-    def analyze_signal(self, signal: dict) -> dict:
+    def _call_claude(self, purpose: str, signal_count: int = 0, **kwargs: object) -> object:
         """
-        단일 신호를 Claude로 분석하여 summary, strategic_implication 추가.
-        API 키 미설정 시 fallback 처리.
+        모든 Claude 호출의 단일 진입점 (purpose·signal_count 는 호출 원장용, 나머지는 messages.create 인자 그대로).
+        LlmResponseCache 적중 시 API 호출 없이 반환, 미적중 시 응답 저장 (max_tokens 잘림 응답 제외).
+        AdaptiveConcurrencyLimiter 슬롯 안에서 호출하고 rate limit 헤더로 동시성 조절.
+        429/529 → 동시성 절반 + retry-after 대기, 기타 5xx·연결 오류 → 지수 백오프. 최대 CLAUDE_MAX_RETRIES 회.
+        성공·캐시 적중·최종 실패 모두 호출 1건으로 원장에 기록 (지연 = 시도별 응답 시간 + 백오프, 슬롯 대기 제외).
         """
-        if not self._available:
-            return self._fallback_analysis(signal)
+        import anthropic
+
+        key = self._cache_key(kwargs)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._ledger.record(
+                    purpose, cached.model, self._usage_counts(cached), latency=0.0,
+                    stop_reason=cached.stop_reason, signal_count=signal_count, cached=True,
+                )
+                return cached
+
+        elapsed = 0.0
+        attempt = 0
+        try:
+            for attempt in range(CLAUDE_MAX_RETRIES + 1):
+                backoff = 0.0
+                with self._limiter.slot():
+                    started = time.monotonic()
+                    try:
+                        raw = self._client.messages.with_raw_response.create(**kwargs)
+                        self._limiter.on_success(raw.headers)
+                        message = raw.parse()
+                        elapsed += time.monotonic() - started
+                        self._record_usage(
+                            message, purpose, elapsed, retries=attempt, signal_count=signal_count,
+                        )
+                        if key is not None and message.stop_reason != "max_tokens":
+                            self._cache.put(key, message)
+                        return message
+                    except anthropic.APIStatusError as e:
+                        elapsed += time.monotonic() - started
+                        if attempt >= CLAUDE_MAX_RETRIES:
+                            raise
+                        if e.status_code in (429, 529):
+                            self._limiter.on_overload(_retry_after(e.response.headers))
+                        elif e.status_code >= 500:
+                            backoff = min(2 ** attempt, 30)
+                        else:
+                            raise
+                    except anthropic.APIConnectionError:
+                        elapsed += time.monotonic() - started
+                        if attempt >= CLAUDE_MAX_RETRIES:
+                            raise
+                        backoff = min(2 ** attempt, 30)
+                log.warning(f"Claude API 재시도 {attempt + 1}/{CLAUDE_MAX_RETRIES}")
+                if backoff:
+                    time.sleep(backoff)
+                    elapsed += backoff
+        except Exception:
+            self._ledger.record(
+                purpose, str(kwargs.get("model", "")), latency=elapsed, retries=attempt,
+                stop_reason="error", signal_count=signal_count,
+            )
+            raise
 
+    def _stream_claude(self, purpose: str, signal_count: int = 0, **kwargs: object) -> Iterator[str]:
+        """
+        _call_claude 의 스트리밍판 (messages.stream) — 응답 텍스트 델타를 도착 순서대로 yield.
+        응답 캐시·동시성 슬롯·원장 기록은 _call_claude 와 같음 (캐시 적중은 전체 텍스트 1조각).
+        재시도는 첫 델타 수신 전 오류만 — 이미 내보낸 텍스트는 되돌릴 수 없으므로 이후 오류는 그대로 raise.
+        지연은 스트림 시작~종료 (소비 측 처리 시간 포함).
+        """
+        import anthropic
+
+        key = self._cache_key(kwargs)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._ledger.record(
+                    purpose, cached.model, self._usage_counts(cached), latency=0.0,
+                    stop_reason=cached.stop_reason, signal_count=signal_count, cached=True,
+                )
+                yield "".join(getattr(b, "text", "") for b in cached.content)
+                return
+
+        elapsed = 0.0
+        attempt = 0
+        emitted = False
         try:
-            import anthropic
+            for attempt in range(CLAUDE_MAX_RETRIES + 1):
+                backoff = 0.0
+                with self._limiter.slot():
+                    started = time.monotonic()
+                    try:
+                        with self._client.messages.stream(**kwargs) as stream:
+                            self._limiter.on_success(stream.response.headers)
+                            for text in stream.text_stream:
+                                emitted = True
+                                yield text
+                            message = stream.get_final_message()
+                        elapsed += time.monotonic() - started
+                        self._record_usage(
+                            message, purpose, elapsed, retries=attempt, signal_count=signal_count,
+                        )
+                        if key is not None and message.stop_reason != "max_tokens":
+                            self._cache.put(key, message)
+                        return
+                    except anthropic.APIStatusError as e:
+                        elapsed += time.monotonic() - started
+                        if emitted or attempt >= CLAUDE_MAX_RETRIES:
+                            raise
+                        if e.status_code in (429, 529):
+                            self._limiter.on_overload(_retry_after(e.response.headers))
+                        elif e.status_code >= 500:
+                            backoff = min(2 ** attempt, 30)
+                        else:
+                            raise
+                    except anthropic.APIConnectionError:
+                        elapsed += time.monotonic() - started
+                        if emitted or attempt >= CLAUDE_MAX_RETRIES:
+                            raise
+                        backoff = min(2 ** attempt, 30)
+                log.warning(f"Claude API 스트리밍 재시도 {attempt + 1}/{CLAUDE_MAX_RETRIES}")
+                if backoff:
+                    time.sleep(backoff)
+                    elapsed += backoff
+        except Exception:
+            self._ledger.record(
+                purpose, str(kwargs.get("model", "")), latency=elapsed, retries=attempt,
+                stop_reason="error", signal_count=signal_count,
+            )
+            raise
+
+    @staticmethod
+    def _usage_counts(message: object) -> dict[str, int]:
+        usage = message.usage
+        return {
+            "input_tokens": usage.input_tokens or 0,
+            "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None) or 0,
+            "output_tokens": usage.output_tokens or 0,
+        }
+
+    def _record_usage(
+        self,
+        message: object,
+        purpose: str,
+        elapsed: Optional[float] = None,
+        retries: int = 0,
+        signal_count: int = 0,
+        batch: bool = False,
+    ) -> None:
+        """
+        토큰 사용량 집계 + 호출별 로그 + 원장 기록. prompt caching 효과 확인용:
+        cache_creation(캐시 기록, 1.25배 과금) / cache_read(캐시 적중, 0.1배 과금) / 일반 input.
+        """
+        counts = self._usage_counts(message)
+        with self._usage_lock:
+            self.usage["calls"] += 1
+            for name, value in counts.items():
+                self.usage[name] += value
+        self._ledger.record(
+            purpose, message.model, counts, latency=elapsed, retries=retries,
+            stop_reason=message.stop_reason, signal_count=signal_count, batch=batch,
+        )
+        latency = f"{elapsed:.1f}s" if elapsed is not None else "batch"
+        log.debug(
+            f"Claude 사용량 ({purpose}, {message.model}, {latency}): input={counts['input_tokens']}, "
+            f"cache_write={counts['cache_creation_input_tokens']}, cache_read={counts['cache_read_input_tokens']}, "
+            f"output={counts['output_tokens']}"
+        )
+
+    def usage_summary(self) -> str:
+        u = self.usage
+        prompt_total = u["input_tokens"] + u["cache_creation_input_tokens"] + u["cache_read_input_tokens"]
+        read_ratio = u["cache_read_input_tokens"] / prompt_total if prompt_total else 0.0
+        return (
+            f"호출 {u['calls']}회, input {u['input_tokens']} + cache_write {u['cache_creation_input_tokens']} "
+            f"+ cache_read {u['cache_read_input_tokens']} (프롬프트 캐시 적중 {read_ratio:.0%}), "
+            f"output {u['output_tokens']}"
+        )
+
+    def _cache_key(self, params: dict) -> Optional[str]:
+        return request_key(params, _PROMPT_VERSION) if self._cache is not None else None
+
+    @staticmethod
+    def _is_lite(signal: dict) -> bool:
+        return signal.get("triage", {}).get("tier") == "lite"
 
-            signal_json = json.dumps(
+    @classmethod
+    def _analysis_purpose(cls, signal: dict) -> str:
+        return "signal_analysis_lite" if cls._is_lite(signal) else "signal_analysis"
+
+    @classmethod
+    def _content_budget(cls, signal: dict) -> int:
+        return SUMMARIZER_LITE_TOKENS if cls._is_lite(signal) else SUMMARIZER_SIGNAL_TOKENS
+
+    def _prime_contents(self, signals: list[dict]) -> None:
+        """배치 본문을 토큰 예산별로 한 번에 추출 요약 (문장 점수 벡터 연산) → 요청 구성 시 메모 조회."""
+        by_budget: dict[int, list[str]] = {}
+        for signal in signals:
+            by_budget.setdefault(self._content_budget(signal), []).append(signal.get("raw_content", ""))
+        for budget, texts in by_budget.items():
+            self._summarizer.prime(texts, budget)
+
+    def _signal_payload(self, signal: dict) -> dict:
+        """
+        분석 입력 필드 (수집 시점 값 제외 → 응답 캐시 키 안정).
+        본문은 토큰 예산(SUMMARIZER_SIGNAL_TOKENS, lite 등급 SUMMARIZER_LITE_TOKENS) 내 핵심 문장.
+        """
+        return {
+            "title": signal.get("title", ""),
+            "raw_content": self._summarizer.summarize(signal.get("raw_content", ""), self._content_budget(signal)),
+            "scope": signal.get("scope", ""),
+            "publisher": signal.get("source_metadata", {}).get("publisher", ""),
+            "published_at": signal.get("source_metadata", {}).get("published_at", ""),
+        }
+
+    def _analysis_request(self, signal: dict) -> dict:
+        """
+        신호 1건 분석용 messages.create 파라미터 (실시간 호출·Message Batch 공용).
+        triage lite 등급은 CLAUDE_LITE_MODEL + 간이 지침 + 짧은 출력 상한.
+        """
+        signal_json = json.dumps(self._signal_payload(signal), ensure_ascii=False)
+        lite = self._is_lite(signal)
+        return {
+            "model": CLAUDE_LITE_MODEL if lite else CLAUDE_ANALYSIS_MODEL,
+            "max_tokens": CLAUDE_LITE_MAX_TOKENS if lite else CLAUDE_MAX_TOKENS,
+            "system": _cached_system(
+                _LITE_ANALYSIS_SYSTEM if lite else _SIGNAL_ANALYSIS_SYSTEM,
+                CLAUDE_LITE_MODEL if lite else CLAUDE_ANALYSIS_MODEL, [ANALYSIS_TOOL],
+            ),
+            "tools": [ANALYSIS_TOOL],
+            "tool_choice": tool_choice(ANALYSIS_TOOL),
+            "messages": [
                 {
-                    "title": signal.get("title", ""),
-                    "raw_content": signal.get("raw_content", "")[:600],
-                    "scope": signal.get("scope", ""),
-                    "publisher": signal.get("source_metadata", {}).get("publisher", ""),
-                    "published_at": signal.get("source_metadata", {}).get("published_at", ""),
-                },
-                ensure_ascii=False,
-            )
+                    "role": "user",
+                    "content": _SIGNAL_ANALYSIS_INPUT.format(signal_json=signal_json),
+                }
+            ],
+        }
+
+    def _packed_request(self, items: list[str]) -> dict:
+        """신호 K건 묶음 분석용 messages.create 파라미터. items: 신호별 JSON (event_id 포함)."""
+        return {
+            "model": CLAUDE_ANALYSIS_MODEL,
+            "max_tokens": CLAUDE_PACK_MAX_TOKENS,
+            "system": _cached_system(_PACKED_ANALYSIS_SYSTEM, CLAUDE_ANALYSIS_MODEL, [PACKED_ANALYSIS_TOOL]),
+            "tools": [PACKED_ANALYSIS_TOOL],
+            "tool_choice": tool_choice(PACKED_ANALYSIS_TOOL),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": _PACKED_ANALYSIS_INPUT.format(
+                        count=len(items), signals_json="[\n" + ",\n".join(items) + "\n]",
+                    ),
+                }
+            ],
+        }
 
-            message = self._client.messages.create(
-                model=CLAUDE_ANALYSIS_MODEL,
-                max_tokens=CLAUDE_MAX_TOKENS,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": _SIGNAL_ANALYSIS_PROMPT.format(signal_json=signal_json),
-                    }
-                ],
-            )
+    def _apply_analysis(self, signal: dict, message: object, params: Optional[dict] = None) -> dict:
+        """
+        ANALYSIS_TOOL 도구 input 을 필드별 검증 후 신호에 병합.
+          - 전 필드 유효: 그대로 병합
+          - 부가 필드(key_insights·category·lgu_relevance_type)만 오류: 유효 필드만 병합 (부분 복구)
+          - summary·strategic_implication 누락: params 가 있으면 검증 오류를 돌려주고 1회 repair 재요청
+          - repair 후에도 누락: 살린 필드 + fallback 기본값, 캐시에서 원 응답 제거
+        """
+        fields, problems = validate_analysis(tool_input(message, ANALYSIS_TOOL))
+        outcome = "ok" if not problems else "salvaged"
+
+        if needs_repair(problems) and params is not None and CLAUDE_REPAIR_ENABLED and self._available:
+            repaired = self._repair_analysis(params, message, problems)
+            if repaired is not None:
+                repaired_fields, _ = validate_analysis(tool_input(repaired, ANALYSIS_TOOL))
+                fields = {**repaired_fields, **fields}  # 1차 유효 필드 우선, 누락분만 보충
+                problems = [name for name in problems if name not in fields]
+                outcome = "repaired"
+
+        if needs_repair(problems):
+            outcome = "failed"
+            log.warning(f"분석 결과 필수 필드 누락 {problems} (event_id={signal.get('event_id')}). Fallback 처리.")
+            key = self._cache_key(params) if params is not None else None
+            if key is not None:
+                self._cache.delete(key)
+            signal.update(fields)
+            self._count_parse(outcome)
+            return self._fallback_analysis(signal)
+
+        self._count_parse(outcome)
+        model = getattr(message, "model", None) or (params or {}).get("model") or CLAUDE_ANALYSIS_MODEL
+        return self._merge_analysis(signal, fields, model)
+
+    def _repair_analysis(self, params: dict, message: object, problems: list[str]) -> Optional[object]:
+        """
+        1차 응답에 대한 targeted repair 재요청.
+        max_tokens 잘림 → 출력 상한 2배로 동일 요청 재시도,
+        그 외 → 1차 도구 호출에 검증 오류 tool_result 를 붙여 누락 필드 재제출 요청.
+        """
+        if message.stop_reason == "max_tokens":
+            retry_params = {**params, "max_tokens": params["max_tokens"] * 2}
+        else:
+            tool_use = next((b for b in message.content if getattr(b, "type", "") == "tool_use"), None)
+            feedback = _REPAIR_FEEDBACK.format(fields=", ".join(problems), tool=ANALYSIS_TOOL["name"])
+            if tool_use is not None:
+                turns = [
+                    {"role": "assistant", "content": [tool_use.model_dump(include={"type", "id", "name", "input"})]},
+                    {"role": "user", "content": [
+                        {"type": "tool_result", "tool_use_id": tool_use.id, "is_error": True, "content": feedback},
+                    ]},
+                ]
+            else:
+                text = "".join(getattr(b, "text", "") for b in message.content).strip() or "(응답 없음)"
+                turns = [
+                    {"role": "assistant", "content": text},
+                    {"role": "user", "content": feedback},
+                ]
+            retry_params = {**params, "messages": params["messages"] + turns}
+        try:
+            return self._call_claude(purpose="repair", **retry_params)
+        except Exception as e:
+            log.warning(f"분석 repair 재요청 실패: {e}")
+            return None
+
+    def _count_parse(self, outcome: str) -> None:
+        with self._usage_lock:
+            self.parse_stats[outcome] += 1
+
+    @property
+    def parse_failure_rate(self) -> float:
+        """최종 fallback 처리된 응답 비율 (repair 후에도 필수 필드 누락)."""
+        total = sum(self.parse_stats.values())
+        return self.parse_stats["failed"] / total if total else 0.0
+
+    def parse_summary(self) -> str:
+        p = self.parse_stats
+        total = sum(p.values())
+        first_pass = (total - p["ok"]) / total if total else 0.0
+        return (
+            f"응답 {total}건: 정상 {p['ok']} / 부분 복구 {p['salvaged']} / repair {p['repaired']} / "
+            f"실패 {p['failed']} (1차 검증 실패율 {first_pass:.1%}, 최종 실패율 {self.parse_failure_rate:.1%})"
+        )
 
-            content = message.content[0].text.strip()
-            # JSON 파싱 (마크다운 펜스 제거 방어 처리)
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            parsed = json.loads(content)
-
-            signal["summary"] = parsed.get("summary", "")
-            signal["strategic_implication"] = parsed.get("strategic_implication", "")
-            signal["key_insights"] = parsed.get("key_insights", [])
-            signal["category"] = parsed.get("category", signal.get("category", ""))
-            signal["lgu_relevance_type"] = parsed.get("lgu_relevance_type", "")
-            signal["analyzed_by"] = CLAUDE_MODEL
-
-        except json.JSONDecodeError as e:
-            log.warning(f"Claude 응답 JSON 파싱 실패: {e}. Fallback 처리.")
+    @staticmethod
+    def _merge_analysis(signal: dict, parsed: dict, model: str) -> dict:
+        """검증된 분석 필드 병합. model: 실제 응답 모델 (lite 등급은 CLAUDE_LITE_MODEL) → analyzed_by."""
+        signal["summary"] = parsed.get("summary", "")
+        signal["strategic_implication"] = parsed.get("strategic_implication", "")
+        signal["key_insights"] = parsed.get("key_insights", [])
+        signal["category"] = parsed.get("category", signal.get("category", ""))
+        signal["lgu_relevance_type"] = parsed.get("lgu_relevance_type", "")
+        signal["analyzed_by"] = model
+        return signal
+
+    def analyze_signal(self, signal: dict, purpose: Optional[str] = None) -> dict:
+        """
+        단일 신호를 Claude로 분석하여 summary, strategic_implication 추가.
+        API 키 미설정 시 fallback 처리. 전송 오류 재시도는 _call_claude, 응답 검증·repair 는 _apply_analysis 담당.
+        purpose: 원장 용도 (기본: 등급별 signal_analysis / signal_analysis_lite, 묶음 누락분 재처리는 packed_retry)
+        """
+        if not self._available:
             return self._fallback_analysis(signal)
+
+        params = self._analysis_request(signal)
+        try:
+            message = self._call_claude(purpose=purpose or self._analysis_purpose(signal), signal_count=1, **params)
         except Exception as e:
             log.error(f"Claude API 호출 오류: {e}")
             return self._fallback_analysis(signal)
 
-        return signal
+        return self._apply_analysis(signal, message, params)
 
     def analyze_batch(
         self,
         signals: list[dict],
         save_processed: bool = True,
+        max_workers: int = CLAUDE_CONCURRENCY_MAX,
+        mode: str = CLAUDE_ANALYSIS_MODE,
+        checkpoint: Optional[AnalysisCheckpoint] = None,
     ) -> list[dict]:
         """
-        신호 배치 분석. 처리된 데이터를 data/processed/에 저장.
+        신호 배치 분석. 분석 결과는 생성 즉시 1건씩 data/processed/*_analyzed.jsonl.gz 에 기록 (flush_every=1).
+        checkpoint 지정 시 결과 1건마다 분석 저널 기록 + 마이크로 배치 DB 저장 (pipeline/checkpoint.py).
+
+        mode="realtime": max_workers 스레드로 병렬 분석 — 실제 동시 호출 수는 AdaptiveConcurrencyLimiter 가 조절.
+                         결과·기록 순서는 입력 순서 유지, 신호별 실패 시 해당 신호만 fallback.
+        mode="packed":   full 등급 신호 K건을 요청 1회로 묶어 분석 (K 는 토큰 예산 기반 자동 조절, pipeline/signal_pack.py).
+                         triage lite 등급은 단건 lite 요청. 누락·형식 오류 원소만 단건 재분석. 결과 순서는 입력 순서 유지.
+        mode="batch":    Message Batches API 로 일괄 제출 후 폴링 (비용 50%, 지연 최대 24시간).
+                         이전 실행의 미완료 배치를 먼저 재개해 결과를 함께 반환 (재개분 → 신규분 순서).
         """
-        log.info(f"=== 배치 분석 시작: {len(signals)}건 ===")
+        log.info(f"=== 배치 분석 시작: {len(signals)}건 (mode={mode}) ===")
         analyzed: list[dict] = []
+        # 분석 결과는 비용 지불분 → 버퍼 없이 1건마다 압축 멤버로 기록 (중단 시 이미 받은 결과 유실 없음)
+        sink = JsonlSink(PROCESSED_DIR, "analyzed", flush_every=1) if save_processed else None
 
-        for i, signal in enumerate(signals):
-            try:
-                result = self.analyze_signal(signal)
-                analyzed.append(result)
+        if self._available:
+            self._prime_contents(signals)
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        try:
+            if mode == "batch" and self._available:
+                results = self._analyze_via_message_batch(signals, executor)
+            elif mode == "packed" and self._available:
+                results = self._analyze_packed(signals, executor, max_workers)
+            else:
+                results = self._analyze_realtime(signals, executor)
+            for i, result in enumerate(results):
                 if (i + 1) % 10 == 0:
                     log.info(f"진행률: {i+1}/{len(signals)}")
-            except Exception as e:
-                log.error(f"신호 분석 오류 (event_id={signal.get('event_id')}): {e}")
-                analyzed.append(self._fallback_analysis(signal))
+                analyzed.append(result)
+                if sink is not None:
+                    sink.write(result)
+                if checkpoint is not None:
+                    checkpoint.record(result)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            if sink is not None:
+                sink.close()
+            self._ledger.flush()
 
         log.info(f"=== 배치 분석 완료: {len(analyzed)}건 ===")
+        if self._cache is not None:
+            log.info(f"LLM 응답 캐시: {self._cache.summary()}")
+        if self.usage["calls"]:
+            log.info(f"Claude 토큰 사용량: {self.usage_summary()}")
+        if self._summarizer.stats["texts"]:
+            log.info(f"분석 입력 본문: {self._summarizer.summary()}")
+        if sum(self.parse_stats.values()):
+            log.info(f"분석 응답 검증: {self.parse_summary()}")
+        if self.pack_stats["packs"]:
+            p = self.pack_stats
+            log.info(
+                f"묶음 분석: 요청 {p['packs']}회 / 신호 {p['signals']}건 "
+                f"(평균 K={p['signals'] / p['packs']:.1f}), 단건 재처리 {p['fallback']}건"
+            )
+        return analyzed
 
-        if save_processed and analyzed:
-            self._save_processed(analyzed)
+    def _analyze_one(self, signal: dict, purpose: Optional[str] = None) -> dict:
+        try:
+            return self.analyze_signal(signal, purpose)
+        except Exception as e:
+            log.error(f"신호 분석 오류 (event_id={signal.get('event_id')}): {e}")
+            return self._fallback_analysis(signal)
 
-        return analyzed
+    def _analyze_realtime(self, signals: list[dict], executor: Optional[ThreadPoolExecutor]) -> Iterator[dict]:
+        return executor.map(self._analyze_one, signals) if executor else map(self._analyze_one, signals)
 
-    def generate_weekly_report(self, signals: list[dict]) -> str:
+    def _analyze_packed(
+        self, signals: list[dict], executor: Optional[ThreadPoolExecutor], wave_size: int,
+    ) -> Iterator[dict]:
         """
-        주간 전략 브리핑 HTML 리포트 생성.
-        API 미설정 시 기본 HTML 반환.
+        full 등급 신호를 토큰 예산 기반 K건 묶음으로 분석 (입력 순서 유지).
+        triage lite 등급은 묶지 않고 단건 lite 요청 (CLAUDE_LITE_MODEL·간이 지침·짧은 출력 상한).
+        묶음을 wave_size 개씩 동시 실행 → 앞 웨이브의 실제 출력량으로 다음 웨이브 K 재산정.
         """
-        if not self._available or not signals:
-            return self._fallback_weekly_report(signals)
-
-        # 신뢰도 기준 정렬 후 스코프별 상위 신호 선택 (각 5건씩, 최대 20건)
-        # 8192 토큰 출력 한도 내 6개 섹션 완성을 위해 입력 신호 수 최적화
-        def _sort_key(s: dict) -> float:
-            return float(s.get("confidence_score") or s.get("data_quality_score") or 0.5)
+        for signal in signals:
+            if not signal.get("event_id"):
+                signal["event_id"] = event_id_for_url(signal.get("source_metadata", {}).get("url", ""))
+        full_ids = [i for i, s in enumerate(signals) if not self._is_lite(s)]
+        lite_ids = [i for i, s in enumerate(signals) if self._is_lite(s)]
+        items = [
+            (s["event_id"], json.dumps({"event_id": s["event_id"], **self._signal_payload(s)}, ensure_ascii=False))
+            for s in (signals[i] for i in full_ids)
+        ]
+
+        done: dict[int, dict] = {}
+        next_out = full_pos = lite_pos = 0
+        while full_pos < len(full_ids) or lite_pos < len(lite_ids):
+            wave: list[tuple[list[int], list[str]]] = []  # (입력 위치, 신호 JSON) — lite 는 1건 단건 요청
+            while (full_pos < len(full_ids) or lite_pos < len(lite_ids)) and len(wave) < max(wave_size, 1):
+                if full_pos < len(full_ids) and (lite_pos == len(lite_ids) or full_ids[full_pos] < lite_ids[lite_pos]):
+                    count = self._pack_planner.next_pack(items, full_pos)
+                    wave.append((
+                        full_ids[full_pos:full_pos + count],
+                        [payload for _, payload in items[full_pos:full_pos + count]],
+                    ))
+                    full_pos += count
+                else:
+                    wave.append(([lite_ids[lite_pos]], []))
+                    lite_pos += 1
+            runner = executor.map if executor else map
+            packs = [([signals[i] for i in ids], payloads) for ids, payloads in wave]
+            for (ids, _), results in zip(wave, runner(lambda pack: self._analyze_pack(*pack), packs)):
+                done.update(zip(ids, results))
+            while next_out in done:
+                yield done.pop(next_out)
+                next_out += 1
+
+    def _analyze_pack(self, pack: list[dict], payloads: list[str]) -> list[dict]:
+        """
+        묶음 1건 분석 (1건이면 단건 요청 — lite 등급 포함). 응답 배열의 event_id 별로 병합하고,
+        누락·형식 오류 원소(또는 호출 실패 시 전체)만 단건 분석으로 재처리.
+        """
+        if len(pack) == 1:
+            return [self._analyze_one(pack[0])]
 
-        top_signals = []
-        for scope in ["Market", "Tech", "Case", "Policy"]:
-            scope_sigs = sorted(
-                [s for s in signals if s.get("scope") == scope],
-                key=_sort_key,
-                reverse=True,
-            )
-            top_signals.extend(scope_sigs[:5])
+        params = self._packed_request(payloads)
+        try:
+            message = self._call_claude(purpose="packed_analysis", signal_count=len(pack), **params)
+        except Exception as e:
+            log.error(f"묶음 분석 호출 오류 ({len(pack)}건) — 단건 분석으로 재처리: {e}")
+            return [self._analyze_one(signal) for signal in pack]
 
-        signals_summary = json.dumps(
-            [
-                {
-                    "scope": s.get("scope"),
-                    "category": s.get("category"),
-                    "title": s.get("title", ""),
-                    "content": (
-                        s.get("summary")
-                        or s.get("raw_content", "")
-                    )[:500],
-                    "strategic_implication": s.get("strategic_implication", ""),
-                    "key_insights": s.get("key_insights", []),
-                    "publisher": (
-                        s.get("publisher")
-                        or s.get("source_metadata", {}).get("publisher", "")
-                    ),
-                    "source_url": s.get("source_url") or s.get("source_metadata", {}).get("url", ""),
-                    "published_at": str(
-                        s.get("published_at")
-                        or s.get("source_metadata", {}).get("published_at", "")
-                    )[:10],
-                    "confidence": round(_sort_key(s), 2),
-                }
-                for s in top_signals
-            ],
-            ensure_ascii=False,
+        parsed, retry_ids = parse_packed_response(
+            tool_input(message, PACKED_ANALYSIS_TOOL), [s["event_id"] for s in pack],
         )
+        truncated = message.stop_reason == "max_tokens"
+        self._pack_planner.observe(len(pack), message.usage.output_tokens or 0, truncated)
+        with self._usage_lock:
+            self.pack_stats["packs"] += 1
+            self.pack_stats["signals"] += len(pack)
+            self.pack_stats["fallback"] += len(retry_ids)
+        for fields in parsed.values():
+            self._count_parse("ok" if len(fields) == len(ANALYSIS_TOOL["input_schema"]["required"]) else "salvaged")
+
+        if retry_ids:
+            log.warning(
+                f"묶음 응답 {len(pack)}건 중 {len(retry_ids)}건 누락·형식 오류"
+                f"{' (max_tokens 잘림)' if truncated else ''} → 단건 재분석"
+            )
+            key = self._cache_key(params)
+            if key is not None and not parsed:
+                self._cache.delete(key)  # 전체 실패 응답은 재사용하지 않음 (부분 실패는 캐시 유지 → 재처리분만 단건 캐시)
+        # 재처리 단건은 packed_retry — 묶음 행에서 이미 센 신호라 신호당 비용 분모에서 제외
+        return [
+            self._merge_analysis(signal, parsed[signal["event_id"]], message.model or CLAUDE_ANALYSIS_MODEL)
+            if signal["event_id"] in parsed else self._analyze_one(signal, "packed_retry")
+            for signal in pack
+        ]
+
+    def _analyze_via_message_batch(
+        self, signals: list[dict], executor: Optional[ThreadPoolExecutor],
+    ) -> Iterator[dict]:
+        runner = MessageBatchRunner(self._client.with_options(max_retries=CLAUDE_MAX_RETRIES))
+
+        # 1. 이전 실행에서 제출된 미완료 배치 재개
+        #    제출된 신호는 완료 여부와 무관하게 신규 제출에서 제외 (대기 시간 초과 배치 신호를 다시 제출해 이중 과금 방지)
+        in_flight: set[str] = set()
+        for batch_id in runner.pending_batch_ids():
+            log.info(f"미완료 Message Batch 재개: {batch_id}")
+            in_flight.update(runner.load_signals(batch_id))
+            yield from self._collect_message_batch(runner, batch_id, executor)
+
+        # 2. 신규 제출 (custom_id = event_id, 미완료 배치 제출분·중복 event_id 제외)
+        pending: dict[str, dict] = {}
+        for signal in signals:
+            if not signal.get("event_id"):
+                signal["event_id"] = event_id_for_url(signal.get("source_metadata", {}).get("url", ""))
+            event_id = signal["event_id"]
+            if event_id in in_flight or event_id in pending:
+                continue
+            params = self._analysis_request(signal)
+            key = self._cache_key(params)
+            cached = self._cache.get(key) if key is not None else None
+            if cached is not None:
+                self._ledger.record(
+                    self._analysis_purpose(signal), cached.model, self._usage_counts(cached), latency=0.0,
+                    stop_reason=cached.stop_reason, signal_count=1, cached=True,
+                )
+                yield self._apply_analysis(signal, cached, params)
+                continue
+            pending[event_id] = signal
+        if not pending:
+            return
 
         try:
-            message = self._client.messages.create(
-                model=CLAUDE_MODEL,
-                max_tokens=CLAUDE_REPORT_MAX_TOKENS,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": _WEEKLY_REPORT_PROMPT.format(
-                            total=len(signals),
-                            signals_json=signals_summary,
-                        ),
-                    }
-                ],
+            batch_id = runner.submit(
+                [(event_id, self._analysis_request(signal)) for event_id, signal in pending.items()],
+                pending,
             )
-            html = message.content[0].text.strip()
-            if html.startswith("```"):
-                html = html.split("```")[1]
-                if html.startswith("html"):
-                    html = html[4:]
-            return html
-
         except Exception as e:
-            log.error(f"주간 리포트 생성 오류: {e}")
-            return self._fallback_weekly_report(signals)
+            log.error(f"Message Batch 제출 실패 — 실시간 분석으로 전환: {e}")
+            yield from self._analyze_realtime(list(pending.values()), executor)
+            return
+        yield from self._collect_message_batch(runner, batch_id, executor)
 
-    def generate_monthly_report(self, signals: list[dict]) -> str:
+    def _collect_message_batch(
+        self, runner: MessageBatchRunner, batch_id: str, executor: Optional[ThreadPoolExecutor],
+    ) -> list[dict]:
         """
-        월간 전략 브리핑 HTML 리포트 생성 (Bain 스타일).
-        API 미설정 시 기본 HTML 반환.
+        배치 결과를 제출 신호에 event_id 로 병합 (제출 순서).
+        errored/expired 신호는 실시간 호출로 재분석. 대기 시간 초과 시 빈 목록 (다음 실행에서 재개).
         """
-        if not self._available or not signals:
-            return self._fallback_monthly_report(signals)
-
-        # 신뢰도 기준 정렬 후 스코프별 상위 신호 선택 (각 7건씩, 최대 28건)
-        def _sort_key(s: dict) -> float:
-            return float(s.get("confidence_score") or s.get("data_quality_score") or 0.5)
+        try:
+            messages = runner.wait(batch_id)
+        except BatchWaitTimeout as e:
+            log.warning(f"Message Batch 대기 시간 초과 — 다음 실행에서 재개: {e}")
+            return []
+
+        signals = runner.load_signals(batch_id)
+        merged: dict[str, dict] = {}
+        for event_id, signal in signals.items():
+            message = messages.get(event_id)
+            if message is None:
+                continue
+            self._record_usage(message, self._analysis_purpose(signal), signal_count=1, batch=True)
+            params = self._analysis_request(signal)
+            key = self._cache_key(params)
+            if key is not None and message.stop_reason != "max_tokens":
+                self._cache.put(key, message)
+            merged[event_id] = self._apply_analysis(signal, message, params)
+        failed = [signal for event_id, signal in signals.items() if event_id not in merged]
+        if failed:
+            log.info(f"배치 실패 {len(failed)}건 실시간 재분석")
+            for signal in self._analyze_realtime(failed, executor):
+                merged[signal["event_id"]] = signal
+
+        runner.complete(batch_id)
+        return [merged[event_id] for event_id in signals]
+
+    # ── Report input ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def _report_confidence(signal: dict) -> float:
+        return float(signal.get("confidence_score") or signal.get("data_quality_score") or 0.5)
+
+    @staticmethod
+    def _report_content(signal: dict) -> str:
+        return signal.get("summary") or signal.get("raw_content", "")
+
+    def _prime_report_contents(self, signals: list[dict]) -> None:
+        self._summarizer.prime([self._report_content(s) for s in signals], SUMMARIZER_REPORT_TOKENS)
+
+    def _report_signal_payload(self, signal: dict) -> dict:
+        """리포트 입력용 신호 필드 (topk 입력·map 입력 공용). 본문은 SUMMARIZER_REPORT_TOKENS 내 핵심 문장."""
+        return {
+            "scope": signal.get("scope"),
+            "category": signal.get("category"),
+            "title": signal.get("title", ""),
+            "content": self._summarizer.summarize(self._report_content(signal), SUMMARIZER_REPORT_TOKENS),
+            "strategic_implication": signal.get("strategic_implication", ""),
+            "key_insights": signal.get("key_insights", []),
+            "publisher": signal.get("publisher") or signal.get("source_metadata", {}).get("publisher", ""),
+            "source_url": signal.get("source_url") or signal.get("source_metadata", {}).get("url", ""),
+            "published_at": str(
+                signal.get("published_at") or signal.get("source_metadata", {}).get("published_at", "")
+            )[:10],
+            "confidence": round(self._report_confidence(signal), 2),
+        }
+
+    def _report_input(self, signals: list[dict], per_scope: int, topk_template: str, partials_template: str) -> str:
+        """
+        리포트 user 메시지.
+        REPORT_INPUT_MODE="mapreduce": 전체 신호의 부분 요약 목록 (_report_partials)
+        REPORT_INPUT_MODE="topk":      신뢰도 기준 스코프별 상위 per_scope 건
+        """
+        if REPORT_INPUT_MODE == "mapreduce":
+            partials = self._report_partials(signals)
+            return partials_template.format(
+                total=len(signals), count=len(partials),
+                signals_json=json.dumps(partials, ensure_ascii=False),
+            )
 
         top_signals = []
         for scope in ["Market", "Tech", "Case", "Policy"]:
             scope_sigs = sorted(
                 [s for s in signals if s.get("scope") == scope],
-                key=_sort_key,
+                key=self._report_confidence,
                 reverse=True,
             )
-            top_signals.extend(scope_sigs[:7])
+            top_signals.extend(scope_sigs[:per_scope])
+        self._prime_report_contents(top_signals)
+        return topk_template.format(
+            total=len(signals),
+            signals_json=json.dumps([self._report_signal_payload(s) for s in top_signals], ensure_ascii=False),
+        )
 
-        signals_summary = json.dumps(
-            [
-                {
-                    "scope": s.get("scope"),
-                    "category": s.get("category"),
-                    "title": s.get("title", ""),
-                    "content": (
-                        s.get("summary")
-                        or s.get("raw_content", "")
-                    )[:500],
-                    "strategic_implication": s.get("strategic_implication", ""),
-                    "key_insights": s.get("key_insights", []),
-                    "publisher": (
-                        s.get("publisher")
-                        or s.get("source_metadata", {}).get("publisher", "")
-                    ),
-                    "source_url": s.get("source_url") or s.get("source_metadata", {}).get("url", ""),
-                    "published_at": str(
-                        s.get("published_at")
-                        or s.get("source_metadata", {}).get("published_at", "")
-                    )[:10],
-                    "confidence": round(_sort_key(s), 2),
-                }
-                for s in top_signals
-            ],
-            ensure_ascii=False,
+    def _report_partials(self, signals: list[dict]) -> list[dict]:
+        """
+        전체 신호 → 부분 요약 목록 (pipeline/report_mapreduce.py).
+        캐시 미적중 묶음만 병렬 map 호출, 예산 초과 시 (스코프, 기업) 단위 collapse 후 신호 수 많은 순으로 예산까지.
+        """
+        cache = ReportPartialCache()
+        groups = group_signals(signals)
+        partials: list[Optional[dict]] = [cache.get(g.iso_week, g.name, g.digest) for g in groups]
+        todo = [i for i, partial in enumerate(partials) if partial is None]
+        self._prime_report_contents([s for i in todo for s in groups[i].signals])
+        for i, partial in zip(todo, self._run_parallel(lambda i: self._map_group(groups[i], cache), todo)):
+            partials[i] = partial
+        results = [{**g.header(), **partial} for g, partial in zip(groups, partials)]
+        log.info(
+            f"리포트 부분 요약: 신호 {len(signals)}건 → 묶음 {len(groups)}개 "
+            f"(map 호출 {len(todo)}회, 캐시 {cache.summary()})"
         )
 
+        if self._partials_tokens(results) > REPORT_REDUCE_INPUT_TOKENS:
+            buckets = collapse_groups(results)
+            collapsed = self._run_parallel(lambda bucket: self._collapse_partials(*bucket, cache), buckets)
+            log.info(f"부분 요약 예산 초과 → 스코프·기업 단위 통합: {len(results)}개 → {len(collapsed)}개")
+            results = collapsed
+
+        if self._partials_tokens(results) > REPORT_REDUCE_INPUT_TOKENS:
+            ranked = sorted(results, key=lambda p: p["signal_count"], reverse=True)
+            kept, used = [], 0
+            for partial in ranked:
+                cost = self._partials_tokens([partial])
+                if kept and used + cost > REPORT_REDUCE_INPUT_TOKENS:
+                    continue
+                kept.append(partial)
+                used += cost
+            log.warning(f"부분 요약 예산 초과 → 신호 수 상위 {len(kept)}/{len(results)}개 묶음만 사용")
+            results = [p for p in results if p in kept]  # 원래 (주, 스코프, 기업) 순서 유지
+        return results
+
+    @staticmethod
+    def _partials_tokens(partials: list[dict]) -> int:
+        return estimate_tokens(json.dumps(partials, ensure_ascii=False))
+
+    @staticmethod
+    def _run_parallel(fn: Callable, items: list) -> list:
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(len(items), CLAUDE_CONCURRENCY_MAX)) as executor:
+            return list(executor.map(fn, items))
+
+    def _digest_call(self, purpose: str, system: str, label: str, items: list[dict], signal_count: int) -> Optional[dict]:
+        """부분 요약 도구 호출 1회 → 검증된 {headline, key_facts, implication} (실패 시 None)."""
         try:
-            message = self._client.messages.create(
-                model=CLAUDE_MODEL,
-                max_tokens=CLAUDE_MONTHLY_MAX_TOKENS,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": _MONTHLY_REPORT_PROMPT.format(
-                            total=len(signals),
-                            signals_json=signals_summary,
-                        ),
-                    }
-                ],
+            message = self._call_claude(
+                purpose=purpose,
+                signal_count=signal_count,
+                model=REPORT_MAP_MODEL,
+                max_tokens=REPORT_MAP_MAX_TOKENS,
+                system=_cached_system(system, REPORT_MAP_MODEL, [PARTIAL_SUMMARY_TOOL]),
+                tools=[PARTIAL_SUMMARY_TOOL],
+                tool_choice=tool_choice(PARTIAL_SUMMARY_TOOL),
+                messages=[{
+                    "role": "user",
+                    "content": _REPORT_DIGEST_INPUT.format(
+                        label=label, items_json=json.dumps(items, ensure_ascii=False),
+                    ),
+                }],
             )
-            html = message.content[0].text.strip()
-            if html.startswith("```"):
-                html = html.split("```")[1]
-                if html.startswith("html"):
-                    html = html[4:]
-            return html
+        except Exception as e:
+            log.warning(f"부분 요약 호출 오류 ({label}): {e}")
+            return None
+        partial = validate_partial(tool_input(message, PARTIAL_SUMMARY_TOOL))
+        if partial is None:
+            log.warning(f"부분 요약 응답 필수 필드 누락 ({label}, stop_reason={message.stop_reason})")
+        return partial
+
+    def _map_group(self, group: SignalGroup, cache: ReportPartialCache) -> dict:
+        """신호 묶음 1개 map — 성공 시 캐시 저장, 실패 시 로컬 부분 요약 (캐시 안 함)."""
+        label = f"{group.iso_week} · {group.scope} · {group.company} — 신호 {len(group.signals)}건"
+        partial = None
+        if self._available:
+            partial = self._digest_call(
+                "report_map", _REPORT_MAP_SYSTEM, label,
+                [self._report_signal_payload(s) for s in group.signals], len(group.signals),
+            )
+        if partial is None:
+            return local_partial(group)
+        cache.put(group.iso_week, group.name, group.digest, partial)
+        return partial
+
+    def _collapse_partials(self, name: str, members: list[dict], cache: ReportPartialCache) -> dict:
+        """같은 (스코프, 기업) 부분 요약 여러 개 → 1개. 1개뿐이거나 호출 실패 시 신호 수 최다 부분 요약 유지."""
+        header = collapsed_header(members)
+        if len(members) == 1:
+            return members[0]
+        digest = collapse_digest(members)
+        partial = cache.get(COLLAPSED_BUCKET, name, digest)
+        if partial is None and self._available:
+            partial = self._digest_call(
+                "report_collapse", _REPORT_COLLAPSE_SYSTEM,
+                f"{header['iso_week']} · {header['scope']} · {header['company']} — 주별 부분 요약 {len(members)}개",
+                members, 0,
+            )
+            if partial is not None:
+                cache.put(COLLAPSED_BUCKET, name, digest, partial)
+        if partial is None:
+            top = max(members, key=lambda p: p["signal_count"])
+            partial = {k: top[k] for k in ("headline", "key_facts", "implication")}
+        return {**header, **partial}
+
+    # ── Report generation ──────────────────────────────────────────────────
+
+    def _stream_report(
+        self,
+        purpose: str,
+        signal_count: int,
+        system: str,
+        content: str,
+        max_tokens: int,
+        sections: tuple[ReportSection, ...],
+        prefix: str,
+    ) -> Iterator[str]:
+        """
+        리포트 HTML 조각 스트림 (조각을 이어 붙이면 전체 리포트).
+        REPORT_GENERATION_MODE="sectioned": 섹션별 동시 생성, 섹션 번호 순서로 완료되는 대로 (_stream_sections)
+        REPORT_GENERATION_MODE="single":    6개 섹션 요청 1회 (max_tokens) 스트리밍, 최상위 div 가 닫힐 때마다
+        """
+        if REPORT_GENERATION_MODE == "sectioned":
+            yield from self._stream_sections(purpose, signal_count, system, content, sections, prefix)
+            return
+        splitter = SectionStreamSplitter()
+        for text in self._stream_claude(
+            purpose=purpose,
+            signal_count=signal_count,
+            model=CLAUDE_MODEL,
+            max_tokens=max_tokens,
+            system=_cached_system(system, CLAUDE_MODEL),
+            messages=[{"role": "user", "content": content}],
+        ):
+            yield from splitter.feed(text)
+        rest = splitter.close()
+        if rest:
+            yield rest
+
+    def _stream_sections(
+        self,
+        purpose: str,
+        signal_count: int,
+        system: str,
+        content: str,
+        sections: tuple[ReportSection, ...],
+        prefix: str,
+    ) -> Iterator[str]:
+        """
+        섹션마다 요청 1회 (REPORT_SECTION_MAX_TOKENS) → 섹션 번호 순서로 완료되는 대로 yield.
+        system 지침 + 리포트 입력이 공통 prompt cache 접두부 — 첫 섹션을 먼저 생성해 캐시를 쓰고,
+        나머지 섹션은 그 뒤에 동시 실행 (동시에 시작하면 모두 캐시 쓰기로 입력 전체를 섹션 수만큼 과금).
+        → 소요 시간 ≈ 첫 섹션 + 나머지 중 가장 느린 섹션.
+        실패·잘림·형식 오류는 해당 섹션만 재시도, 최종 실패 섹션은 안내 문구로 대체.
+        성공 섹션이 나오기 전의 실패 섹션은 보류 (전 섹션 실패 시 안내 문구만으로 된 리포트를 내보내지 않음).
+        Raises: RuntimeError — 전 섹션 실패 (호출 측 fallback 리포트)
+        """
+        started = time.monotonic()
+        outcomes: dict[int, str] = {}
+        held: list[str] = []
+        emitted = False
+        with ThreadPoolExecutor(max_workers=min(len(sections), CLAUDE_CONCURRENCY_MAX)) as executor:
+            def submit(section: ReportSection):
+                return executor.submit(self._generate_section, purpose, signal_count, system, content, section, prefix)
+
+            first = submit(sections[0])
+            first.result()  # 캐시 쓰기 완료 후 나머지 섹션 (캐시 읽기)
+            futures = [first] + [submit(section) for section in sections[1:]]
+            for section, future in zip(sections, futures):
+                status, html = future.result()
+                outcomes[section.number] = status
+                if status == "skip":
+                    continue
+                if status == "failed" and not emitted:
+                    held.append(html)
+                    continue
+                for part in held + [html]:
+                    yield ("\n\n" if emitted else "") + part
+                    emitted = True
+                held = []
+        log.info(
+            f"섹션별 리포트 생성 ({time.monotonic() - started:.1f}s): "
+            + ", ".join(f"S{number}={status}" for number, status in outcomes.items())
+        )
+        if not emitted:
+            raise RuntimeError("리포트 전 섹션 생성 실패")
 
+    def _generate_section(
+        self,
+        purpose: str,
+        signal_count: int,
+        system: str,
+        content: str,
+        section: ReportSection,
+        prefix: str,
+    ) -> tuple[str, str]:
+        """섹션 1개 생성 → (상태 "ok" | "skip" | "failed", HTML). 잘림이면 출력 상한 2배로 재시도."""
+        max_tokens = REPORT_SECTION_MAX_TOKENS
+        for attempt in range(1, REPORT_SECTION_MAX_ATTEMPTS + 1):
+            try:
+                message = self._call_claude(
+                    purpose=purpose,
+                    signal_count=signal_count,
+                    model=CLAUDE_MODEL,
+                    max_tokens=max_tokens,
+                    system=_cached_system(system, CLAUDE_MODEL),
+                    messages=[{
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": content, "cache_control": {"type": "ephemeral"}},
+                            {"type": "text", "text": section_instruction(section, prefix)},
+                        ],
+                    }],
+                )
+            except Exception as e:
+                log.warning(f"리포트 섹션 {section.number} 호출 오류 (시도 {attempt}/{REPORT_SECTION_MAX_ATTEMPTS}): {e}")
+                continue
+            html = clean_report_html("".join(getattr(b, "text", "") for b in message.content))
+            status = check_section(html, message.stop_reason, section, prefix)
+            if status in ("ok", "skip"):
+                return status, html
+            log.warning(f"리포트 섹션 {section.number} {status} (시도 {attempt}/{REPORT_SECTION_MAX_ATTEMPTS})")
+            if status == "truncated":
+                max_tokens *= 2
+        return "failed", placeholder(section, prefix)
+
+    def _report_stream(self, label: str, pieces: Callable[[], Iterator[str]], fallback: Callable[[], str]) -> Iterator[str]:
+        """
+        리포트 조각 스트림 공통 처리: 첫 조각 전 오류는 기본 HTML 리포트 1조각으로 대체,
+        이후 오류는 ReportIncomplete (이미 내보낸 조각은 되돌릴 수 없음 — 호출 측은 저장하지 않음). 종료 시 원장 기록.
+        """
+        emitted = False
+        try:
+            for piece in pieces():
+                emitted = True
+                yield piece
+            log.info(f"{label} 리포트 생성 — Claude 토큰 사용량: {self.usage_summary()}")
         except Exception as e:
-            log.error(f"월간 리포트 생성 오류: {e}")
-            return self._fallback_monthly_report(signals)
+            log.error(f"{label} 리포트 생성 오류: {e}")
+            if emitted:
+                raise ReportIncomplete(f"{label} 리포트 생성 중단 — 일부 섹션만 수신: {e}") from e
+            yield fallback()
+        finally:
+            self._ledger.flush()
+
+    def stream_weekly_report(self, signals: list[dict]) -> Iterator[str]:
+        """
+        주간 전략 브리핑 HTML 을 완성된 섹션(최상위 div) 단위로 순서대로 yield — 웹 페이지 점진 렌더링용.
+        조각을 이어 붙이면 generate_weekly_report 결과. API 미설정 시 기본 HTML 1조각.
+        Raises: ReportIncomplete — 조각을 내보낸 뒤 생성 실패 (받은 조각은 저장하지 말 것)
+        """
+        if not self._available or not signals:
+            yield self._fallback_weekly_report(signals)
+            return
+
+        def pieces() -> Iterator[str]:
+            # topk 모드: 신뢰도 기준 스코프별 상위 5건 (8192 토큰 출력 한도 내 6개 섹션 완성을 위해 입력 최소화)
+            content = self._report_input(signals, 5, _WEEKLY_REPORT_INPUT, _WEEKLY_REPORT_PARTIALS_INPUT)
+            return self._stream_report(
+                "weekly_report", len(signals), _WEEKLY_REPORT_SYSTEM, content,
+                CLAUDE_REPORT_MAX_TOKENS, WEEKLY_SECTIONS, "rpt",
+            )
+
+        yield from self._report_stream("주간", pieces, lambda: self._fallback_weekly_report(signals))
+
+    def generate_weekly_report(self, signals: list[dict]) -> str:
+        """
+        주간 전략 브리핑 HTML 리포트 생성 (stream_weekly_report 조각 결합).
+        API 미설정·생성 실패 시 기본 HTML 반환 (중간 실패도 부분 리포트 대신 기본 HTML).
+        """
+        return self._complete_report(self.stream_weekly_report(signals), lambda: self._fallback_weekly_report(signals))
+
+    def stream_monthly_report(self, signals: list[dict]) -> Iterator[str]:
+        """
+        월간 전략 브리핑 HTML 을 완성된 섹션(최상위 div) 단위로 순서대로 yield — 웹 페이지 점진 렌더링용.
+        조각을 이어 붙이면 generate_monthly_report 결과. API 미설정 시 기본 HTML 1조각.
+        Raises: ReportIncomplete — 조각을 내보낸 뒤 생성 실패 (받은 조각은 저장하지 말 것)
+        """
+        if not self._available or not signals:
+            yield self._fallback_monthly_report(signals)
+            return
+
+        def pieces() -> Iterator[str]:
+            # topk 모드: 신뢰도 기준 스코프별 상위 7건
+            content = self._report_input(signals, 7, _MONTHLY_REPORT_INPUT, _MONTHLY_REPORT_PARTIALS_INPUT)
+            return self._stream_report(
+                "monthly_report", len(signals), _MONTHLY_REPORT_SYSTEM, content,
+                CLAUDE_MONTHLY_MAX_TOKENS, MONTHLY_SECTIONS, "mrpt",
+            )
+
+        yield from self._report_stream("월간", pieces, lambda: self._fallback_monthly_report(signals))
+
+    def generate_monthly_report(self, signals: list[dict]) -> str:
+        """
+        월간 전략 브리핑 HTML 리포트 생성 (Bain 스타일, stream_monthly_report 조각 결합).
+        API 미설정·생성 실패 시 기본 HTML 반환 (중간 실패도 부분 리포트 대신 기본 HTML).
+        """
+        return self._complete_report(self.stream_monthly_report(signals), lambda: self._fallback_monthly_report(signals))
+
+    @staticmethod
+    def _complete_report(stream: Iterator[str], fallback: Callable[[], str]) -> str:
+        """리포트 조각 스트림 결합 — 중간 실패(ReportIncomplete)면 부분 리포트 대신 기본 HTML."""
+        try:
+            return "".join(stream)
+        except ReportIncomplete:
+            return fallback()
 
     # ── Fallbacks ──────────────────────────────────────────────────────────
 
@@ -570,12 +1452,3 @@ class StrategicAnalyzer:
   <h3>수집 신호 목록</h3>
   <ul>{items}</ul>
 </div>"""
-
-    def _save_processed(self, records: list[dict]) -> None:
-        """분석 완료 데이터를 data/processed/에 저장."""
-        PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
-        filename = f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_analyzed.json"
-        filepath = PROCESSED_DIR / filename
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(records, f, ensure_ascii=False, indent=2, default=str)
-        log.info(f"분석 데이터 저장: {filepath}")
@@ -10,7 +10,6 @@ data-archivist SKILL.md 구현체
 """
 import hashlib
 import logging
-import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from pathlib import Path
@@ -21,7 +20,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import CONFIDENCE_WEIGHTS, MIN_QUALITY_SCORE
 from database.init_db import get_session
-from database.queries import upsert_signal
+from database.queries import upsert_signal, upsert_signal_duplicates
+from pipeline.dedup import event_id_for_url
+from pipeline.seen_index import get_seen_index, url_hash
 
 log = logging.getLogger(__name__)
 
@@ -119,6 +120,24 @@ class DataArchivist:
         raw = f"{title}|{url}".lower().strip()
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+    # ── 2b. Near-Duplicate Links ───────────────────────────────────────────
+
+    @staticmethod
+    def _duplicate_links(record: dict) -> list[dict]:
+        """근접 중복 클러스터 링크(duplicates) → signal_duplicates 행 (정규 URL 해시 기준 중복 제거)."""
+        links: dict[str, dict] = {}
+        for dup in record.get("duplicates", []):
+            url = dup.get("url", "")
+            if not url:
+                continue
+            links.setdefault(url_hash(url), {
+                "url": url,
+                "title": dup.get("title", ""),
+                "publisher": dup.get("publisher", ""),
+                "published_at": str(dup.get("published_at", ""))[:40],
+            })
+        return [{"url_hash": key, **link} for key, link in links.items()]
+
     # ── 3. Quality Scoring ─────────────────────────────────────────────────
 
     def calculate_quality_score(self, record: dict) -> float:
@@ -171,7 +190,8 @@ class DataArchivist:
     def ingest_batch(self, records: list[dict]) -> dict:
         """
         배치 UPSERT to DB.
-        Returns: {"rows_inserted": int, "rows_updated": int, "errors": list}
+        Returns: {"rows_inserted": int, "rows_updated": int, "errors": list, "stored": bool}
+          stored=False: DB 저장 자체가 실패 (트랜잭션 롤백 — 호출 측은 저널·수집 진행 상태를 유지하고 재시도)
         """
         inserted = 0
         updated = 0
@@ -224,7 +244,7 @@ class DataArchivist:
                         scraped_dt = datetime.utcnow()
 
                     signal_data = {
-                        "event_id": record.get("event_id", str(uuid.uuid4())),
+                        "event_id": record.get("event_id") or event_id_for_url(meta.get("url", "")),
                         "scope": record.get("scope"),
                         "category": record.get("category"),
                         "title": record.get("title"),
@@ -242,6 +262,9 @@ class DataArchivist:
                     }
 
                     was_inserted, event_id = upsert_signal(session, signal_data)
+                    duplicates = self._duplicate_links(record)
+                    if duplicates:
+                        upsert_signal_duplicates(session, event_id, duplicates)
                     if was_inserted:
                         inserted += 1
                     else:
@@ -250,8 +273,18 @@ class DataArchivist:
         except Exception as e:
             log.error(f"DB 저장 오류: {e}", exc_info=True)
             errors.append(str(e))
-
-        result = {"rows_inserted": inserted, "rows_updated": updated, "errors": errors}
+            stored = False
+            # 롤백된 레코드는 같은 인스턴스의 재시도(마이크로 배치·close)에서 다시 저장되도록 중복 판정 해제
+            self._seen_hashes.difference_update(r["content_hash"] for r in deduplicated)
+        else:
+            stored = True
+            # 저장 단계 통과 신호(품질 미달 포함) 지문 등록 → 다음 실행에서 분석 전 스킵
+            try:
+                get_seen_index().mark_seen(deduplicated)
+            except Exception as e:
+                log.warning(f"Seen index 등록 실패: {e}")
+
+        result = {"rows_inserted": inserted, "rows_updated": updated, "errors": errors, "stored": stored}
         log.info(f"DB 저장 결과: 신규={inserted}, 갱신={updated}, 오류={len(errors)}")
         return result
 
@@ -0,0 +1,371 @@
+"""
+arXiv Harvesters - 검색 API 샤딩 수집 + OAI-PMH 증분 수집
+
+1) ArxivHarvester (검색 API, export.arxiv.org/api/query)
+  - 전체 키워드 목록을 ARXIV_KEYWORD_SHARD_SIZE 단위 쿼리로 분할
+  - HTTP 페이지 요청마다 공유 TokenBucket 토큰 1개 소비 (1 req / 3 sec)
+  - 결과는 제출일 내림차순 → cutoff 이전 논문을 만나면 해당 샤드 페이지네이션 즉시 중단
+  - 샤드 간 결과는 버전 없는 arXiv ID 기준으로 병합
+
+2) ArxivOaiHarvester (OAI-PMH, 일일 운영용)
+  - set=cs 전체를 from=<마지막 성공 datestamp> 부터 ListRecords + resumptionToken 으로 벌크 수집
+  - 카테고리(cs.RO/cs.AI/cs.CV/cs.LG)·키워드 관련성 필터는 로컬에서 적용 (scout 측)
+  - 수집 완료 시 다음 from datestamp 를 보류해 두고, 수집 레코드 DB 저장 후 commit() 으로
+    data/cache/arxiv_oai_state.json 에 기록 (저장 전 중단 시 다음 실행이 같은 from 으로 재수집)
+"""
+import json
+import logging
+import os
+import time
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import feedparser
+import requests
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+
+from config import (
+    ARXIV_RATE_LIMIT_SEC,
+    ARXIV_PAGE_SIZE,
+    ARXIV_KEYWORD_SHARD_SIZE,
+    ARXIV_OAI_URL,
+    ARXIV_OAI_SET,
+    ARXIV_OAI_STATE_PATH,
+    FEED_USER_AGENT,
+)
+from pipeline.ratelimit import TokenBucket
+
+log = logging.getLogger(__name__)
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+_OAI_NS = {
+    "oai": "http://www.openarchives.org/OAI/2.0/",
+    "arXiv": "http://arxiv.org/OAI/arXiv/",
+}
+_OAI_MAX_RETRY_AFTER_SEC = 120
+_OAI_MAX_RETRY_AFTER_ATTEMPTS = 8   # 503 + Retry-After 연속 재요청 상한 (초과 시 HTTPError → tenacity 재시도)
+
+
+def strip_arxiv_version(arxiv_id: str) -> str:
+    """'2410.24164v2' → '2410.24164' (버전 접미사 제거)."""
+    head, sep, tail = arxiv_id.rpartition("v")
+    if sep and head and tail.isdigit():
+        return head
+    return arxiv_id
+
+
+def _parse_entry(entry: object) -> Optional[dict]:
+    """feedparser Atom entry → 정규화 dict. 필수 필드 누락 시 None."""
+    entry_id = getattr(entry, "id", "") or ""
+    published_parsed = getattr(entry, "published_parsed", None)
+    if not entry_id or not published_parsed:
+        return None
+
+    # entry.id 는 "http://arxiv.org/abs/2410.24164v2" 형식
+    short_id = entry_id.rsplit("/abs/", 1)[-1]
+    primary = getattr(entry, "arxiv_primary_category", None) or {}
+    return {
+        "arxiv_id": strip_arxiv_version(short_id),
+        "versioned_id": short_id,
+        "title": " ".join((getattr(entry, "title", "") or "").split()),
+        "summary": " ".join((getattr(entry, "summary", "") or "").split()),
+        "published": datetime(*published_parsed[:6], tzinfo=timezone.utc),
+        "primary_category": primary.get("term", ""),
+        "authors": [a.get("name", "") for a in getattr(entry, "authors", [])],
+    }
+
+
+class ArxivHarvester:
+    """
+    arXiv 검색 API 샤딩 수집기.
+    TokenBucket을 외부에서 주입하면 OAI-PMH 등 다른 arXiv 요청과 예산을 공유.
+    """
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        page_size: int = ARXIV_PAGE_SIZE,
+        shard_size: int = ARXIV_KEYWORD_SHARD_SIZE,
+    ) -> None:
+        self._bucket = bucket or TokenBucket.per_interval(ARXIV_RATE_LIMIT_SEC)
+        self._page_size = page_size
+        self._shard_size = max(1, shard_size)
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": FEED_USER_AGENT})
+
+    def build_queries(self, keywords: list[str], categories: list[str]) -> list[str]:
+        """키워드 전체를 shard_size 단위 OR 쿼리로 분할 (카테고리 필터 공통 적용)."""
+        cat_filter = " OR ".join(f"cat:{c}" for c in categories)
+        queries = []
+        for i in range(0, len(keywords), self._shard_size):
+            shard = keywords[i:i + self._shard_size]
+            kw_query = " OR ".join(f'"{kw}"' for kw in shard)
+            queries.append(f"({cat_filter}) AND ({kw_query})")
+        return queries
+
+    def search(
+        self,
+        keywords: list[str],
+        categories: list[str],
+        cutoff: datetime,
+        max_results_per_shard: int,
+    ) -> list[dict]:
+        """
+        샤드별 수집 후 arXiv ID 기준 병합.
+        Returns: 정규화 entry 목록 (제출일 내림차순)
+        """
+        merged: dict[str, dict] = {}
+        for query in self.build_queries(keywords, categories):
+            try:
+                entries = self._harvest_query(query, cutoff, max_results_per_shard)
+            except requests.exceptions.RequestException as e:
+                log.warning(f"arXiv 샤드 수집 실패 (query={query[:80]}...): {e}")
+                continue
+            for entry in entries:
+                merged.setdefault(entry["arxiv_id"], entry)
+
+        return sorted(merged.values(), key=lambda e: e["published"], reverse=True)
+
+    def _harvest_query(self, query: str, cutoff: datetime, max_results: int) -> list[dict]:
+        """단일 쿼리 페이지네이션. cutoff 이전 논문 도달 시 즉시 종료."""
+        entries: list[dict] = []
+        start = 0
+        pages = 0
+
+        while len(entries) < max_results:
+            page_size = min(self._page_size, max_results - len(entries))
+            parsed = self._fetch_page(query, start, page_size)
+            pages += 1
+
+            page_entries = [e for e in (_parse_entry(x) for x in parsed.entries) if e]
+            if not page_entries:
+                break
+
+            reached_cutoff = False
+            for entry in page_entries:
+                if entry["published"] < cutoff:
+                    reached_cutoff = True
+                    break
+                entries.append(entry)
+
+            total = int(getattr(parsed.feed, "opensearch_totalresults", 0) or 0)
+            start += len(parsed.entries)
+            if reached_cutoff or start >= total:
+                break
+
+        log.debug(f"arXiv 샤드 완료: {len(entries)}건 / {pages}페이지 (query={query[:60]}...)")
+        return entries[:max_results]
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=3, max=15),
+        retry=retry_if_exception_type(requests.exceptions.RequestException),
+    )
+    def _fetch_page(self, query: str, start: int, page_size: int) -> object:
+        """HTTP 페이지 1건 요청 (토큰 버킷 대기 후). 요청 단위 재시도."""
+        self._bucket.acquire()
+        resp = self._session.get(
+            ARXIV_API_URL,
+            params={
+                "search_query": query,
+                "start": start,
+                "max_results": page_size,
+                "sortBy": "submittedDate",
+                "sortOrder": "descending",
+            },
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return feedparser.parse(resp.content)
+
+
+# ── OAI-PMH Incremental Harvester ─────────────────────────────────────────────
+
+def _text(node: Optional[ET.Element], path: str) -> str:
+    found = node.find(path, _OAI_NS) if node is not None else None
+    return " ".join((found.text or "").split()) if found is not None else ""
+
+
+def _parse_oai_record(record: ET.Element) -> Optional[dict]:
+    """OAI-PMH <record> (metadataPrefix=arXiv) → 정규화 dict. 삭제 레코드는 None."""
+    header = record.find("oai:header", _OAI_NS)
+    if header is None or header.get("status") == "deleted":
+        return None
+    meta = record.find("oai:metadata/arXiv:arXiv", _OAI_NS)
+    if meta is None:
+        return None
+
+    arxiv_id = _text(meta, "arXiv:id")
+    created = _text(meta, "arXiv:created")    # v1 제출일
+    updated = _text(meta, "arXiv:updated")    # 최신 버전 제출일 (v2 이상일 때만 존재)
+    if not arxiv_id or not created:
+        return None
+
+    categories = _text(meta, "arXiv:categories").split()
+    authors = []
+    for author in meta.findall("arXiv:authors/arXiv:author", _OAI_NS):
+        name = " ".join(p for p in (_text(author, "arXiv:forenames"), _text(author, "arXiv:keyname")) if p)
+        if name:
+            authors.append(name)
+
+    return {
+        "arxiv_id": arxiv_id,
+        "versioned_id": arxiv_id,
+        "title": _text(meta, "arXiv:title"),
+        "summary": _text(meta, "arXiv:abstract"),
+        "published": datetime.strptime(created, "%Y-%m-%d").replace(tzinfo=timezone.utc),
+        "updated": datetime.strptime(updated, "%Y-%m-%d").replace(tzinfo=timezone.utc) if updated else None,
+        "primary_category": categories[0] if categories else "",
+        "categories": categories,
+        "authors": authors,
+        "datestamp": _text(header, "oai:datestamp"),
+    }
+
+
+def is_new_submission(entry: dict, from_dt: datetime) -> bool:
+    """
+    신규 논문 여부. 제출(created)과 공개(datestamp) 사이 1~3일(주말은 더 길게) 지연이 있어
+    created 를 from 과 비교하면 from 직전 제출·직후 공개 논문이 영구 누락 → 버전 정보로 구분:
+      - <updated> 없음 (v1만 존재) → 신규
+      - <updated> 있음 (v2 이상) → 기존 논문 개정. 단 v1 제출이 from 이후면 아직 못 본 논문일 수 있으므로 포함
+        (이미 수집한 논문이면 버전 없는 ID 기반 event_id 로 seen index 가 제외)
+    """
+    return entry.get("updated") is None or entry["published"] >= from_dt
+
+
+class ArxivOaiHarvester:
+    """
+    arXiv OAI-PMH 증분 수집기.
+    from=<마지막 성공 datestamp> 기준 ListRecords → resumptionToken 소진까지 반복.
+    """
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        state_path: Path = ARXIV_OAI_STATE_PATH,
+        base_url: str = ARXIV_OAI_URL,
+        oai_set: str = ARXIV_OAI_SET,
+    ) -> None:
+        self._bucket = bucket or TokenBucket.per_interval(ARXIV_RATE_LIMIT_SEC)
+        self._state_path = Path(state_path)
+        self._base_url = base_url
+        self._set = oai_set
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": FEED_USER_AGENT})
+        self._pending_datestamp: Optional[str] = None
+
+    # ── State ──────────────────────────────────────────────────────────────
+
+    def load_last_datestamp(self) -> Optional[str]:
+        if not self._state_path.exists():
+            return None
+        try:
+            with open(self._state_path, encoding="utf-8") as f:
+                return json.load(f).get("last_datestamp")
+        except (OSError, ValueError) as e:
+            log.warning(f"arXiv OAI 상태 로드 실패: {e}")
+            return None
+
+    def save_last_datestamp(self, datestamp: str) -> None:
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._state_path.with_suffix(self._state_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "last_datestamp": datestamp,
+                    "harvested_at": datetime.now(timezone.utc).isoformat(),
+                },
+                f,
+            )
+        os.replace(tmp_path, self._state_path)
+
+    def commit(self) -> None:
+        """harvest() 가 보류한 다음 from datestamp 기록 (수집 레코드 DB 저장 후 호출)."""
+        if self._pending_datestamp is not None:
+            self.save_last_datestamp(self._pending_datestamp)
+            self._pending_datestamp = None
+
+    # ── Harvest ────────────────────────────────────────────────────────────
+
+    def harvest(self, days_back: int = 14) -> list[dict]:
+        """
+        마지막 성공 datestamp 이후 신규 논문 수집.
+        첫 실행(상태 없음)은 days_back 일 전부터 시작.
+        Returns: 정규화 entry 목록 (신규 논문만 — 기존 논문의 버전 갱신 레코드 제외)
+        """
+        from_date = self.load_last_datestamp() or (
+            date.today() - timedelta(days=days_back)
+        ).isoformat()
+        from_dt = datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+        entries: list[dict] = []
+        max_datestamp = from_date
+        params = {
+            "verb": "ListRecords",
+            "metadataPrefix": "arXiv",
+            "set": self._set,
+            "from": from_date,
+        }
+        pages = 0
+
+        while params:
+            root = self._fetch(params)
+            pages += 1
+
+            error = root.find("oai:error", _OAI_NS)
+            if error is not None:
+                if error.get("code") == "noRecordsMatch":
+                    break
+                raise RuntimeError(f"OAI-PMH 오류 {error.get('code')}: {error.text}")
+
+            list_records = root.find("oai:ListRecords", _OAI_NS)
+            if list_records is None:
+                break
+
+            for record in list_records.findall("oai:record", _OAI_NS):
+                entry = _parse_oai_record(record)
+                if entry is None:
+                    continue
+                max_datestamp = max(max_datestamp, entry["datestamp"] or max_datestamp)
+                if is_new_submission(entry, from_dt):
+                    entries.append(entry)
+
+            token = list_records.find("oai:resumptionToken", _OAI_NS)
+            if token is not None and (token.text or "").strip():
+                params = {"verb": "ListRecords", "resumptionToken": token.text.strip()}
+            else:
+                params = None
+
+        # 끝까지 성공한 경우에만 진행 상태 보류 → commit() 에서 기록 (중간 실패·저장 전 중단 시 같은 from 재시도)
+        self._pending_datestamp = max_datestamp
+        log.info(
+            f"arXiv OAI-PMH 수집: {len(entries)}건 / {pages}페이지 "
+            f"(from={from_date}, 다음 from={max_datestamp})"
+        )
+        return entries
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=1, min=3, max=30),
+        retry=retry_if_exception_type(requests.exceptions.RequestException),
+    )
+    def _fetch(self, params: dict) -> ET.Element:
+        """OAI 요청 1건. 503 + Retry-After 는 지정 시간 대기 후 재요청 (최대 _OAI_MAX_RETRY_AFTER_ATTEMPTS 회)."""
+        for attempt in range(_OAI_MAX_RETRY_AFTER_ATTEMPTS + 1):
+            self._bucket.acquire()
+            resp = self._session.get(self._base_url, params=params, timeout=60)
+            retry_after = resp.headers.get("Retry-After", "")
+            if resp.status_code == 503 and retry_after.isdigit() and attempt < _OAI_MAX_RETRY_AFTER_ATTEMPTS:
+                delay = min(int(retry_after), _OAI_MAX_RETRY_AFTER_SEC)
+                log.info(f"arXiv OAI 503 — {delay}s 후 재요청 ({attempt + 1}/{_OAI_MAX_RETRY_AFTER_ATTEMPTS})")
+                time.sleep(delay)
+                continue
+            break
+        resp.raise_for_status()
+        return ET.fromstring(resp.content)
@@ -0,0 +1,159 @@
+"""
+Analysis Checkpoint - 신호별 분석 결과 append-only 저널 + 중단 실행 재개 + DB 마이크로 배치 저장
+분석이 모두 끝난 뒤 한 번에 저장하면 프로세스 종료(크래시, GitHub Actions 60분 제한) 시 완료된 분석(비용 지불분)이 전부 유실
+→ Claude 분석 결과를 1건씩 즉시 저널에 기록하고, ANALYSIS_ARCHIVE_MICRO_BATCH 건마다 archivist 로 DB 저장
+
+저널 (ANALYSIS_CHECKPOINT_DIR):
+  {YYYYMMDD_HHMMSS}_{pid}.jsonl   실행 1회의 분석 결과 (1줄 = 레코드 1건, 기록마다 flush + fsync)
+  - fallback 결과(Claude 미분석)는 기록하지 않음 → 재개 시 다시 분석
+  - 강제 종료로 잘린 마지막 줄은 read_records 가 경고 후 무시
+재개: 다음 실행이 남아 있는 저널을 읽어 (resume) DB 미저장 레코드는 분석 없이 그대로 저장, 같은 event_id 신호는 분석 대상에서 제외
+완료: 대기 레코드 저장이 성공하면 (close) 이번 실행 저널과 재개한 저널 삭제. 저장 실패 시 저널 유지 → 다음 실행에서 재시도
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Callable, Iterable, Optional, TextIO
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import ANALYSIS_ARCHIVE_MICRO_BATCH, ANALYSIS_CHECKPOINT_DIR, ANALYSIS_CHECKPOINT_FSYNC
+from pipeline.jsonl_sink import read_records
+
+log = logging.getLogger(__name__)
+
+_JOURNAL_SUFFIX = ".jsonl"
+_UNPAID = {"fallback", "local"}  # Claude 호출 없이 만든 결과 — 저널 대상 아님
+
+
+class AnalysisCheckpoint:
+    """
+    실행 1회의 분석 결과 저널 + 마이크로 배치 저장.
+    archive: 레코드 목록 → {"rows_inserted", "rows_updated", "errors", "stored"} (DataArchivist.run_pipeline)
+    """
+
+    def __init__(
+        self,
+        archive: Callable[[list[dict]], dict],
+        directory: Path = ANALYSIS_CHECKPOINT_DIR,
+        micro_batch: int = ANALYSIS_ARCHIVE_MICRO_BATCH,
+        fsync: bool = ANALYSIS_CHECKPOINT_FSYNC,
+    ) -> None:
+        self._archive = archive
+        self._directory = Path(directory)
+        self._micro_batch = max(1, micro_batch)
+        self._fsync = fsync
+        self._lock = threading.Lock()
+
+        self._path = self._directory / f"{datetime.utcnow():%Y%m%d_%H%M%S}_{os.getpid()}{_JOURNAL_SUFFIX}"
+        self._file: Optional[TextIO] = None
+        self._resumed_paths: list[Path] = []
+        self._pending: list[dict] = []
+        self._staged_ids: set[str] = set()
+        self.ingest = {"rows_inserted": 0, "rows_updated": 0, "errors": []}
+        self.stats = {"journaled": 0, "resumed": 0, "archived": 0, "micro_batches": 0}
+
+    # ── Resume ─────────────────────────────────────────────────────────────
+
+    def resume(self) -> list[dict]:
+        """이전 중단 실행 저널의 분석 결과 (event_id 기준 마지막 기록, 기록 순서)."""
+        if not self._directory.exists():
+            return []
+        records: dict[str, dict] = {}
+        for path in sorted(self._directory.glob(f"*{_JOURNAL_SUFFIX}")):
+            if path == self._path:
+                continue
+            self._resumed_paths.append(path)
+            for record in read_records(path):
+                if record.get("event_id"):
+                    records.pop(record["event_id"], None)
+                    records[record["event_id"]] = record
+        if records:
+            log.info(f"중단된 실행 분석 결과 재개: {len(records)}건 (저널 {len(self._resumed_paths)}개)")
+        self.stats["resumed"] = len(records)
+        return list(records.values())
+
+    # ── Write path ─────────────────────────────────────────────────────────
+
+    def record(self, result: dict) -> None:
+        """분석 결과 1건 → 저널 기록 (Claude 분석분만) + 저장 대기. 마이크로 배치가 차면 DB 저장."""
+        if result.get("event_id") and result.get("analyzed_by") not in _UNPAID:
+            line = json.dumps(result, ensure_ascii=False, default=str)
+            with self._lock:
+                if self._file is None:
+                    self._directory.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self._path, "a", encoding="utf-8")
+                self._file.write(line + "\n")
+                self._file.flush()
+                if self._fsync:
+                    os.fsync(self._file.fileno())
+                self.stats["journaled"] += 1
+        self.stage([result])
+
+    def stage(self, records: Iterable[dict]) -> None:
+        """저널 기록 없이 저장 대기에만 추가 (재개분·local 등급 등). 마이크로 배치가 차면 DB 저장."""
+        records = list(records)
+        with self._lock:
+            self._pending.extend(records)
+            self._staged_ids.update(r["event_id"] for r in records if r.get("event_id"))
+            full = len(self._pending) >= self._micro_batch
+        if full:
+            self.flush()
+
+    def unstaged(self, records: Iterable[dict]) -> list[dict]:
+        """아직 저장 대기에 올리지 않은 레코드 (event_id 기준, event_id 없으면 포함)."""
+        with self._lock:
+            return [r for r in records if r.get("event_id") not in self._staged_ids]
+
+    def flush(self) -> bool:
+        """
+        대기 레코드 DB 저장. 실패 시 대기 유지 (다음 마이크로 배치·close 에서 재시도). Returns: 성공 여부.
+        archive 는 DB 오류를 예외 대신 결과의 stored=False 로 알림 (DataArchivist.ingest_batch) — 둘 다 실패로 처리.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return True
+        try:
+            result = self._archive(batch)
+        except Exception as e:
+            result = {"stored": False, "errors": [str(e)]}
+        if result.get("stored") is False:
+            log.error(f"마이크로 배치 저장 오류 ({len(batch)}건, 저널 유지): {'; '.join(result.get('errors', []))}")
+            with self._lock:
+                self._pending = batch + self._pending
+            return False
+        self.ingest["rows_inserted"] += result.get("rows_inserted", 0)
+        self.ingest["rows_updated"] += result.get("rows_updated", 0)
+        self.ingest["errors"].extend(result.get("errors", []))
+        self.stats["archived"] += len(batch)
+        self.stats["micro_batches"] += 1
+        return True
+
+    def close(self) -> bool:
+        """
+        남은 대기 레코드 저장 → 성공 시 이번 실행·재개한 저널 삭제.
+        Returns: 전체 저장 성공 여부 (실패 시 저널 유지, 다음 실행에서 재개)
+        """
+        saved = self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if saved:
+            for path in [self._path, *self._resumed_paths]:
+                path.unlink(missing_ok=True)
+        else:
+            log.warning(f"DB 저장 미완료 — 분석 저널 유지, 다음 실행에서 재개: {self._path.name}")
+        return saved
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"저널 기록 {s['journaled']}건, 재개 {s['resumed']}건, "
+            f"DB 저장 {s['archived']}건 (마이크로 배치 {s['micro_batches']}회)"
+        )
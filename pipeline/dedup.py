@@ -0,0 +1,295 @@
+"""
+Near-Duplicate Detection - 분석 전 교차 소스 중복 클러스터링
+동일 기사가 TechCrunch / The Robot Report / Google News 쿼리 등으로 URL·제목만 바뀌어 반복 유입되는 문제 해결
+
+단계:
+  1. URL 정규화 (canonicalize_url): 스킴·호스트 소문자, www·fragment·추적 파라미터 제거, arXiv 버전 제거
+     → 정규 URL 은 결정적 event_id (event_id_for_url) 의 입력으로도 사용
+  2. MinHash LSH: 제목 단어 집합 / 본문 앞부분 3-gram 집합 각각 서명 → 밴드 버킷으로 후보 추출
+  3. 후보 검증: 정확 Jaccard — 제목 ≥ NEAR_DUP_TITLE_JACCARD 또는 본문 ≥ NEAR_DUP_CONTENT_JACCARD
+     (정규 URL 일치는 무조건 동일 클러스터)
+     제목 일치는 제목 속 개체(TARGET_COMPANIES 기업·숫자 토큰)까지 같아야 인정
+     → "[8-K] Tesla, Inc. — Current report" / "[8-K] NVIDIA Corp — Current report" 같은 템플릿 헤드라인은 별개
+
+제목이 짧아 SimHash 비트 차이가 크게 흔들리는 헤드라인("$1.5B" vs "$1.5 billion")도
+단어 집합 Jaccard 로 안정적으로 잡힘.
+
+클러스터당 대표 레코드 1건만 분석·저장하고, 나머지는 대표 레코드의 `duplicates` 목록에 링크
+(DataArchivist 가 signal_duplicates 테이블에 저장). 대표 선정: confidence_score 높은 순 → 본문 길이 긴 순.
+"""
+import hashlib
+import logging
+import re
+import uuid
+from functools import lru_cache
+from typing import Optional
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from config import (
+    TARGET_COMPANIES,
+    URL_TRACKING_PARAMS,
+    NEAR_DUP_TITLE_JACCARD,
+    NEAR_DUP_CONTENT_JACCARD,
+    NEAR_DUP_CONTENT_CHARS,
+)
+from pipeline.arxiv_source import strip_arxiv_version
+from pipeline.keyword_matcher import KeywordMatcher
+
+log = logging.getLogger(__name__)
+
+_NUM_PERM = 16          # MinHash 서명 길이
+_BANDS = 8              # LSH 밴드 수 (밴드당 2행) — J=0.6 후보 포함 확률 ≈ 0.97
+_ROWS = _NUM_PERM // _BANDS
+_MIN_TITLE_TOKENS = 4       # 짧은 제목("NVIDIA earnings")은 제목 비교 제외
+_MIN_CONTENT_SHINGLES = 5
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣]+")
+_ARXIV_PATH_RE = re.compile(r"^/(abs|pdf)/(.+?)(\.pdf)?/?$")
+# Google News 등 "제목 - 매체명" / "제목 | 매체명" 접미사
+_PUBLISHER_SUFFIX_RE = re.compile(r"\s+[-|–—]\s+[^-|–—]{2,60}$")
+_STOPWORDS = frozenset(
+    "a an the and or of to in on for with by at from as is are was were be its it this that".split()
+)
+
+
+# ── URL 정규화 ─────────────────────────────────────────────────────────────────
+
+def canonicalize_url(url: str) -> str:
+    """
+    비교·식별용 정규 URL.
+    예) http://www.TechCrunch.com/2026/03/01/foo/?utm_source=rss#x → https://techcrunch.com/2026/03/01/foo
+        https://arxiv.org/pdf/2603.01234v2.pdf → https://arxiv.org/abs/2603.01234
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    host = parts.hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if host in ("arxiv.org", "export.arxiv.org"):
+        host = "arxiv.org"
+        match = _ARXIV_PATH_RE.match(path)
+        if match:
+            path = f"/abs/{strip_arxiv_version(match.group(2))}"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in URL_TRACKING_PARAMS and not k.lower().startswith("utm_")
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def event_id_for_url(url: str) -> str:
+    """
+    정규 URL 기반 결정적 event_id (UUIDv5, NAMESPACE_URL).
+    같은 기사는 재수집해도 같은 event_id → upsert_signal 이 실제 갱신으로 동작.
+    URL 이 없으면 무작위 UUIDv4.
+    """
+    canonical = canonicalize_url(url)
+    if not canonical:
+        return str(uuid.uuid4())
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, canonical))
+
+
+# ── MinHash ───────────────────────────────────────────────────────────────────
+
+def _normalize_title(title: str) -> str:
+    return _PUBLISHER_SUFFIX_RE.sub("", title or "").strip()
+
+
+def _tokens(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def title_features(title: str) -> frozenset[str]:
+    """매체명 접미사 제거 후 단어 집합."""
+    return frozenset(_tokens(_normalize_title(title)))
+
+
+@lru_cache(maxsize=1)
+def _company_matcher() -> KeywordMatcher:
+    return KeywordMatcher({"company": TARGET_COMPANIES})
+
+
+def title_entities(title: str) -> frozenset[str]:
+    """제목 속 개체: TARGET_COMPANIES 기업명 + 숫자 포함 토큰 (금액·분기·모델 번호 등)."""
+    companies = _company_matcher().scan(_normalize_title(title)).get("company", set())
+    return frozenset(companies) | frozenset(t for t in title_features(title) if any(ch.isdigit() for ch in t))
+
+
+def content_features(content: str) -> frozenset[str]:
+    """본문 앞부분 단어 3-gram shingle 집합."""
+    tokens = _tokens(content[:NEAR_DUP_CONTENT_CHARS])
+    return frozenset(" ".join(tokens[i:i + 3]) for i in range(len(tokens) - 2))
+
+
+def minhash(features: frozenset[str]) -> Optional[np.ndarray]:
+    """
+    _NUM_PERM 개 해시 함수의 최솟값 서명.
+    특징 1개당 blake2b 1회 → 64바이트 digest를 uint32 _NUM_PERM 개로 분할해 독립 해시로 사용.
+    """
+    if not features:
+        return None
+    digests = b"".join(
+        hashlib.blake2b(f.encode("utf-8"), digest_size=_NUM_PERM * 4).digest() for f in features
+    )
+    return np.frombuffer(digests, dtype=np.uint32).reshape(-1, _NUM_PERM).min(axis=0)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+# ── Clustering ────────────────────────────────────────────────────────────────
+
+def _rank(record: dict) -> tuple[float, int]:
+    meta = record.get("source_metadata", {})
+    return (meta.get("confidence_score") or 0.0, len(record.get("raw_content", "")))
+
+
+def _link(record: dict) -> dict:
+    meta = record.get("source_metadata", {})
+    return {
+        "event_id": record.get("event_id"),
+        "title": record.get("title", ""),
+        "url": meta.get("url", ""),
+        "publisher": meta.get("publisher", ""),
+        "published_at": meta.get("published_at", ""),
+    }
+
+
+class _Cluster:
+    __slots__ = ("members", "representative")
+
+    def __init__(self, record: dict) -> None:
+        self.members: list[dict] = [record]
+        self.representative: Optional[dict] = None  # 확정 전 None
+
+
+class _LshIndex:
+    """MinHash 밴드 버킷 → (특징 집합, 개체 집합, 클러스터) 후보 목록."""
+
+    def __init__(self, threshold: float) -> None:
+        self._threshold = threshold
+        self._buckets: dict[tuple[int, bytes], list[tuple[frozenset[str], Optional[frozenset[str]], _Cluster]]] = {}
+
+    @staticmethod
+    def _keys(signature: np.ndarray) -> list[tuple[int, bytes]]:
+        return [(b, signature[b * _ROWS:(b + 1) * _ROWS].tobytes()) for b in range(_BANDS)]
+
+    def find(
+        self, features: frozenset[str], signature: Optional[np.ndarray], entities: Optional[frozenset[str]] = None,
+    ) -> Optional[_Cluster]:
+        """entities 지정 시 Jaccard 외에 개체 집합도 같아야 일치."""
+        if signature is None:
+            return None
+        for key in self._keys(signature):
+            for other, other_entities, cluster in self._buckets.get(key, ()):
+                if entities != other_entities:
+                    continue
+                if jaccard(features, other) >= self._threshold:
+                    return cluster
+        return None
+
+    def add(
+        self, features: frozenset[str], signature: Optional[np.ndarray], cluster: _Cluster,
+        entities: Optional[frozenset[str]] = None,
+    ) -> None:
+        if signature is None:
+            return
+        for key in self._keys(signature):
+            self._buckets.setdefault(key, []).append((features, entities, cluster))
+
+
+class NearDuplicateDetector:
+    """
+    스트리밍 근접 중복 클러스터러.
+    cluster()를 여러 번 호출하면 이전 호출에서 확정된 클러스터에도 매칭
+    (예: 분석 경로 레코드 → Key Player 뉴스 경로 레코드 순서로 호출).
+    """
+
+    def __init__(
+        self,
+        title_threshold: float = NEAR_DUP_TITLE_JACCARD,
+        content_threshold: float = NEAR_DUP_CONTENT_JACCARD,
+    ) -> None:
+        self._by_url: dict[str, _Cluster] = {}
+        self._titles = _LshIndex(title_threshold)
+        self._contents = _LshIndex(content_threshold)
+
+    def _match(self, record: dict) -> tuple[Optional[_Cluster], tuple]:
+        canonical = canonicalize_url(record.get("source_metadata", {}).get("url", ""))
+        title = title_features(record.get("title", ""))
+        content = content_features(record.get("raw_content", ""))
+        if len(title) < _MIN_TITLE_TOKENS:
+            title = frozenset()
+        if len(content) < _MIN_CONTENT_SHINGLES:
+            content = frozenset()
+        entities = title_entities(record.get("title", ""))
+        keys = (canonical, title, minhash(title), content, minhash(content), entities)
+
+        found = self._by_url.get(canonical) if canonical else None
+        if found is None:
+            found = self._titles.find(title, keys[2], entities) or self._contents.find(content, keys[4])
+        return found, keys
+
+    def _index(self, keys: tuple, cluster: _Cluster) -> None:
+        canonical, title, title_sig, content, content_sig, entities = keys
+        if canonical:
+            self._by_url.setdefault(canonical, cluster)
+        self._titles.add(title, title_sig, cluster, entities)
+        self._contents.add(content, content_sig, cluster)
+
+    def cluster(self, records: list[dict]) -> list[dict]:
+        """
+        Returns: 이번 호출에서 새로 생긴 클러스터의 대표 레코드 목록 (입력 순서 유지).
+        중복 레코드는 대표 레코드의 `duplicates` 목록으로 링크되고 반환 목록에서 제외.
+        """
+        new_clusters: list[_Cluster] = []
+        linked_to_existing = 0
+
+        for record in records:
+            found, keys = self._match(record)
+            if found is None:
+                found = _Cluster(record)
+                new_clusters.append(found)
+            elif found.representative is not None:
+                # 이전 호출에서 확정된 클러스터 → 대표 레코드에 바로 링크
+                found.representative.setdefault("duplicates", []).append(_link(record))
+                linked_to_existing += 1
+            else:
+                found.members.append(record)
+            self._index(keys, found)
+
+        representatives: list[dict] = []
+        for cluster in new_clusters:
+            rep = max(cluster.members, key=_rank)
+            others = [_link(m) for m in cluster.members if m is not rep]
+            if others:
+                rep.setdefault("duplicates", []).extend(others)
+            cluster.representative = rep
+            representatives.append(rep)
+
+        removed = len(records) - len(representatives)
+        if removed:
+            log.info(
+                f"근접 중복 제거: {len(records)}건 → {len(representatives)}건 "
+                f"(클러스터 내 {removed - linked_to_existing}건, 기존 클러스터 링크 {linked_to_existing}건)"
+            )
+        return representatives
@@ -0,0 +1,361 @@
+"""
+SEC EDGAR Harvesters - 공유 요청 예산(10 req/s) 기반 공시 수집
+physical-ai-scout SKILL.md SEC 소스 구현체
+
+EdgarFullTextHarvester (Full-Text Search, efts.sec.gov)
+  - 키워드 × form type 전체 매트릭스를 쿼리 단위로 분할해 병렬 실행
+  - 쿼리별로 from= 오프셋 페이지네이션 (페이지당 100건, 전체 hit 소진까지)
+  - 모든 HTTP 요청이 하나의 TokenBucket(SEC_RATE_LIMIT_SEC)을 공유
+  - 재시도는 요청 단위 (429 / 5xx / 네트워크 오류만) — 다른 쿼리에 영향 없음
+  - 결과는 adsh(accession number) 기준 중복 제거
+
+EdgarSubmissionsPoller (기업별 submissions JSON, data.sec.gov)
+  - TARGET_COMPANIES → CIK 매핑을 1회 해석 후 data/cache/sec_cik_map.json 에 캐시
+  - 기업당 submissions JSON 1회 요청 (조건부 GET — 변경 없으면 304)
+  - 이미 본 accession number 인덱스(data/cache/sec_seen_accessions.json)로 신규 공시만 반환
+"""
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import requests
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
+
+from config import (
+    SEC_RATE_LIMIT_SEC,
+    SEC_MAX_WORKERS,
+    SEC_MAX_PAGES_PER_QUERY,
+    SEC_CIK_OVERRIDES,
+    SEC_CIK_MAP_PATH,
+    SEC_SEEN_ACCESSIONS_PATH,
+)
+from pipeline.http_cache import HttpValidatorCache
+from pipeline.ratelimit import TokenBucket
+
+log = logging.getLogger(__name__)
+
+# EDGAR Full-Text Search API (무료, 인증 불필요)
+EDGAR_SEARCH_URL = "https://efts.sec.gov/LATEST/search-index"
+EDGAR_HEADERS = {"User-Agent": "PASIS-Research research@lguplus.com"}
+EDGAR_PAGE_SIZE = 100  # efts 고정 페이지 크기
+EDGAR_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+EDGAR_SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik:0>10}.json"
+
+_CIK_UNRESOLVED_RETRY_DAYS = 30  # 미상장 기업 등 매핑 실패 시 재해석 주기
+_COMPANY_SUFFIXES = {
+    "inc", "corp", "corporation", "co", "com", "company", "ltd", "llc", "plc",
+    "holdings", "group", "the",
+}
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """네트워크 오류, 429, 5xx만 재시도. 그 외 4xx는 즉시 실패."""
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, requests.exceptions.RequestException)
+
+
+class _Unchanged(Exception):
+    """조건부 GET 결과 변경 없음 (304 또는 본문 해시 동일)."""
+
+
+def _load_json(path: Path, default: object) -> object:
+    if not path.exists():
+        return default
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        log.warning(f"캐시 로드 실패 ({path.name}): {e}")
+        return default
+
+
+def _save_json(path: Path, data: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _normalize_company(name: str) -> str:
+    """'Tesla, Inc.' → 'tesla', 'AMAZON COM INC' → 'amazon'."""
+    tokens = re.sub(r"[^a-z0-9 ]", " ", name.lower()).split()
+    while tokens and tokens[-1] in _COMPANY_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+class EdgarClient:
+    """EDGAR 공통 HTTP 클라이언트 — 공유 토큰 버킷 + 요청 단위 재시도 + 조건부 GET."""
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        cache: Optional[HttpValidatorCache] = None,
+    ) -> None:
+        self._bucket = bucket or TokenBucket.per_interval(SEC_RATE_LIMIT_SEC)
+        self._cache = cache
+        self._session = requests.Session()
+        self._session.headers.update(EDGAR_HEADERS)
+
+    @retry(
+        stop=stop_after_attempt(4),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+    )
+    def get_json(self, url: str, params: Optional[dict] = None, conditional: bool = True) -> dict:
+        """
+        GET → JSON. conditional=True 이고 캐시가 있으면 변경 없음 시 _Unchanged 발생.
+        검증자는 JSON 디코드 성공 후에만 기록.
+        """
+        request_url = requests.Request("GET", url, params=params).prepare().url
+        headers = (
+            self._cache.conditional_headers(request_url)
+            if conditional and self._cache else {}
+        )
+        self._bucket.acquire()
+        resp = self._session.get(request_url, headers=headers, timeout=15)
+
+        if conditional and self._cache:
+            if resp.status_code == 304 or (
+                resp.ok and self._cache.is_unchanged(request_url, resp.content)
+            ):
+                raise _Unchanged(request_url)
+        resp.raise_for_status()
+        data = resp.json()
+        if self._cache:
+            self._cache.update(request_url, resp.headers, resp.content)
+        return data
+
+
+class EdgarFullTextHarvester:
+    """EDGAR Full-Text Search 병렬 페이지네이션 수집기."""
+
+    def __init__(
+        self,
+        client: EdgarClient,
+        max_workers: int = SEC_MAX_WORKERS,
+        max_pages: int = SEC_MAX_PAGES_PER_QUERY,
+    ) -> None:
+        self._client = client
+        self._max_workers = max_workers
+        self._max_pages = max_pages
+
+    def search(
+        self,
+        keywords: list[str],
+        form_types: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> list[dict]:
+        """
+        키워드 × form type 매트릭스 전체 수집.
+        Returns: adsh 기준 중복 제거된 hit `_source` 목록
+        """
+        tasks = [(kw, form) for kw in keywords for form in form_types]
+        by_adsh: dict[str, dict] = {}
+        failed = 0
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(tasks) or 1),
+            thread_name_prefix="edgar-fts",
+        ) as executor:
+            futures = {
+                executor.submit(self._harvest_query, kw, form, start_date, end_date): (kw, form)
+                for kw, form in tasks
+            }
+            for future in as_completed(futures):
+                kw, form = futures[future]
+                try:
+                    sources = future.result()
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    failed += 1
+                    log.warning(f"SEC EDGAR 쿼리 실패 (keyword={kw}, form={form}): {e}")
+                    continue
+                for src in sources:
+                    adsh = src.get("adsh", "")
+                    if adsh and adsh not in by_adsh:
+                        by_adsh[adsh] = src
+
+        log.info(
+            f"SEC EDGAR Full-Text: {len(tasks)}개 쿼리 ({failed}개 실패) → "
+            f"고유 공시 {len(by_adsh)}건"
+        )
+        return list(by_adsh.values())
+
+    def _harvest_query(self, keyword: str, form_type: str, start_date: str, end_date: str) -> list[dict]:
+        """단일 (키워드, form) 쿼리의 전체 페이지 수집."""
+        sources: list[dict] = []
+        offset = 0
+        total_value = float("inf")
+
+        for _ in range(self._max_pages):
+            params = {
+                "q": f'"{keyword}"',
+                "forms": form_type,
+                "dateRange": "custom",
+                "startdt": start_date,
+                "enddt": end_date,
+            }
+            if offset:
+                params["from"] = offset
+            try:
+                data = self._client.get_json(EDGAR_SEARCH_URL, params=params)
+            except _Unchanged:
+                log.debug(f"SEC EDGAR 응답 변경 없음 (keyword={keyword}, form={form_type}, from={offset})")
+                if offset == 0:
+                    break  # 첫 페이지 불변 → 쿼리 결과 전체 불변
+                offset += EDGAR_PAGE_SIZE
+                if offset >= total_value:
+                    break
+                continue
+
+            hits = data.get("hits", {}).get("hits", [])
+            sources.extend(hit.get("_source", {}) for hit in hits)
+
+            total = data.get("hits", {}).get("total", {})
+            total_value = total.get("value", 0) if isinstance(total, dict) else int(total or 0)
+            offset += EDGAR_PAGE_SIZE
+            if not hits or offset >= total_value:
+                break
+
+        return sources
+
+
+class EdgarSubmissionsPoller:
+    """CIK 기반 기업별 submissions 증분 폴링 (로컬 accession 인덱스 유지)."""
+
+    def __init__(
+        self,
+        client: EdgarClient,
+        cik_map_path: Path = SEC_CIK_MAP_PATH,
+        seen_path: Path = SEC_SEEN_ACCESSIONS_PATH,
+        max_workers: int = SEC_MAX_WORKERS,
+    ) -> None:
+        self._client = client
+        self._cik_map_path = Path(cik_map_path)
+        self._seen_path = Path(seen_path)
+        self._max_workers = max_workers
+        self._seen: set[str] = set(_load_json(self._seen_path, []))
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    # ── CIK Resolution ─────────────────────────────────────────────────────
+
+    def resolve_ciks(self, companies: list[str]) -> dict[str, str]:
+        """
+        기업명 → CIK 매핑 (캐시 우선, 누락분만 company_tickers.json 1회 조회).
+        Returns: {기업명: CIK} — 해석 실패(미상장 등) 기업은 제외
+        """
+        cached: dict[str, dict] = _load_json(self._cik_map_path, {})
+        now = datetime.now(timezone.utc)
+        retry_before = (now - timedelta(days=_CIK_UNRESOLVED_RETRY_DAYS)).isoformat()
+
+        pending = []
+        for name in companies:
+            if name in SEC_CIK_OVERRIDES:
+                cached[name] = {"cik": SEC_CIK_OVERRIDES[name], "resolved_at": now.isoformat()}
+                continue
+            entry = cached.get(name)
+            if entry is None or (entry.get("cik") is None and entry.get("resolved_at", "") < retry_before):
+                pending.append(name)
+
+        if pending:
+            try:
+                tickers = self._client.get_json(EDGAR_COMPANY_TICKERS_URL, conditional=False)
+                by_title: dict[str, str] = {}
+                for row in tickers.values():
+                    by_title.setdefault(_normalize_company(row.get("title", "")), str(row.get("cik_str", "")))
+                for name in pending:
+                    cik = by_title.get(_normalize_company(name))
+                    cached[name] = {"cik": cik, "resolved_at": now.isoformat()}
+                    if cik is None:
+                        log.info(f"SEC CIK 매핑 없음 (미상장 추정): {name}")
+            except (requests.exceptions.RequestException, ValueError, AttributeError) as e:
+                log.warning(f"SEC CIK 매핑 조회 실패: {e}")
+
+        _save_json(self._cik_map_path, cached)
+        return {name: cached[name]["cik"] for name in companies if cached.get(name, {}).get("cik")}
+
+    # ── Polling ────────────────────────────────────────────────────────────
+
+    def poll(self, ciks: dict[str, str], form_types: list[str], since: str) -> list[dict]:
+        """
+        기업별 submissions JSON 1회씩 요청 → 미확인 accession 중 조건 충족 공시만 반환.
+        since: 'YYYY-MM-DD' (이 날짜 이후 제출분만)
+        """
+        filings: list[dict] = []
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(ciks) or 1),
+            thread_name_prefix="edgar-sub",
+        ) as executor:
+            futures = {
+                executor.submit(self._poll_company, cik, set(form_types), since): name
+                for name, cik in ciks.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    filings.extend(future.result())
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    log.warning(f"SEC submissions 폴링 실패 ({name}): {e}")
+
+        # 공동 제출 공시(여러 CIK)는 accession 기준 1건만 유지
+        filings = list({f["adsh"]: f for f in filings}.values())
+        log.info(f"SEC submissions 폴링: {len(ciks)}개 기업 → 신규 공시 {len(filings)}건")
+        return filings
+
+    def _poll_company(self, cik: str, form_types: set[str], since: str) -> list[dict]:
+        try:
+            data = self._client.get_json(EDGAR_SUBMISSIONS_URL.format(cik=cik))
+        except _Unchanged:
+            return []
+
+        recent = data.get("filings", {}).get("recent", {})
+        columns = ("accessionNumber", "filingDate", "form", "reportDate", "primaryDocDescription")
+        rows = zip(*(recent.get(col, []) for col in columns))
+
+        new_filings = []
+        for adsh, filing_date, form, report_date, description in rows:
+            if form not in form_types or filing_date < since:
+                continue
+            with self._lock:
+                if adsh in self._seen:
+                    continue
+            new_filings.append({
+                "cik": str(int(cik)),
+                "entity_name": data.get("name", ""),
+                "adsh": adsh,
+                "form_type": form,
+                "file_date": filing_date,
+                "period_of_report": report_date or filing_date,
+                "file_description": description,
+            })
+        return new_filings
+
+    def mark_seen(self, accession_numbers: list[str]) -> None:
+        """레코드 생성이 끝난 accession을 인덱스에 기록 (메모리 — 파일 기록은 save())."""
+        with self._lock:
+            self._seen.update(accession_numbers)
+            self._dirty = True
+
+    def save(self) -> None:
+        """accession 인덱스 파일 기록 (수집 레코드 DB 저장 후 호출 — 저장 전 중단 시 다음 실행에서 재수집)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = sorted(self._seen)
+            self._dirty = False
+        _save_json(self._seen_path, snapshot)
@@ -0,0 +1,213 @@
+"""
+Feed Fetcher - 동시 HTTP 다운로드 엔진
+RSS / Key Player 피드를 한 번에 병렬로 내려받아 feedparser에 bytes로 전달
+
+동작 원칙:
+  - Bounded thread pool: 전체 동시 요청 수 상한 (FEED_FETCH_MAX_WORKERS)
+  - Per-host cap: 동일 호스트(news.google.com 등) 동시 요청 수 제한
+  - Per-request timeout: 연결 + 본문 수신 전체 시간 기준
+  - Total deadline: 마감 시각 이후 미완료 요청은 실패로 처리
+  - Conditional GET: HttpValidatorCache 주입 시 304 / 본문 해시 동일 → not_modified
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Optional
+from pathlib import Path
+from urllib.parse import urlparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import requests
+
+from config import (
+    FEED_FETCH_MAX_WORKERS,
+    FEED_FETCH_PER_HOST_LIMIT,
+    FEED_FETCH_TIMEOUT_SEC,
+    FEED_FETCH_DEADLINE_SEC,
+    FEED_USER_AGENT,
+)
+from pipeline.http_cache import HttpValidatorCache
+
+log = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _lower_headers(headers: dict) -> dict:
+    """feedparser는 소문자 헤더 키(content-type 등)를 기대함."""
+    return {k.lower(): v for k, v in headers.items()}
+
+
+@dataclass
+class FetchResult:
+    """단일 URL 다운로드 결과."""
+    url: str
+    content: Optional[bytes] = None
+    status: Optional[int] = None
+    headers: dict = field(default_factory=dict)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    not_modified: bool = False  # 304 또는 본문 해시 동일 → 파싱 불필요
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and (self.content is not None or self.not_modified)
+
+
+class FeedFetcher:
+    """
+    피드 URL 목록을 병렬 다운로드하는 경량 fetch 엔진.
+    requests 기반 thread pool — 스레드마다 별도 Session 사용.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = FEED_FETCH_MAX_WORKERS,
+        per_host_limit: int = FEED_FETCH_PER_HOST_LIMIT,
+        timeout: float = FEED_FETCH_TIMEOUT_SEC,
+        deadline: float = FEED_FETCH_DEADLINE_SEC,
+        headers: Optional[dict] = None,
+        cache: Optional[HttpValidatorCache] = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self._per_host_limit = per_host_limit
+        self._timeout = timeout
+        self._deadline = deadline
+        self._headers = {"User-Agent": FEED_USER_AGENT, **(headers or {})}
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cache = cache
+
+    # ── Public API ─────────────────────────────────────────────────────────
+
+    def fetch_all(self, urls: list[str]) -> dict[str, FetchResult]:
+        """
+        URL 목록을 동시에 다운로드.
+        Returns: {url: FetchResult} — 입력 URL 전부에 대해 결과 보장 (중복 URL은 1회만 요청)
+        """
+        unique_urls = list(dict.fromkeys(u for u in urls if u))
+        if not unique_urls:
+            return {}
+
+        deadline_at = time.monotonic() + self._deadline
+        results: dict[str, FetchResult] = {}
+        started = time.monotonic()
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(unique_urls)),
+            thread_name_prefix="feed-fetch",
+        )
+        try:
+            futures = {
+                executor.submit(self._fetch_one, url, deadline_at): url
+                for url in unique_urls
+            }
+            done, not_done = wait(futures, timeout=self._deadline)
+
+            for future in done:
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    results[url] = FetchResult(url=url, error=str(e))
+
+            for future in not_done:
+                url = futures[future]
+                future.cancel()
+                results[url] = FetchResult(url=url, error="total deadline exceeded")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        failed = sum(1 for r in results.values() if not r.ok)
+        unchanged = sum(1 for r in results.values() if r.not_modified)
+        log.info(
+            f"피드 다운로드 완료: {len(results) - failed}/{len(results)}건 성공, "
+            f"변경 없음 {unchanged}건 ({time.monotonic() - started:.1f}s)"
+        )
+        return results
+
+    # ── Internals ──────────────────────────────────────────────────────────
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._headers)
+            self._local.session = session
+        return session
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self._per_host_limit)
+                self._host_slots[host] = slot
+            return slot
+
+    def _fetch_one(
+        self,
+        url: str,
+        deadline_at: float,
+    ) -> FetchResult:
+        slot = self._host_slot(url)
+        wait_budget = deadline_at - time.monotonic()
+        if wait_budget <= 0 or not slot.acquire(timeout=wait_budget):
+            return FetchResult(url=url, error="host slot wait exceeded deadline")
+
+        start = time.monotonic()
+        try:
+            # 요청별 타임아웃은 남은 전체 마감 시간을 넘지 않도록 조정
+            budget = min(self._timeout, deadline_at - start)
+            if budget <= 0:
+                return FetchResult(url=url, error="total deadline exceeded")
+
+            conditional = self._cache.conditional_headers(url) if self._cache else {}
+            resp = self._session().get(
+                url, headers=conditional, timeout=budget, stream=True,
+            )
+            with resp:
+                if resp.status_code == 304:
+                    return FetchResult(
+                        url=url,
+                        status=304,
+                        headers=_lower_headers(resp.headers),
+                        elapsed=time.monotonic() - start,
+                        not_modified=True,
+                    )
+                if resp.status_code >= 400:
+                    return FetchResult(
+                        url=url,
+                        status=resp.status_code,
+                        headers=_lower_headers(resp.headers),
+                        error=f"HTTP {resp.status_code}",
+                        elapsed=time.monotonic() - start,
+                    )
+                chunks: list[bytes] = []
+                for chunk in resp.iter_content(chunk_size=_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    if time.monotonic() - start > budget:
+                        return FetchResult(
+                            url=url,
+                            status=resp.status_code,
+                            error=f"request timeout ({budget:.0f}s)",
+                            elapsed=time.monotonic() - start,
+                        )
+                content = b"".join(chunks)
+                return FetchResult(
+                    url=url,
+                    content=content,
+                    status=resp.status_code,
+                    headers=_lower_headers(resp.headers),
+                    elapsed=time.monotonic() - start,
+                    not_modified=bool(self._cache and self._cache.is_unchanged(url, content)),
+                )
+        except requests.exceptions.RequestException as e:
+            return FetchResult(url=url, error=str(e), elapsed=time.monotonic() - start)
+        finally:
+            slot.release()
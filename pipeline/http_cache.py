@@ -0,0 +1,105 @@
+"""
+HTTP Validator Cache - 조건부 GET (ETag / Last-Modified) 캐시
+URL별 검증자와 본문 해시를 data/cache/http_validators.json 에 영속화
+
+사용 흐름:
+  1. conditional_headers(url) → If-None-Match / If-Modified-Since 헤더 생성
+  2. 304 응답 → 변경 없음 (본문 다운로드·파싱 생략)
+  3. 200 응답 → is_unchanged(url, body) 로 본문 해시 비교 (검증자 미지원 서버 대응)
+  4. 파싱 성공 후 update(url, headers, body) (메모리)
+  5. 수집 레코드 DB 저장 후 save() — 저장 전 중단 시 다음 실행이 304 로 건너뛰지 않고 다시 수집
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import HTTP_CACHE_PATH
+
+log = logging.getLogger(__name__)
+
+
+def _body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class HttpValidatorCache:
+    """URL 키 기반 HTTP 검증자 캐시 (스레드 안전, JSON 파일 영속화)."""
+
+    def __init__(self, path: Path = HTTP_CACHE_PATH) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict]:
+        if not self._path.exists():
+            return {}
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            log.warning(f"HTTP 캐시 로드 실패, 빈 캐시로 시작: {e}")
+            return {}
+
+    # ── Request side ───────────────────────────────────────────────────────
+
+    def conditional_headers(self, url: str) -> dict:
+        """저장된 검증자로 조건부 요청 헤더 생성."""
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    # ── Response side ──────────────────────────────────────────────────────
+
+    def is_unchanged(self, url: str, content: bytes) -> bool:
+        """본문 해시가 직전 성공 응답과 동일한지 확인."""
+        with self._lock:
+            entry = self._entries.get(url)
+        return bool(entry) and entry.get("body_sha256") == _body_hash(content)
+
+    def update(self, url: str, headers: dict, content: Optional[bytes]) -> None:
+        """응답 검증자 + 본문 해시 기록. headers 키는 대소문자 무관."""
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        with self._lock:
+            entry = dict(self._entries.get(url, {}))
+            if lowered.get("etag"):
+                entry["etag"] = lowered["etag"]
+            if lowered.get("last-modified"):
+                entry["last_modified"] = lowered["last-modified"]
+            if content is not None:
+                entry["body_sha256"] = _body_hash(content)
+            entry["checked_at"] = datetime.now(timezone.utc).isoformat()
+            self._entries[url] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """변경분이 있을 때만 원자적 파일 교체로 저장."""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self._entries)
+            self._dirty = False
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            log.warning(f"HTTP 캐시 저장 실패: {e}")
@@ -0,0 +1,198 @@
+"""
+JSONL Record Sink - 압축 append-only 스트리밍 저장 + 회전
+data/raw, data/processed 레코드를 생성 즉시 기록하고 스트리밍으로 다시 읽기
+
+파일 형식:
+  - 1줄 = 레코드 1건 (JSON Lines)
+  - flush 단위로 독립 압축 멤버(gzip member / zstd frame)를 append
+    → 프로세스가 중간에 죽어도 마지막 flush 까지의 레코드는 온전히 복구 가능
+  - 압축: gzip(기본, 표준 라이브러리) | zstd(zstandard 설치 시) | none
+  - 회전: 파일 크기(RECORD_SINK_MAX_BYTES) 또는 경과 시간(RECORD_SINK_MAX_AGE_SEC) 초과 시 새 part 파일
+
+파일명: {YYYYMMDD_HHMMSS}_{part:03d}_{kind}.jsonl[.gz|.zst]
+  예) 20260301_090000_000_scout.jsonl.gz, 20260301_090000_001_scout.jsonl.gz
+"""
+import glob
+import gzip
+import io
+import json
+import logging
+import time
+import zlib
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import (
+    RECORD_SINK_COMPRESSION,
+    RECORD_SINK_MAX_BYTES,
+    RECORD_SINK_MAX_AGE_SEC,
+    RECORD_SINK_FLUSH_EVERY,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+log = logging.getLogger(__name__)
+
+_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst", "none": ""}
+
+
+def _resolve_compression(compression: str) -> str:
+    if compression == "zstd" and zstandard is None:
+        log.warning("zstandard 패키지 미설치 — gzip 압축으로 대체. pip install zstandard")
+        return "gzip"
+    if compression not in _EXTENSIONS:
+        log.warning(f"알 수 없는 압축 방식 '{compression}' — gzip 사용")
+        return "gzip"
+    return compression
+
+
+class JsonlSink:
+    """
+    레코드 스트리밍 writer.
+    write()는 버퍼에 쌓고 flush_every 건마다 압축 멤버 1개로 파일에 append.
+    with 문 사용 시 종료 시점에 잔여 버퍼 flush.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        kind: str,
+        compression: str = RECORD_SINK_COMPRESSION,
+        max_bytes: int = RECORD_SINK_MAX_BYTES,
+        max_age_sec: float = RECORD_SINK_MAX_AGE_SEC,
+        flush_every: int = RECORD_SINK_FLUSH_EVERY,
+    ) -> None:
+        self._directory = Path(directory)
+        self._kind = kind
+        self._compression = _resolve_compression(compression)
+        self._max_bytes = max_bytes
+        self._max_age_sec = max_age_sec
+        self._flush_every = max(1, flush_every)
+
+        self._stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        self._part = -1
+        self._path: Optional[Path] = None
+        self._opened_at = 0.0
+        self._buffer: list[str] = []
+        self._written = 0
+        self.paths: list[Path] = []
+
+    # ── Context manager ────────────────────────────────────────────────────
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ── Write path ─────────────────────────────────────────────────────────
+
+    def write(self, record: dict) -> None:
+        self._buffer.append(json.dumps(record, ensure_ascii=False, default=str))
+        if len(self._buffer) >= self._flush_every:
+            self.flush()
+
+    def write_many(self, records: Iterable[dict]) -> None:
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """버퍼를 압축 멤버 1개로 append. 회전 조건 충족 시 새 파일로 전환."""
+        if not self._buffer:
+            return
+        payload = ("\n".join(self._buffer) + "\n").encode("utf-8")
+        count = len(self._buffer)
+        self._buffer = []
+
+        if self._needs_rotation():
+            self._rotate()
+        with open(self._path, "ab") as f:
+            f.write(self._compress(payload))
+        self._written += count
+
+    def close(self) -> None:
+        self.flush()
+        if self._written:
+            log.info(f"레코드 저장 완료: {self._written}건 → {', '.join(p.name for p in self.paths)}")
+
+    # ── Internals ──────────────────────────────────────────────────────────
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self._compression == "gzip":
+            return gzip.compress(payload, compresslevel=6)
+        if self._compression == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(payload)
+        return payload
+
+    def _needs_rotation(self) -> bool:
+        if self._path is None:
+            return True
+        if self._path.exists() and self._path.stat().st_size >= self._max_bytes:
+            return True
+        return time.monotonic() - self._opened_at >= self._max_age_sec
+
+    def _rotate(self) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._part += 1
+        ext = _EXTENSIONS[self._compression]
+        self._path = self._directory / f"{self._stamp}_{self._part:03d}_{self._kind}.jsonl{ext}"
+        self._opened_at = time.monotonic()
+        self.paths.append(self._path)
+
+
+# ── Read path ─────────────────────────────────────────────────────────────────
+
+def _open_text(path: Path) -> io.TextIOBase:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"zstd 파일 읽기에는 zstandard 패키지 필요: {path}")
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def read_records(path: Path) -> Iterator[dict]:
+    """
+    단일 파일 스트리밍 읽기.
+    JSONL(.jsonl / .gz / .zst)은 1줄씩, 구형 JSON 배열(.json)은 전체 로드 후 순회.
+    중단된 마지막 압축 멤버(크래시 흔적)는 경고 후 무시.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        yield from (data if isinstance(data, list) else [data])
+        return
+
+    try:
+        with _open_text(path) as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    log.warning(f"손상된 JSONL 라인 스킵: {path.name}:{line_no}")
+    except (EOFError, gzip.BadGzipFile, zlib.error) as e:
+        log.warning(f"파일 끝 손상 (중단된 기록) — 이전 레코드까지만 사용: {path.name} ({e})")
+
+
+def iter_records(patterns: Iterable[str]) -> Iterator[dict]:
+    """경로 또는 glob 패턴 목록의 파일들을 이름순으로 스트리밍."""
+    paths: list[str] = []
+    for pattern in patterns:
+        matched = sorted(glob.glob(str(pattern)))
+        paths.extend(matched if matched else [str(pattern)])
+    for p in dict.fromkeys(paths):
+        yield from read_records(Path(p))
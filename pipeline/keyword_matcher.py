@@ -0,0 +1,107 @@
+"""
+Keyword Matcher - Aho-Corasick 다중 패턴 매칭
+config.py 키워드 택소노미를 1회 컴파일 → 텍스트 1회 스캔으로 전체 키워드 히트 산출
+
+용도:
+  - 관련성 필터 (STRATEGIC_KEYWORDS 히트 여부)
+  - 뉴스 카테고리 분류 (NEWS_CATEGORY_KEYWORDS 그룹별 히트, 우선순위 순)
+  - 레코드 키워드 태그 (matched_keywords)
+
+매칭 규칙은 기존 `kw.lower() in text.lower()` 와 동일 (대소문자 무시 부분 문자열).
+스캔 비용은 텍스트 길이에 비례하며 키워드 수와 무관 — 수천 개 키워드로 확장 가능.
+"""
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import STRATEGIC_KEYWORDS, NEWS_CATEGORY_KEYWORDS
+
+# STRATEGIC_KEYWORDS 그룹명 (카테고리 그룹명과 충돌하지 않도록 예약)
+STRATEGIC_GROUP = "__strategic__"
+DEFAULT_CATEGORY = "Industry News"
+
+
+class KeywordMatcher:
+    """
+    (group, keyword) 쌍으로 구성된 Aho-Corasick 오토마톤.
+    동일 키워드가 여러 그룹에 속할 수 있음 (예: "M&A" → 전략 키워드 + Investment).
+    """
+
+    def __init__(self, groups: dict[str, list[str]]) -> None:
+        # 노드별 전이 테이블 / 실패 링크 / 출력(패턴 id 목록)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        self._patterns: list[tuple[str, str]] = []  # id → (group, 원문 키워드)
+
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                if keyword:
+                    self._add(keyword.lower(), len(self._patterns))
+                    self._patterns.append((group, keyword))
+        self._build_failure_links()
+
+    def _add(self, pattern: str, pattern_id: int) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(pattern_id)
+
+    def _build_failure_links(self) -> None:
+        """BFS로 실패 링크 구성 + 출력 집합을 실패 링크 따라 미리 병합."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def scan(self, text: str) -> dict[str, set[str]]:
+        """
+        텍스트 1회 스캔.
+        Returns: {group: 매칭된 원문 키워드 집합} — 매칭 없는 그룹은 키 없음
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        hit_ids: set[int] = set()
+        node = 0
+        for ch in text.lower():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                hit_ids.update(out[node])
+
+        hits: dict[str, set[str]] = {}
+        for pattern_id in hit_ids:
+            group, keyword = self._patterns[pattern_id]
+            hits.setdefault(group, set()).add(keyword)
+        return hits
+
+
+@lru_cache(maxsize=8)
+def get_matcher(keywords: tuple[str, ...] = tuple(STRATEGIC_KEYWORDS)) -> KeywordMatcher:
+    """전략 키워드 + 뉴스 카테고리 택소노미 매처 (키워드 목록별 1회 컴파일)."""
+    return KeywordMatcher({STRATEGIC_GROUP: list(keywords), **NEWS_CATEGORY_KEYWORDS})
+
+
+def category_from_hits(hits: dict[str, set[str]]) -> str:
+    """NEWS_CATEGORY_KEYWORDS 선언 순서(우선순위)대로 첫 매칭 카테고리 반환."""
+    for category in NEWS_CATEGORY_KEYWORDS:
+        if category in hits:
+            return category
+    return DEFAULT_CATEGORY
@@ -0,0 +1,118 @@
+"""
+LLM Response Cache - Claude 응답 내용 주소 기반 영속 캐시 (SQLite)
+같은 요청(모델 + 프롬프트 버전 + 정규화된 입력)은 재실행·재수집 시에도 API 호출 없이 재사용
+
+키:   sha256(prompt_version + messages.create 파라미터 정규 JSON)
+      파라미터에는 모델·max_tokens·system·messages 가 모두 포함되므로 템플릿 문구가 바뀌면 키도 바뀜.
+      신호 분석 입력은 title/raw_content/scope/publisher/published_at 만 포함 (scraped_at 등 수집 시점 값 제외).
+값:   Message JSON (zlib 압축)
+정리: 총 크기 LLM_CACHE_MAX_BYTES 초과 시 마지막 접근 시각 오래된 순으로 90% 까지 삭제 (LRU)
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import LLM_CACHE_PATH, LLM_CACHE_MAX_BYTES
+
+log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key          TEXT PRIMARY KEY,
+    model        TEXT,
+    value        BLOB NOT NULL,
+    size         INTEGER NOT NULL,
+    created_at   REAL NOT NULL,
+    last_access  REAL NOT NULL,
+    hits         INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access);
+"""
+
+
+def request_key(params: dict, prompt_version: str) -> str:
+    """messages.create 파라미터 + 프롬프트 버전의 정규 JSON 해시."""
+    canonical = json.dumps(
+        {"prompt_version": prompt_version, "params": params},
+        ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LlmResponseCache:
+    """스레드 안전 SQLite 응답 캐시. get/put 은 Message 객체 단위."""
+
+    def __init__(self, path: Path = LLM_CACHE_PATH, max_bytes: int = LLM_CACHE_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.stats = {"hits": 0, "misses": 0, "evicted": 0}
+
+    def get(self, key: str) -> Optional[object]:
+        from anthropic.types import Message
+
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ?, hits = hits + 1 WHERE key = ?", (time.time(), key),
+            )
+            self.stats["hits"] += 1
+        return Message.model_validate_json(zlib.decompress(row[0]))
+
+    def put(self, key: str, message: object) -> None:
+        value = zlib.compress(message.model_dump_json().encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, value, size, created_at, last_access, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, getattr(message, "model", None), value, len(value), now, now),
+            )
+            self._total_bytes += len(value) - (previous[0] if previous else 0)
+            if self._total_bytes > self._max_bytes:
+                self._evict(int(self._max_bytes * 0.9))
+
+    def delete(self, key: str) -> None:
+        """파싱 불가 등 재사용하면 안 되는 응답 제거."""
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= row[0]
+
+    def _evict(self, target_bytes: int) -> None:
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall()
+        victims = []
+        for key, size in rows:
+            if self._total_bytes <= target_bytes:
+                break
+            victims.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.stats["evicted"] += len(victims)
+        log.info(f"LLM 캐시 정리: {len(victims)}건 삭제 (LRU), 현재 {self._total_bytes / 1e6:.1f}MB")
+
+    def summary(self) -> str:
+        total = self.stats["hits"] + self.stats["misses"]
+        rate = self.stats["hits"] / total if total else 0.0
+        return (
+            f"hit {self.stats['hits']} / miss {self.stats['misses']} ({rate:.0%}), "
+            f"evicted {self.stats['evicted']}, {self._total_bytes / 1e6:.1f}MB"
+        )
@@ -0,0 +1,136 @@
+"""
+LLM Call Ledger - Claude 호출 1건당 비용·지연 원장 (llm_call_ledger 테이블)
+신호 분석·repair·주간/월간 리포트 호출을 모두 기록 → 신호당 비용, 주별 비용, p50/p95 지연, 잘림률 집계
+
+행 (호출 1건):
+  run_id · purpose · model · input/output/cache_write/cache_read 토큰 · latency_ms(재시도 대기 포함)
+  · retries · stop_reason(실패 호출은 "error") · signal_count · cached · batch · cost_usd
+비용: CLAUDE_PRICING_PER_MTOK (모델 ID 접두어 매칭) × 토큰, Message Batch 는 CLAUDE_BATCH_DISCOUNT 배율,
+      LLM 응답 캐시 적중은 API 미호출이므로 0.
+기록: 메모리 버퍼 → LLM_LEDGER_FLUSH_ROWS 도달 또는 flush() 시 DB 일괄 INSERT.
+      원장 기록 실패는 경고만 남기고 분석 흐름에 영향 없음.
+"""
+import logging
+import threading
+import uuid
+from datetime import datetime
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import (
+    LLM_LEDGER_ENABLED,
+    LLM_LEDGER_FLUSH_ROWS,
+    CLAUDE_PRICING_PER_MTOK,
+    CLAUDE_BATCH_DISCOUNT,
+)
+
+log = logging.getLogger(__name__)
+
+_TOKEN_FIELDS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+_PRICE_FIELDS = {
+    "input_tokens": "input",
+    "output_tokens": "output",
+    "cache_creation_input_tokens": "cache_write",
+    "cache_read_input_tokens": "cache_read",
+}
+
+
+def _pricing(model: str) -> Optional[dict[str, float]]:
+    """가장 긴 접두어가 일치하는 단가표 (미등록 모델은 None → 비용 0 + 경고)."""
+    matches = [prefix for prefix in CLAUDE_PRICING_PER_MTOK if (model or "").startswith(prefix)]
+    return CLAUDE_PRICING_PER_MTOK[max(matches, key=len)] if matches else None
+
+
+def call_cost(model: str, tokens: dict[str, int], batch: bool = False) -> float:
+    """호출 1건 USD 비용."""
+    prices = _pricing(model)
+    if prices is None:
+        return 0.0
+    cost = sum(tokens.get(field, 0) * prices[price] for field, price in _PRICE_FIELDS.items()) / 1_000_000
+    return round(cost * (CLAUDE_BATCH_DISCOUNT if batch else 1.0), 6)
+
+
+class CallLedger:
+    """스레드 안전 호출 원장 버퍼. 한 StrategicAnalyzer(= 실행 1회) 가 run_id 하나를 공유."""
+
+    def __init__(
+        self,
+        run_id: Optional[str] = None,
+        enabled: bool = LLM_LEDGER_ENABLED,
+        flush_rows: int = LLM_LEDGER_FLUSH_ROWS,
+    ) -> None:
+        self.run_id = run_id or str(uuid.uuid4())
+        self._enabled = enabled
+        self._flush_rows = max(1, flush_rows)
+        self._rows: list[dict] = []
+        self._lock = threading.Lock()
+        self._table_ready = False
+        self._unpriced: set[str] = set()
+
+    def record(
+        self,
+        purpose: str,
+        model: str,
+        tokens: Optional[dict[str, int]] = None,
+        latency: Optional[float] = None,
+        retries: int = 0,
+        stop_reason: Optional[str] = None,
+        signal_count: int = 0,
+        cached: bool = False,
+        batch: bool = False,
+    ) -> None:
+        """
+        호출 1건 기록. tokens: usage 4종 (없으면 0), latency: 초 (Message Batch 는 None).
+        cached=True 는 비용 0 으로 기록 (토큰은 원 응답 값 유지 → 캐시 절감분 추정 가능).
+        """
+        if not self._enabled:
+            return
+        tokens = tokens or {}
+        if not cached and _pricing(model) is None and model not in self._unpriced:
+            self._unpriced.add(model)
+            log.warning(f"CLAUDE_PRICING_PER_MTOK 에 없는 모델 — 비용 0 으로 기록: {model}")
+        row = {
+            "run_id": self.run_id,
+            "purpose": purpose,
+            "model": model,
+            **{field: int(tokens.get(field, 0) or 0) for field in _TOKEN_FIELDS},
+            "latency_ms": int(latency * 1000) if latency is not None else None,
+            "retries": retries,
+            "stop_reason": stop_reason,
+            "signal_count": signal_count,
+            "cached": cached,
+            "batch": batch,
+            "cost_usd": 0.0 if cached else call_cost(model, tokens, batch),
+            "created_at": datetime.utcnow(),
+        }
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self._flush_rows
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """버퍼 행 DB 일괄 기록. Returns: 기록 행 수 (실패 시 0, 버퍼는 비움)."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return 0
+
+        from sqlalchemy import insert
+        from database.init_db import get_engine, get_session
+        from database.models import LlmCallLedger
+
+        try:
+            if not self._table_ready:
+                LlmCallLedger.__table__.create(get_engine(), checkfirst=True)
+                self._table_ready = True
+            with get_session() as session:
+                session.execute(insert(LlmCallLedger), rows)
+        except Exception as e:
+            log.warning(f"LLM 호출 원장 기록 실패 ({len(rows)}건 유실): {e}")
+            return 0
+        log.debug(f"LLM 호출 원장 기록: {len(rows)}건 (run_id={self.run_id})")
+        return len(rows)
@@ -0,0 +1,137 @@
+"""
+Message Batch Runner - Claude Message Batches API 기반 대량 분석 실행
+지연 무관·비용 우선 작업(주간 실행, 백필)용. 실시간 호출 대비 비용 50%.
+
+상태 파일 (CLAUDE_BATCH_STATE_DIR):
+  {batch_id}.json               배치 메타 (제출 시각, 요청 수)
+  {batch_id}.signals.jsonl.gz   제출한 원본 신호 (custom_id = event_id)
+→ 프로세스가 재시작돼도 pending_batch_ids() 로 미완료 배치를 찾아 폴링 재개 후 event_id 로 병합.
+결과 병합이 끝나면 complete() 로 상태 파일 삭제.
+대기 상한(CLAUDE_BATCH_MAX_WAIT_SEC)은 runner(실행 1회) 전체 기준. 초과 시 제출 상태만 남기고 종료 → 다음 실행에서 수집
+(GitHub Actions: 상태 디렉터리를 actions/cache 로 다음 실행에 전달, 대기 상한은 분석 단계 제한 안쪽으로 설정).
+"""
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import (
+    CLAUDE_BATCH_STATE_DIR,
+    CLAUDE_BATCH_POLL_SEC,
+    CLAUDE_BATCH_MAX_WAIT_SEC,
+)
+from pipeline.jsonl_sink import read_records
+
+log = logging.getLogger(__name__)
+
+_META_SUFFIX = ".json"
+_SIGNALS_SUFFIX = ".signals.jsonl.gz"
+
+
+class BatchWaitTimeout(Exception):
+    """최대 대기 시간 내 배치 미완료 — 상태 파일은 유지, 다음 실행에서 재개."""
+
+
+class MessageBatchRunner:
+    """Message Batch 제출 · 상태 영속 · 폴링 · 결과 수집."""
+
+    def __init__(
+        self,
+        client: object,
+        state_dir: Path = CLAUDE_BATCH_STATE_DIR,
+        poll_interval: float = CLAUDE_BATCH_POLL_SEC,
+        max_wait: float = CLAUDE_BATCH_MAX_WAIT_SEC,
+    ) -> None:
+        self._client = client
+        self._state_dir = Path(state_dir)
+        self._poll_interval = poll_interval
+        # 대기 상한은 실행(runner) 전체 기준 — 재개 배치 + 신규 배치 폴링 합계
+        self._deadline = time.monotonic() + max_wait
+
+    # ── State ──────────────────────────────────────────────────────────────
+
+    def pending_batch_ids(self) -> list[str]:
+        """이전 실행에서 제출 후 결과 병합이 끝나지 않은 배치 (제출 순)."""
+        if not self._state_dir.exists():
+            return []
+        metas = sorted(self._state_dir.glob(f"*{_META_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+        return [p.name[: -len(_META_SUFFIX)] for p in metas]
+
+    def load_signals(self, batch_id: str) -> dict[str, dict]:
+        """{custom_id(event_id): 원본 신호} — 제출 순서 유지."""
+        path = self._state_dir / f"{batch_id}{_SIGNALS_SUFFIX}"
+        return {record["event_id"]: record for record in read_records(path)}
+
+    def complete(self, batch_id: str) -> None:
+        for suffix in (_META_SUFFIX, _SIGNALS_SUFFIX):
+            (self._state_dir / f"{batch_id}{suffix}").unlink(missing_ok=True)
+
+    # ── Submit ─────────────────────────────────────────────────────────────
+
+    def submit(self, requests: list[tuple[str, dict]], signals: dict[str, dict]) -> str:
+        """
+        requests: [(custom_id, messages.create 파라미터)], signals: {custom_id: 원본 신호}
+        신호 파일을 먼저 기록한 뒤 배치 생성 → batch_id 이름으로 확정.
+        """
+        self._state_dir.mkdir(parents=True, exist_ok=True)
+        staging = self._state_dir / f"staging_{os.getpid()}{_SIGNALS_SUFFIX}.tmp"
+        with gzip.open(staging, "wt", encoding="utf-8") as f:
+            for signal in signals.values():
+                f.write(json.dumps(signal, ensure_ascii=False, default=str) + "\n")
+
+        try:
+            batch = self._client.messages.batches.create(
+                requests=[{"custom_id": custom_id, "params": params} for custom_id, params in requests],
+            )
+        except Exception:
+            staging.unlink(missing_ok=True)
+            raise
+
+        os.replace(staging, self._state_dir / f"{batch.id}{_SIGNALS_SUFFIX}")
+        meta = {
+            "batch_id": batch.id,
+            "submitted_at": datetime.now(timezone.utc).isoformat(),
+            "request_count": len(requests),
+        }
+        (self._state_dir / f"{batch.id}{_META_SUFFIX}").write_text(json.dumps(meta), encoding="utf-8")
+        log.info(f"Message Batch 제출: {batch.id} ({len(requests)}건)")
+        return batch.id
+
+    # ── Poll / Results ─────────────────────────────────────────────────────
+
+    def wait(self, batch_id: str) -> dict[str, Optional[object]]:
+        """
+        processing_status == "ended" 까지 폴링 후 결과 수집 (이번 실행 대기 상한까지).
+        Returns: {custom_id: Message(성공) | None(errored/canceled/expired)}
+        Raises: BatchWaitTimeout — 실행 대기 상한(max_wait) 초과 (상태 파일 유지)
+        """
+        while True:
+            batch = self._client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                break
+            if time.monotonic() >= self._deadline:
+                raise BatchWaitTimeout(f"{batch_id}: 대기 상한 도달, 상태={batch.processing_status}")
+            counts = batch.request_counts
+            log.info(
+                f"Message Batch 대기: {batch_id} (처리 중 {counts.processing}건, "
+                f"완료 {counts.succeeded + counts.errored}건)"
+            )
+            time.sleep(max(0.0, min(self._poll_interval, self._deadline - time.monotonic())))
+
+        results: dict[str, Optional[object]] = {}
+        for item in self._client.messages.batches.results(batch_id):
+            if item.result.type == "succeeded":
+                results[item.custom_id] = item.result.message
+            else:
+                results[item.custom_id] = None
+                log.warning(f"배치 요청 실패: {item.custom_id} ({item.result.type})")
+        succeeded = sum(1 for m in results.values() if m is not None)
+        log.info(f"Message Batch 완료: {batch_id} (성공 {succeeded}/{len(results)}건)")
+        return results
@@ -0,0 +1,162 @@
+"""
+Rate Limiting Primitives
+외부 API 정책 준수를 위한 요청 단위 속도 제한 (스레드 안전)
+
+  - TokenBucket: 초당 rate개 토큰 보충, capacity까지 버스트 허용
+    arXiv  → rate=1/3, capacity=1  (1 req / 3 sec)
+    EDGAR  → rate=10,  capacity=10 (10 req / sec)
+  - AdaptiveConcurrencyLimiter: 동시 요청 수 상한을 응답 기반으로 조절 (AIMD)
+    Claude API → anthropic-ratelimit-* 헤더 여유분 기반 증감, 429/529 시 절반 감소 + retry-after 동안 일시 정지
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Mapping, Optional
+
+log = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    요청 직전에 acquire()를 호출하는 블로킹 토큰 버킷.
+    여러 스레드/샤드가 하나의 버킷을 공유하면 전체 요청률이 rate 이하로 유지됨.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate는 양수여야 합니다: {rate}")
+        self._rate = rate
+        self._capacity = max(capacity, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_interval(cls, interval_sec: float, burst: float = 1.0) -> "TokenBucket":
+        """'N초당 1회' 형식 설정값(ARXIV_RATE_LIMIT_SEC 등)으로 생성."""
+        return cls(rate=1.0 / interval_sec, capacity=burst)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 확보까지 대기.
+        Returns: 실제 대기한 시간(초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                shortfall = (tokens - self._tokens) / self._rate
+            time.sleep(shortfall)
+            waited += shortfall
+
+
+# Claude API 응답 헤더: (limit, remaining) 쌍
+_RATELIMIT_HEADER_PAIRS = [
+    ("anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-remaining"),
+    ("anthropic-ratelimit-input-tokens-limit", "anthropic-ratelimit-input-tokens-remaining"),
+    ("anthropic-ratelimit-output-tokens-limit", "anthropic-ratelimit-output-tokens-remaining"),
+    ("anthropic-ratelimit-tokens-limit", "anthropic-ratelimit-tokens-remaining"),
+]
+
+
+def headroom_from_headers(headers: Mapping[str, str]) -> Optional[float]:
+    """rate limit 헤더의 최소 잔여 비율 (0.0~1.0). 헤더가 없으면 None."""
+    ratios = []
+    for limit_key, remaining_key in _RATELIMIT_HEADER_PAIRS:
+        try:
+            limit = float(headers[limit_key])
+            remaining = float(headers[remaining_key])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if limit > 0:
+            ratios.append(max(0.0, remaining / limit))
+    return min(ratios) if ratios else None
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    응답 기반 동시성 제한 (AIMD).
+      - 성공 + 헤더 여유분 ≥ high_watermark (또는 헤더 없음): 상한 += 1/상한 (RTT 당 약 +1)
+      - 성공 + 여유분 < low_watermark: 상한 -= 1
+      - 429/529 (on_overload): 상한 절반 + retry-after 동안 신규 요청 정지
+    여러 스레드가 slot() 으로 감싸 호출.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 32,
+        low_watermark: float = 0.1,
+        high_watermark: float = 0.5,
+        default_backoff_sec: float = 5.0,
+    ) -> None:
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._limit = float(min(max(initial, self._minimum), self._maximum))
+        self._low = low_watermark
+        self._high = high_watermark
+        self._default_backoff = default_backoff_sec
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._cond:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                self._cond.wait(timeout=wait if wait > 0 else None)
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def on_success(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        headroom = headroom_from_headers(headers) if headers is not None else None
+        with self._cond:
+            if headroom is not None and headroom < self._low:
+                self._limit = max(self._minimum, self._limit - 1)
+            elif headroom is None or headroom >= self._high:
+                self._limit = min(self._maximum, self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def on_overload(self, retry_after: Optional[float] = None) -> float:
+        """
+        429/529 수신 시 호출.
+        Returns: 호출 측 재시도 전 대기 시간(초)
+        """
+        backoff = retry_after if retry_after and retry_after > 0 else self._default_backoff
+        with self._cond:
+            now = time.monotonic()
+            previous = self._limit
+            # 같은 정지 구간 내 동시 실패는 1회만 감소 (동시 요청들의 429 가 연달아 도착)
+            if now >= self._paused_until:
+                self._limit = max(self._minimum, self._limit / 2)
+            self._paused_until = max(self._paused_until, now + backoff)
+        log.warning(f"API 과부하 응답 — 동시성 {previous:.1f} → {self._limit:.1f}, {backoff:.1f}초 정지")
+        return backoff
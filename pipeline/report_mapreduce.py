@@ -0,0 +1,288 @@
+"""
+Report Map-Reduce - 주간·월간 리포트 입력을 전체 신호의 부분 요약(partial)으로 구성
+스코프별 상위 신호 몇 건만 넣는 대신 모든 신호를 요약해 최종 리포트 프롬프트에는 압축된 부분 요약만 전달
+
+Map:     신호를 (ISO 주, 스코프, 기업) 묶음으로 나누고 (REPORT_MAP_MAX_SIGNALS 초과 시 분할)
+         묶음마다 Claude 호출 1회 → PARTIAL_SUMMARY_TOOL 도구 input (headline / key_facts / implication)
+         기업: category 가 TARGET_COMPANIES 면 그대로, 아니면 제목·본문에서 TARGET_COMPANIES 선언 순 첫 매칭, 없으면 "기타"
+Cache:   REPORT_PARTIAL_CACHE_DIR/{iso_week}/{scope}__{company}__{digest 앞 16자}.json
+         digest = sha256(버전 + 맵 모델 + 신호별 map 입력 필드) — 파일 이름 자체가 내용 키
+         → 같은 주의 신호 구성·내용이 그대로면 월간 리포트는 주간 리포트 때 만든 부분 요약을 그대로 재사용
+           (같은 주에 재분석·갱신된 신호는 event_id 가 같아도 summary 등이 바뀌어 새로 map)
+           (주간·월간 묶음이 달라도 서로 덮어쓰지 않고, 분할 번호가 밀려도 같은 묶음이면 적중)
+Collapse: 부분 요약 전체가 REPORT_REDUCE_INPUT_TOKENS 를 넘으면 (스코프, 기업) 단위로 주별 부분 요약을 재요약
+          (REPORT_PARTIAL_CACHE_DIR/_collapsed/), 그래도 넘으면 신호 수 많은 묶음부터 예산까지만 사용
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import (
+    CLAUDE_STRICT_TOOLS,
+    REPORT_MAP_MODEL,
+    REPORT_MAP_MAX_SIGNALS,
+    REPORT_PARTIAL_CACHE_DIR,
+    TARGET_COMPANIES,
+)
+from pipeline.keyword_matcher import KeywordMatcher
+
+log = logging.getLogger(__name__)
+
+# 부분 요약 형식·지침이 바뀌면 올려서 캐시 무효화
+_PARTIAL_VERSION = "v1"
+_OTHER_COMPANY = "기타"
+COLLAPSED_BUCKET = "_collapsed"
+_MAX_KEY_FACTS = 5
+_UNSAFE_NAME_RE = re.compile(r"[^0-9A-Za-z가-힣._-]+")
+
+PARTIAL_SUMMARY_TOOL: dict = {
+    "name": "record_signal_digest",
+    "description": "신호 묶음(같은 주·스코프·기업)의 리포트용 요약을 기록합니다.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "headline": {"type": "string", "description": "묶음 전체의 핵심 결론 1문장 (기업명·수치 포함, 한국어)"},
+            "key_facts": {
+                "type": "array",
+                "description": f"리포트 인용 가치가 있는 사실 최대 {_MAX_KEY_FACTS}개",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "fact": {"type": "string", "description": "사실 1문장 (한국어)"},
+                        "source_url": {"type": "string", "description": "근거 신호의 source_url 그대로"},
+                        "published_at": {"type": "string", "description": "근거 신호의 published_at 그대로"},
+                    },
+                    "required": ["fact", "source_url", "published_at"],
+                    "additionalProperties": False,
+                },
+            },
+            "implication": {"type": "string", "description": "LGU+ 관점 시사점 1~2문장 (한국어)"},
+        },
+        "required": ["headline", "key_facts", "implication"],
+        "additionalProperties": False,
+    },
+}
+if CLAUDE_STRICT_TOOLS:
+    PARTIAL_SUMMARY_TOOL["strict"] = True
+
+
+@dataclass
+class SignalGroup:
+    """map 호출 1회 단위 (같은 ISO 주·스코프·기업 신호 묶음)."""
+    iso_week: str
+    scope: str
+    company: str
+    part: int
+    signals: list[dict] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return _UNSAFE_NAME_RE.sub("_", f"{self.scope}__{self.company}")
+
+    @property
+    def digest(self) -> str:
+        keys = sorted(_map_input_key(s) for s in self.signals)
+        return _digest([_PARTIAL_VERSION, REPORT_MAP_MODEL, *keys])
+
+    def header(self) -> dict:
+        return {
+            "iso_week": self.iso_week, "scope": self.scope, "company": self.company,
+            "signal_count": len(self.signals),
+        }
+
+
+def _digest(parts: list[str]) -> str:
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _signal_id(signal: dict) -> str:
+    return str(
+        signal.get("event_id")
+        or signal.get("source_url")
+        or signal.get("source_metadata", {}).get("url", "")
+        or signal.get("title", "")
+    )
+
+
+def _map_input_key(signal: dict) -> str:
+    """신호 1건의 map 입력 (StrategicAnalyzer._report_signal_payload 의 원천 필드) 직렬화 — 캐시 digest 구성 요소."""
+    meta = signal.get("source_metadata") or {}
+    return json.dumps({
+        "id": _signal_id(signal),
+        "scope": signal.get("scope"),
+        "category": signal.get("category"),
+        "title": signal.get("title", ""),
+        "content": signal.get("summary") or signal.get("raw_content", ""),
+        "strategic_implication": signal.get("strategic_implication", ""),
+        "key_insights": signal.get("key_insights", []),
+        "publisher": signal.get("publisher") or meta.get("publisher", ""),
+        "source_url": signal.get("source_url") or meta.get("url", ""),
+        "published_at": str(_published(signal) or "")[:10],
+        "confidence": signal.get("confidence_score") or signal.get("data_quality_score"),
+    }, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _published(signal: dict) -> object:
+    return signal.get("published_at") or signal.get("source_metadata", {}).get("published_at")
+
+
+def iso_week_of(value: object) -> str:
+    """발행일(datetime 또는 ISO 문자열) → "YYYY-Www". 파싱 불가 시 현재 주."""
+    moment: Optional[datetime] = value if isinstance(value, datetime) else None
+    if moment is None and value:
+        try:
+            moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            moment = None
+    iso_year, iso_week, _ = (moment or datetime.utcnow()).isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+@lru_cache(maxsize=1)
+def _company_matcher() -> KeywordMatcher:
+    return KeywordMatcher({company: [company] for company in TARGET_COMPANIES})
+
+
+def company_of(signal: dict) -> str:
+    if signal.get("category") in TARGET_COMPANIES:  # Key Player 뉴스 피드는 category = 기업명
+        return signal["category"]
+    text = f"{signal.get('title', '')} {(signal.get('summary') or signal.get('raw_content') or '')[:2000]}"
+    hits = _company_matcher().scan(text)
+    return next((company for company in TARGET_COMPANIES if company in hits), _OTHER_COMPANY)
+
+
+def group_signals(signals: list[dict], max_signals: int = REPORT_MAP_MAX_SIGNALS) -> list[SignalGroup]:
+    """(ISO 주, 스코프, 기업) 묶음 목록 — 주·스코프·기업 정렬, 묶음 내 발행일·ID 순으로 분할 (결정적)."""
+    buckets: dict[tuple[str, str, str], list[dict]] = {}
+    for signal in signals:
+        key = (iso_week_of(_published(signal)), signal.get("scope") or "Unknown", company_of(signal))
+        buckets.setdefault(key, []).append(signal)
+
+    groups: list[SignalGroup] = []
+    size = max(1, max_signals)
+    for (iso_week, scope, company), members in sorted(buckets.items()):
+        members.sort(key=lambda s: (str(_published(s) or ""), _signal_id(s)))
+        for part, start in enumerate(range(0, len(members), size)):
+            groups.append(SignalGroup(iso_week, scope, company, part, members[start:start + size]))
+    return groups
+
+
+def validate_partial(data: object) -> Optional[dict]:
+    """도구 input → {headline, key_facts, implication} (필수 필드 누락 시 None)."""
+    if not isinstance(data, dict):
+        return None
+    headline, implication = data.get("headline"), data.get("implication")
+    if not (isinstance(headline, str) and headline.strip() and isinstance(implication, str) and implication.strip()):
+        return None
+    facts = [
+        {
+            "fact": item["fact"].strip(),
+            "source_url": str(item.get("source_url") or ""),
+            "published_at": str(item.get("published_at") or "")[:10],
+        }
+        for item in (data.get("key_facts") or [])
+        if isinstance(item, dict) and isinstance(item.get("fact"), str) and item["fact"].strip()
+    ]
+    return {"headline": headline.strip(), "key_facts": facts[:_MAX_KEY_FACTS], "implication": implication.strip()}
+
+
+def local_partial(group: SignalGroup) -> dict:
+    """map 호출 실패 시 LLM 없이 구성한 부분 요약 (제목·링크 위주, 캐시하지 않음)."""
+    ranked = sorted(
+        group.signals,
+        key=lambda s: float(s.get("confidence_score") or s.get("data_quality_score") or 0.5),
+        reverse=True,
+    )
+    facts = [
+        {
+            "fact": s.get("summary") or s.get("title", ""),
+            "source_url": s.get("source_url") or s.get("source_metadata", {}).get("url", ""),
+            "published_at": str(_published(s) or "")[:10],
+        }
+        for s in ranked[:_MAX_KEY_FACTS]
+    ]
+    top = ranked[0] if ranked else {}
+    return {
+        "headline": top.get("title", ""),
+        "key_facts": facts,
+        "implication": top.get("strategic_implication") or "",
+    }
+
+
+class ReportPartialCache:
+    """부분 요약 JSON 파일 캐시 ({bucket}/{name}__{digest 앞 16자}.json, 저장된 digest 전체 일치 시에만 적중)."""
+
+    def __init__(self, root: Path = REPORT_PARTIAL_CACHE_DIR) -> None:
+        self._root = Path(root)
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _path(self, bucket: str, name: str, digest: str) -> Path:
+        return self._root / bucket / f"{name}__{digest[:16]}.json"
+
+    def get(self, bucket: str, name: str, digest: str) -> Optional[dict]:
+        try:
+            entry = json.loads(self._path(bucket, name, digest).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entry = None
+        if entry is None or entry.get("digest") != digest:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return entry["partial"]
+
+    def put(self, bucket: str, name: str, digest: str, partial: dict) -> None:
+        path = self._path(bucket, name, digest)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps(
+                    {"digest": digest, "created_at": datetime.utcnow().isoformat(), "partial": partial},
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp, path)
+        except OSError as e:
+            log.warning(f"부분 요약 캐시 저장 실패 ({bucket}/{name}): {e}")
+
+    def summary(self) -> str:
+        return f"hit {self.stats['hits']} / miss {self.stats['misses']}"
+
+
+def collapse_groups(partials: list[dict]) -> list[tuple[str, list[dict]]]:
+    """(스코프, 기업) 단위로 2개 이상 주별 부분 요약이 있는 묶음 → [(캐시 이름, 부분 요약 목록)]."""
+    buckets: dict[tuple[str, str], list[dict]] = {}
+    for partial in partials:
+        buckets.setdefault((partial["scope"], partial["company"]), []).append(partial)
+    return [
+        (_UNSAFE_NAME_RE.sub("_", f"{scope}__{company}"), members)
+        for (scope, company), members in sorted(buckets.items())
+    ]
+
+
+def collapse_digest(members: list[dict]) -> str:
+    return _digest([_PARTIAL_VERSION, REPORT_MAP_MODEL] + [
+        json.dumps(m, ensure_ascii=False, sort_keys=True) for m in members
+    ])
+
+
+def collapsed_header(members: list[dict]) -> dict:
+    weeks = sorted(m["iso_week"] for m in members)
+    return {
+        "iso_week": weeks[0] if weeks[0] == weeks[-1] else f"{weeks[0]}~{weeks[-1]}",
+        "scope": members[0]["scope"],
+        "company": members[0]["company"],
+        "signal_count": sum(m["signal_count"] for m in members),
+    }
+
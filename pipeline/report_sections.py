@@ -0,0 +1,145 @@
+"""
+Report Sections - 주간·월간 리포트 섹션 단위 병렬 생성 (sectioned 모드)
+6개 섹션을 한 번에 8K~12K 토큰으로 생성하는 대신 섹션마다 작은 출력 상한의 요청으로 생성하고 고정 순서로 조립
+→ 첫 섹션이 공통 prompt cache(지침 + 리포트 입력)를 쓴 뒤 나머지 섹션을 동시에 실행 (캐시 읽기)
+→ 소요 시간 ≈ 첫 섹션 + 나머지 중 가장 느린 섹션 (1회 생성의 긴 출력 대비 단축), 잘림은 해당 섹션만 재요청
+
+섹션 요청: 리포트 system 지침(캐시 블록) 그대로 + user 메시지 = 리포트 입력 + 섹션 지시 (section_instruction)
+검증 (check_section):
+  - stop_reason == max_tokens → "truncated" (출력 상한 2배로 재요청)
+  - {prefix}-section 래퍼 없음 → "invalid" (같은 상한으로 재요청)
+  - 선택 섹션(데이터 없으면 생략)이 SKIP_MARKER 만 반환 → "skip" (리포트에서 제외)
+조립: 섹션 번호 순서 고정 (완료된 앞 섹션부터 차례로 내보냄), 최종 실패 섹션은 안내 문구 섹션(placeholder)으로 대체
+
+single 모드 스트리밍 (SectionStreamSplitter): 응답 텍스트 델타 → 완성된 최상위 div 블록 단위 조각
+"""
+import re
+from dataclasses import dataclass
+from html import escape
+
+SKIP_MARKER = "<!-- SKIP -->"
+
+
+@dataclass(frozen=True)
+class ReportSection:
+    number: int
+    title: str
+    optional: bool = False   # 데이터 없으면 생략 가능한 섹션
+
+
+WEEKLY_SECTIONS: tuple[ReportSection, ...] = (
+    ReportSection(1, "이번 주 핵심 메시지"),
+    ReportSection(2, "기업별 주요 동향 (Company Intelligence)"),
+    ReportSection(3, "포착된 기술 트렌드 (Tech Trend Radar)"),
+    ReportSection(4, "시장 & 투자 흐름 (Market Pulse)", optional=True),
+    ReportSection(5, "규제 & 표준 레이더 (Policy Watch)", optional=True),
+    ReportSection(6, "LGU+ 전략 액션 아이템"),
+)
+
+MONTHLY_SECTIONS: tuple[ReportSection, ...] = (
+    ReportSection(1, "이달의 핵심 메시지 (Executive Summary)"),
+    ReportSection(2, "주요 아젠다 분석 (Key Agendas)"),
+    ReportSection(3, "기업 전략 동향 (Competitive Intelligence)"),
+    ReportSection(4, "기술 성숙도 레이더 (Technology Radar)"),
+    ReportSection(5, "투자 & 자본 흐름 (Capital Flow)", optional=True),
+    ReportSection(6, "LGU+ 전략 포지셔닝 (Strategic Positioning)"),
+)
+
+_SECTION_INSTRUCTION = """[섹션 분할 생성 — 이번 요청은 SECTION {number} 하나만 작성]
+위 지침의 "SECTION {number} — {title}" 만 작성하십시오. 다른 섹션은 다른 요청에서 병렬로 생성되므로 절대 포함하지 마십시오.
+- 출력: <div class="{prefix}-section"> 래퍼 1개 (섹션 제목 div 포함), 지침의 분량 제한 준수
+- "6개 섹션 전부 완성" 지침은 이번 요청에서는 이 섹션 하나를 끝까지 완성하는 것으로 적용{skip_rule}"""
+
+_SKIP_RULE = """
+- 지침상 데이터가 없어 생략하는 섹션이면 다른 내용 없이 {marker} 만 출력"""
+
+
+def section_instruction(section: ReportSection, prefix: str) -> str:
+    """섹션 1개 생성 지시문 (prefix: 주간 "rpt" / 월간 "mrpt")."""
+    return _SECTION_INSTRUCTION.format(
+        number=section.number,
+        title=section.title,
+        prefix=prefix,
+        skip_rule=_SKIP_RULE.format(marker=SKIP_MARKER) if section.optional else "",
+    )
+
+
+def clean_report_html(text: str) -> str:
+    """응답 텍스트 → HTML 조각 (```html 코드블록 래핑 제거)."""
+    html = text.strip()
+    if html.startswith("```"):
+        html = html.split("```")[1]
+        if html.startswith("html"):
+            html = html[4:]
+    return html.strip()
+
+
+def check_section(html: str, stop_reason: str, section: ReportSection, prefix: str) -> str:
+    """섹션 응답 판정: "ok" | "skip" | "truncated" | "invalid"."""
+    if stop_reason == "max_tokens":
+        return "truncated"
+    if section.optional and SKIP_MARKER in html and f'class="{prefix}-section' not in html:
+        return "skip"
+    if not re.search(rf'class="{prefix}-section(?:\s|")', html):
+        return "invalid"
+    return "ok"
+
+
+def placeholder(section: ReportSection, prefix: str) -> str:
+    """최종 생성 실패 섹션 자리 (재생성 안내)."""
+    return (
+        f'<div class="{prefix}-section">\n'
+        f'  <div class="{prefix}-section-title">{escape(section.title)}</div>\n'
+        f'  <div class="{prefix}-body">이 섹션은 생성하지 못했습니다. 리포트를 재생성해 주세요.</div>\n'
+        f"</div>"
+    )
+
+
+_DIV_TAG_RE = re.compile(r"<div\b[^>]*>|</div\s*>", re.IGNORECASE)
+_FENCE_OPEN_RE = re.compile(r"^\s*```(?:html)?")
+_FENCE_CLOSE_RE = re.compile(r"\s*```\s*$")
+
+
+class SectionStreamSplitter:
+    """
+    스트리밍 응답 텍스트 → 완성된 최상위 div 블록 단위 HTML 조각 (single 모드 점진 렌더링용).
+    조각을 모두 이어 붙이면 clean_report_html(전체 응답) 과 같은 HTML (```html 코드블록 래핑 제거).
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._scan = 0          # 태그 검사를 이어갈 buffer 위치
+        self._depth = 0
+        self._started = False   # 첫 조각 출력 여부 (선행 코드블록 표시 제거)
+
+    def feed(self, text: str) -> list[str]:
+        """델타 추가 → 이번에 완성된 조각 목록 (없으면 빈 목록)."""
+        self._buffer += text
+        end = len(self._buffer)
+        # 닫히지 않은 태그('<' 뒤에 '>' 없음)는 다음 델타까지 검사 보류
+        tail = self._buffer.rfind("<", self._scan)
+        if tail != -1 and ">" not in self._buffer[tail:]:
+            end = tail
+        chunks: list[str] = []
+        cut = 0
+        for match in _DIV_TAG_RE.finditer(self._buffer, self._scan, end):
+            self._depth += -1 if match.group().startswith("</") else 1
+            if self._depth <= 0:
+                self._depth = 0
+                chunks.append(self._emit(self._buffer[cut:match.end()]))
+                cut = match.end()
+        self._buffer = self._buffer[cut:]
+        self._scan = end - cut
+        return chunks
+
+    def close(self) -> str:
+        """스트림 종료 → 남은 텍스트 (닫는 코드블록 표시 제거, 없으면 빈 문자열)."""
+        rest = _FENCE_CLOSE_RE.sub("", self._buffer).rstrip()
+        self._buffer, self._scan, self._depth = "", 0, 0
+        return self._emit(rest) if rest.strip() else ""
+
+    def _emit(self, text: str) -> str:
+        if not self._started:
+            self._started = True
+            return _FENCE_OPEN_RE.sub("", text, count=1).lstrip()
+        return text
@@ -58,6 +58,11 @@ def run_weekly_pipeline() -> None:
         archivist = DataArchivist()
         ingestion_result = archivist.run_pipeline(analyzed_records)
         log.info(f"[Step 3/4] DB 저장: {ingestion_result}")
+        # DB 저장 성공 시에만 수집 진행 상태 기록 (archivist 는 DB 오류를 예외 대신 stored=False 로 알림)
+        if ingestion_result.get("stored", True):
+            scout.commit_fetch_state()
+        else:
+            log.warning("DB 저장 실패 — 수집 진행 상태를 기록하지 않음 (다음 실행에서 재수집)")
 
         # Step 4: 주간 리포트 생성
         log.info("[Step 4/4] 주간 리포트 생성 시작")
@@ -71,6 +76,25 @@ def run_weekly_pipeline() -> None:
     log.info(f"=== PASIS 주간 파이프라인 완료: {datetime.now().isoformat()} ===")
 
 
+def _weekly_report_period(now: datetime) -> tuple[str, datetime, datetime]:
+    """ISO 주 키 ("YYYY-Www"), 이번 주 월요일 ~ 일요일."""
+    from datetime import timedelta
+
+    iso_year, iso_week, _ = now.isocalendar()
+    week_start = now - timedelta(days=now.weekday())
+    return f"{iso_year}-W{iso_week:02d}", week_start, week_start + timedelta(days=6)
+
+
+def _monthly_report_period(now: datetime) -> tuple[str, datetime, datetime]:
+    """월 키 ("YYYY-MM"), 해당 월 1일 ~ 말일."""
+    import calendar
+
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last_day = calendar.monthrange(now.year, now.month)[1]
+    month_end = now.replace(day=last_day, hour=23, minute=59, second=59, microsecond=0)
+    return f"{now.year}-{now.month:02d}", month_start, month_end
+
+
 def _generate_and_save_weekly_report(
     analyzer: object, signals: list[dict], force: bool = False
 ) -> None:
@@ -81,39 +105,46 @@ def _generate_and_save_weekly_report(
         signals: 분석 대상 신호 목록
         force: True이면 기존 리포트를 삭제하고 재생성
     """
-    from datetime import timedelta
+    from database.init_db import get_session
+    from database.models import WeeklyReport
+
+    iso_week_str, _, _ = _weekly_report_period(datetime.utcnow())
+    with get_session() as session:
+        exists = session.query(WeeklyReport).filter_by(iso_week=iso_week_str).first() is not None
+
+    # 이번 주 리포트가 이미 있고 강제 재생성이 아니면 스킵
+    if exists and not force:
+        log.info(f"주간 리포트 이미 존재 — Claude 재생성 스킵: {iso_week_str}")
+        return
+
+    _save_weekly_report(signals, analyzer.generate_weekly_report(signals))
+
+
+def _save_weekly_report(signals: list[dict], html_report: str) -> str:
+    """생성된 주간 리포트 HTML DB 저장 — 같은 ISO 주 리포트가 있으면 교체.
+    웹 페이지 스트리밍 생성(stream_weekly_report) 후 저장에도 사용.
+
+    Args:
+        signals: 리포트 대상 신호 목록 (스코프별 건수 집계)
+        html_report: 리포트 HTML
+
+    Returns:
+        저장한 ISO 주 키
+    """
     from database.init_db import get_session
     from database.models import WeeklyReport
     from config import CLAUDE_MODEL
     from collections import Counter
 
     now = datetime.utcnow()
-    # ISO 주 계산
-    iso_year, iso_week, _ = now.isocalendar()
-    iso_week_str = f"{iso_year}-W{iso_week:02d}"
-
-    # 이번 주 월요일 ~ 일요일
-    weekday = now.weekday()
-    week_start = now - timedelta(days=weekday)
-    week_end = week_start + timedelta(days=6)
-
+    iso_week_str, week_start, week_end = _weekly_report_period(now)
     scope_counts = Counter(s.get("scope", "") for s in signals)
 
     with get_session() as session:
         existing = session.query(WeeklyReport).filter_by(iso_week=iso_week_str).first()
-
-        # 이번 주 리포트가 이미 있고 강제 재생성이 아니면 스킵
-        if existing and not force:
-            log.info(f"주간 리포트 이미 존재 — Claude 재생성 스킵: {iso_week_str}")
-            return
-
-        if existing and force:
+        if existing:
             session.delete(existing)
             session.flush()
-            log.info(f"기존 주간 리포트 삭제 후 재생성: {iso_week_str}")
-
-        html_report = analyzer.generate_weekly_report(signals)
-        exec_summary = html_report[:500] if html_report else ""
 
         report = WeeklyReport(
             week_start=week_start,
@@ -124,13 +155,14 @@ def _generate_and_save_weekly_report(
             tech_signals=scope_counts.get("Tech", 0),
             case_signals=scope_counts.get("Case", 0),
             policy_signals=scope_counts.get("Policy", 0),
-            executive_summary=exec_summary,
+            executive_summary=html_report[:500] if html_report else "",
             full_report_html=html_report,
             model_used=CLAUDE_MODEL,
             generated_at=now,
         )
         session.add(report)
-        log.info(f"주간 리포트 {'재' if force else '신규 '}생성: {iso_week_str}")
+    log.info(f"주간 리포트 {'재' if existing else '신규 '}생성: {iso_week_str}")
+    return iso_week_str
 
 
 def _generate_and_save_monthly_report(
@@ -143,35 +175,45 @@ def _generate_and_save_monthly_report(
         signals: 분석 대상 신호 목록 (30일치)
         force: True이면 기존 리포트를 삭제하고 재생성
     """
-    import calendar
+    from database.init_db import get_session
+    from database.models import MonthlyReport
+
+    month_key, _, _ = _monthly_report_period(datetime.utcnow())
+    with get_session() as session:
+        exists = session.query(MonthlyReport).filter_by(month_key=month_key).first() is not None
+
+    if exists and not force:
+        log.info(f"월간 리포트 이미 존재 — Claude 재생성 스킵: {month_key}")
+        return
+
+    _save_monthly_report(signals, analyzer.generate_monthly_report(signals))
+
+
+def _save_monthly_report(signals: list[dict], html_report: str) -> str:
+    """생성된 월간 리포트 HTML DB 저장 — 같은 월 리포트가 있으면 교체.
+    웹 페이지 스트리밍 생성(stream_monthly_report) 후 저장에도 사용.
+
+    Args:
+        signals: 리포트 대상 신호 목록 (스코프별 건수 집계)
+        html_report: 리포트 HTML
+
+    Returns:
+        저장한 월 키
+    """
     from database.init_db import get_session
     from database.models import MonthlyReport
     from config import CLAUDE_MODEL
     from collections import Counter
 
     now = datetime.utcnow()
-    month_key = f"{now.year}-{now.month:02d}"
-
-    # 해당 월 1일 ~ 말일
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    last_day = calendar.monthrange(now.year, now.month)[1]
-    month_end = now.replace(day=last_day, hour=23, minute=59, second=59, microsecond=0)
-
+    month_key, month_start, month_end = _monthly_report_period(now)
     scope_counts = Counter(s.get("scope", "") for s in signals)
 
     with get_session() as session:
         existing = session.query(MonthlyReport).filter_by(month_key=month_key).first()
-
-        if existing and not force:
-            log.info(f"월간 리포트 이미 존재 — Claude 재생성 스킵: {month_key}")
-            return
-
-        if existing and force:
+        if existing:
             session.delete(existing)
             session.flush()
-            log.info(f"기존 월간 리포트 삭제 후 재생성: {month_key}")
-
-        html_report = analyzer.generate_monthly_report(signals)
 
         report = MonthlyReport(
             month_key=month_key,
@@ -187,7 +229,8 @@ def _generate_and_save_monthly_report(
             generated_at=now,
         )
         session.add(report)
-        log.info(f"월간 리포트 {'재' if force else '신규 '}생성: {month_key}")
+    log.info(f"월간 리포트 {'재' if existing else '신규 '}생성: {month_key}")
+    return month_key
 
 
 def _on_job_executed(event: object) -> None:
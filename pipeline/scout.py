@@ -3,15 +3,14 @@ Physical AI Scout - Data Collection Module
 physical-ai-scout SKILL.md 구현체
 
 Sources:
-  - arXiv API (cs.RO, cs.AI, cs.CV, cs.LG)
+  - arXiv API (cs.RO, cs.AI, cs.CV, cs.LG) — 샤딩 쿼리 + 요청 단위 rate limit
+  - arXiv OAI-PMH (증분 수집 모드, ARXIV_SOURCE_MODE=oai)
   - SEC EDGAR Full-Text Search API (10-K, 8-K)
+  - SEC EDGAR submissions API (TARGET_COMPANIES CIK 기반 증분 폴링)
   - RSS Feeds (TechCrunch, VentureBeat, IEEE Spectrum 등)
 """
 import hashlib
-import json
 import logging
-import time
-import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from pathlib import Path
@@ -19,15 +18,14 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import arxiv
 import feedparser
-import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from config import (
     ARXIV_CATEGORIES,
     ARXIV_MAX_RESULTS,
+    ARXIV_MAX_TOTAL,
     ARXIV_RATE_LIMIT_SEC,
+    ARXIV_SOURCE_MODE,
     SEC_FORM_TYPES,
     SEC_RATE_LIMIT_SEC,
     NEWS_RSS_FEEDS,
@@ -36,13 +34,17 @@ from config import (
     CONFIDENCE_WEIGHTS,
     RAW_DIR,
 )
+from pipeline.arxiv_source import ArxivHarvester, ArxivOaiHarvester
+from pipeline.dedup import event_id_for_url
+from pipeline.edgar import EdgarClient, EdgarFullTextHarvester, EdgarSubmissionsPoller
+from pipeline.fetcher import FeedFetcher
+from pipeline.http_cache import HttpValidatorCache
+from pipeline.jsonl_sink import JsonlSink
+from pipeline.keyword_matcher import STRATEGIC_GROUP, category_from_hits, get_matcher
+from pipeline.ratelimit import TokenBucket
 
 log = logging.getLogger(__name__)
 
-# EDGAR Full-Text Search API (무료, 인증 불필요)
-EDGAR_SEARCH_URL = "https://efts.sec.gov/LATEST/search-index"
-EDGAR_HEADERS = {"User-Agent": "PASIS-Research research@lguplus.com"}
-
 
 def _build_pasis_record(
     scope: str,
@@ -57,7 +59,7 @@ def _build_pasis_record(
 ) -> dict:
     """PASIS 표준 레코드 생성 (physical-ai-scout SKILL.md Output Schema 준수)."""
     return {
-        "event_id": str(uuid.uuid4()),
+        "event_id": event_id_for_url(source_url),
         "scope": scope,
         "category": category,
         "title": title[:500],  # DB 길이 제한
@@ -73,10 +75,14 @@ def _build_pasis_record(
     }
 
 
+def _scan_keywords(text: str, keywords: list[str] = STRATEGIC_KEYWORDS) -> dict[str, set[str]]:
+    """전략 키워드 + 카테고리 택소노미 1회 스캔 (Aho-Corasick)."""
+    return get_matcher(tuple(keywords)).scan(text)
+
+
 def _is_relevant(text: str, keywords: list[str] = STRATEGIC_KEYWORDS) -> bool:
     """텍스트가 전략 키워드를 하나 이상 포함하는지 검증."""
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in keywords)
+    return STRATEGIC_GROUP in _scan_keywords(text, keywords)
 
 
 class PhysicalAIScout:
@@ -86,7 +92,18 @@ class PhysicalAIScout:
     """
 
     def __init__(self) -> None:
-        self._arxiv_client = arxiv.Client()
+        # arXiv 요청 예산(1 req / 3sec)은 모든 arXiv 수집 경로가 공유
+        self._arxiv_bucket = TokenBucket.per_interval(ARXIV_RATE_LIMIT_SEC)
+        self._arxiv_harvester = ArxivHarvester(bucket=self._arxiv_bucket)
+        self._arxiv_oai_harvester = ArxivOaiHarvester(bucket=self._arxiv_bucket)
+        self._http_cache = HttpValidatorCache()
+        self._fetcher = FeedFetcher(cache=self._http_cache)
+        # EDGAR 요청 예산(10 req/s)은 모든 SEC 수집 경로가 공유
+        self._edgar_client = EdgarClient(
+            bucket=TokenBucket.per_interval(SEC_RATE_LIMIT_SEC), cache=self._http_cache,
+        )
+        self._edgar_fts = EdgarFullTextHarvester(self._edgar_client)
+        self._edgar_submissions = EdgarSubmissionsPoller(self._edgar_client)
 
     # ── 1. arXiv Paper Tracker ─────────────────────────────────────────────
 
@@ -96,70 +113,89 @@ class PhysicalAIScout:
         categories: list[str] = ARXIV_CATEGORIES,
         max_results: int = ARXIV_MAX_RESULTS,
         days_back: int = 14,
+        max_total: int = ARXIV_MAX_TOTAL,
     ) -> list[dict]:
         """
         arXiv에서 Physical AI 관련 논문 수집.
-        Rate limit: 1 req / 3sec (arXiv 정책 준수)
+        전체 키워드를 쿼리 샤드로 분할, HTTP 페이지 단위 rate limit (1 req / 3sec),
+        cutoff 이전 논문 도달 시 페이지네이션 조기 종료. max_results는 샤드당 상한.
+        arXiv 검색(all:)은 구문을 단어 단위로도 매칭 → 제목·초록 전략 키워드 필터 후 최신순 max_total 건만 (분석 비용 상한).
         """
         records: list[dict] = []
-        cat_filter = " OR ".join(f"cat:{c}" for c in categories)
-        kw_sample = keywords[:6]  # 쿼리 길이 제한
-        kw_query = " OR ".join(f'"{kw}"' for kw in kw_sample)
-        query = f"({cat_filter}) AND ({kw_query})"
-
-        log.info(f"arXiv 검색 쿼리: {query}")
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
 
         try:
-            search = arxiv.Search(
-                query=query,
-                max_results=max_results,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending,
+            entries = self._arxiv_harvester.search(
+                keywords=keywords,
+                categories=categories,
+                cutoff=cutoff,
+                max_results_per_shard=max_results,
             )
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
-
-            for result in self._arxiv_client.results(search):
-                if result.published < cutoff:
-                    continue
-
-                primary_cat = result.primary_category
-                scope = "Tech"
-                category = self._classify_arxiv_category(primary_cat)
-
-                # entry_id 는 "http://arxiv.org/abs/2410.24164v2" 형식
-                # → 버전 제거 + https 로 정규화
-                arxiv_id = result.get_short_id()
-                if "v" in arxiv_id:
-                    arxiv_id = arxiv_id[: arxiv_id.rfind("v")]
-                clean_url = f"https://arxiv.org/abs/{arxiv_id}"
-
-                record = _build_pasis_record(
-                    scope=scope,
-                    category=category,
-                    title=result.title,
-                    raw_content=result.summary,
-                    source_url=clean_url,
-                    publisher=f"arXiv ({primary_cat})",
-                    published_at=result.published.replace(tzinfo=timezone.utc)
-                    if result.published.tzinfo is None
-                    else result.published,
-                    confidence_score=CONFIDENCE_WEIGHTS.get("arXiv", 0.90),
-                    extra_meta={
-                        "authors": [a.name for a in result.authors[:5]],
-                        "arxiv_id": result.get_short_id(),
-                    },
-                )
-                records.append(record)
-                time.sleep(ARXIV_RATE_LIMIT_SEC)
-
-        except arxiv.HTTPError as e:
-            log.error(f"arXiv HTTP 오류: {e}")
+            relevant = [e for e in entries if _is_relevant(f"{e['title']} {e['summary']}", keywords)]
+            if len(relevant) > max_total:
+                log.info(f"arXiv 실행당 상한: 관련 {len(relevant)}건 중 최신 {max_total}건만 사용")
+            log.info(f"arXiv 관련성 필터: {len(entries)}건 중 {len(relevant)}건 통과")
+            records = [self._arxiv_entry_to_record(entry) for entry in relevant[:max_total]]
         except Exception as e:
             log.error(f"arXiv 수집 오류: {e}", exc_info=True)
 
         log.info(f"arXiv 수집 완료: {len(records)}건")
         return records
 
+    def fetch_arxiv_oai(
+        self,
+        keywords: list[str] = STRATEGIC_KEYWORDS,
+        categories: list[str] = ARXIV_CATEGORIES,
+        days_back: int = 14,
+        max_total: int = ARXIV_MAX_TOTAL,
+    ) -> list[dict]:
+        """
+        arXiv OAI-PMH 증분 수집 (일일 운영 모드).
+        마지막 성공 datestamp 이후 cs 전체를 벌크 수집한 뒤
+        카테고리·키워드 관련성 필터를 로컬에서 적용, 최신순 max_total 건만. days_back은 첫 실행에만 사용.
+        """
+        records: list[dict] = []
+        wanted = set(categories)
+
+        try:
+            entries = self._arxiv_oai_harvester.harvest(days_back=days_back)
+            for entry in entries:
+                if not wanted.intersection(entry["categories"]):
+                    continue
+                if not _is_relevant(f"{entry['title']} {entry['summary']}", keywords):
+                    continue
+                records.append(self._arxiv_entry_to_record(entry))
+            log.info(f"arXiv OAI 관련성 필터: {len(entries)}건 중 {len(records)}건 통과")
+            if len(records) > max_total:
+                log.info(f"arXiv 실행당 상한: 관련 {len(records)}건 중 최신 {max_total}건만 사용")
+                records = sorted(
+                    records, key=lambda r: r["source_metadata"]["published_at"], reverse=True,
+                )[:max_total]
+        except Exception as e:
+            log.error(f"arXiv OAI-PMH 수집 오류: {e}", exc_info=True)
+
+        log.info(f"arXiv 수집 완료 (OAI-PMH): {len(records)}건")
+        return records
+
+    def _arxiv_entry_to_record(self, entry: dict) -> dict:
+        """ArxivHarvester 정규화 entry → PASIS 레코드."""
+        primary_cat = entry["primary_category"]
+        return _build_pasis_record(
+            scope="Tech",
+            category=self._classify_arxiv_category(primary_cat),
+            title=entry["title"],
+            raw_content=entry["summary"],
+            # 버전 제거 + https 로 정규화
+            source_url=f"https://arxiv.org/abs/{entry['arxiv_id']}",
+            publisher=f"arXiv ({primary_cat})",
+            published_at=entry["published"],
+            confidence_score=CONFIDENCE_WEIGHTS.get("arXiv", 0.90),
+            extra_meta={
+                "authors": entry["authors"][:5],
+                "arxiv_id": entry["versioned_id"],
+            },
+        )
+
     def _classify_arxiv_category(self, cat: str) -> str:
         mapping = {
             "cs.RO": "Robotics",
@@ -171,11 +207,6 @@ class PhysicalAIScout:
 
     # ── 2. SEC EDGAR Filing Monitor ────────────────────────────────────────
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.exceptions.RequestException),
-    )
     def fetch_sec_filings(
         self,
         keywords: list[str] = None,
@@ -186,6 +217,8 @@ class PhysicalAIScout:
         """
         SEC EDGAR Full-Text Search API로 공시 수집.
         인증 불필요 (EDGAR 공개 API).
+        키워드 × form type 전체 매트릭스를 병렬 페이지네이션 (공유 10 req/s 예산),
+        요청 단위 재시도, adsh 기준 중복 제거.
         """
         if keywords is None:
             keywords = ["humanoid robot", "embodied AI", "autonomous robot", "physical AI"]
@@ -193,90 +226,99 @@ class PhysicalAIScout:
         records: list[dict] = []
         start_date = (datetime.utcnow() - timedelta(days=days_back)).strftime("%Y-%m-%d")
         end_date = datetime.utcnow().strftime("%Y-%m-%d")
-        forms_param = ",".join(form_types)
-
-        for keyword in keywords[:4]:  # API 부하 제한
-            params = {
-                "q": f'"{keyword}"',
-                "forms": forms_param,
-                "dateRange": "custom",
-                "startdt": start_date,
-                "enddt": end_date,
-            }
-            try:
-                resp = requests.get(
-                    EDGAR_SEARCH_URL,
-                    params=params,
-                    headers=EDGAR_HEADERS,
-                    timeout=15,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                hits = data.get("hits", {}).get("hits", [])
-
-                for hit in hits[:5]:  # 키워드당 최대 5건
-                    src = hit.get("_source", {})
-                    form_type = src.get("form_type", "SEC")
-                    entity_name = src.get("entity_name", "").strip()
-                    filing_date = src.get("file_date", datetime.utcnow().strftime("%Y-%m-%d"))
-
-                    # 기업명 없는 결과 → URL을 제대로 구성할 수 없으므로 스킵
-                    if not entity_name or entity_name.lower() in ("unknown", "n/a", ""):
-                        log.debug(f"SEC: entity_name 없음, 스킵 (adsh={src.get('adsh','')})")
-                        continue
 
-                    # ── EDGAR 정규 URL 구성 (우선순위: adsh+entity_id > file_url > fallback) ──
-                    adsh = src.get("adsh", "")
-                    entity_id = src.get("entity_id", "")
-                    filing_url = src.get("file_url", "")
-
-                    if adsh and entity_id:
-                        # 가장 정확: 공시 인덱스 페이지
-                        adsh_clean = adsh.replace("-", "")
-                        filing_url = (
-                            f"https://www.sec.gov/Archives/edgar/data/{entity_id}"
-                            f"/{adsh_clean}/{adsh}-index.htm"
-                        )
-                    elif filing_url.startswith("/"):
-                        filing_url = f"https://www.sec.gov{filing_url}"
-                    elif filing_url.startswith("http") and "sec.gov" in filing_url:
-                        pass  # sec.gov 절대 URL → 그대로 사용
-                    else:
-                        # non-sec URL 또는 URL 없음 → 회사별 공시 목록 fallback
-                        cik_param = entity_id if entity_id else entity_name.replace(" ", "+")
-                        filing_url = (
-                            f"https://www.sec.gov/cgi-bin/browse-edgar"
-                            f"?action=getcompany&CIK={cik_param}"
-                            f"&type={form_type}&dateb=&owner=include&count=10"
-                        )
+        try:
+            sources = self._edgar_fts.search(keywords, form_types, start_date, end_date)
+            for src in sources:
+                record = self._sec_hit_to_record(src)
+                if record:
+                    records.append(record)
+        except Exception as e:
+            log.error(f"SEC EDGAR 수집 오류: {e}", exc_info=True)
 
-                    # published_at 파싱
-                    try:
-                        pub_dt = datetime.strptime(filing_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                    except ValueError:
-                        pub_dt = datetime.now(timezone.utc)
+        log.info(f"SEC EDGAR 수집 완료: {len(records)}건")
+        return records
 
-                    record = _build_pasis_record(
-                        scope="Market",
-                        category=self._classify_sec_form(form_type),
-                        title=f"[{form_type}] {entity_name}: {src.get('period_of_report', filing_date)}",
-                        raw_content=src.get("file_description", f"{form_type} filing by {entity_name}"),
-                        source_url=filing_url,
-                        publisher=f"SEC EDGAR ({form_type})",
-                        published_at=pub_dt,
-                        confidence_score=CONFIDENCE_WEIGHTS.get("SEC", 0.95),
-                    )
+    def fetch_sec_submissions(
+        self,
+        companies: list[str] = TARGET_COMPANIES,
+        form_types: list[str] = SEC_FORM_TYPES,
+        days_back: int = 30,
+    ) -> list[dict]:
+        """
+        TARGET_COMPANIES 기업별 EDGAR submissions 증분 폴링.
+        CIK 매핑은 캐시, 기업당 요청 1회, 이미 본 accession은 제외.
+        """
+        records: list[dict] = []
+        since = (datetime.utcnow() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+
+        try:
+            ciks = self._edgar_submissions.resolve_ciks(companies)
+            filings = self._edgar_submissions.poll(ciks, form_types, since)
+            for filing in filings:
+                # submissions 응답의 cik → Full-Text hit 과 동일한 URL 구성 규칙 적용
+                record = self._sec_hit_to_record({**filing, "entity_id": filing["cik"]})
+                if record:
                     records.append(record)
+            self._edgar_submissions.mark_seen([f["adsh"] for f in filings])
+        except Exception as e:
+            log.error(f"SEC submissions 수집 오류: {e}", exc_info=True)
 
-                time.sleep(SEC_RATE_LIMIT_SEC)
+        log.info(f"SEC submissions 수집 완료: {len(records)}건")
+        return records
 
-            except requests.exceptions.RequestException as e:
-                log.warning(f"SEC EDGAR API 오류 (keyword={keyword}): {e}")
-            except (KeyError, ValueError) as e:
-                log.warning(f"SEC 응답 파싱 오류: {e}")
+    def _sec_hit_to_record(self, src: dict) -> Optional[dict]:
+        """EDGAR Full-Text hit `_source` (또는 submissions 공시) → PASIS 레코드. URL 구성 불가 시 None."""
+        form_type = src.get("form_type", "SEC")
+        entity_name = src.get("entity_name", "").strip()
+        filing_date = src.get("file_date", datetime.utcnow().strftime("%Y-%m-%d"))
+
+        # 기업명 없는 결과 → URL을 제대로 구성할 수 없으므로 스킵
+        if not entity_name or entity_name.lower() in ("unknown", "n/a", ""):
+            log.debug(f"SEC: entity_name 없음, 스킵 (adsh={src.get('adsh','')})")
+            return None
+
+        # ── EDGAR 정규 URL 구성 (우선순위: adsh+entity_id > file_url > fallback) ──
+        adsh = src.get("adsh", "")
+        entity_id = src.get("entity_id", "")
+        filing_url = src.get("file_url", "")
+
+        if adsh and entity_id:
+            # 가장 정확: 공시 인덱스 페이지
+            adsh_clean = adsh.replace("-", "")
+            filing_url = (
+                f"https://www.sec.gov/Archives/edgar/data/{entity_id}"
+                f"/{adsh_clean}/{adsh}-index.htm"
+            )
+        elif filing_url.startswith("/"):
+            filing_url = f"https://www.sec.gov{filing_url}"
+        elif filing_url.startswith("http") and "sec.gov" in filing_url:
+            pass  # sec.gov 절대 URL → 그대로 사용
+        else:
+            # non-sec URL 또는 URL 없음 → 회사별 공시 목록 fallback
+            cik_param = entity_id if entity_id else entity_name.replace(" ", "+")
+            filing_url = (
+                f"https://www.sec.gov/cgi-bin/browse-edgar"
+                f"?action=getcompany&CIK={cik_param}"
+                f"&type={form_type}&dateb=&owner=include&count=10"
+            )
 
-        log.info(f"SEC EDGAR 수집 완료: {len(records)}건")
-        return records
+        # published_at 파싱
+        try:
+            pub_dt = datetime.strptime(filing_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            pub_dt = datetime.now(timezone.utc)
+
+        return _build_pasis_record(
+            scope="Market",
+            category=self._classify_sec_form(form_type),
+            title=f"[{form_type}] {entity_name}: {src.get('period_of_report', filing_date)}",
+            raw_content=src.get("file_description", f"{form_type} filing by {entity_name}"),
+            source_url=filing_url,
+            publisher=f"SEC EDGAR ({form_type})",
+            published_at=pub_dt,
+            confidence_score=CONFIDENCE_WEIGHTS.get("SEC", 0.95),
+        )
 
     def _classify_sec_form(self, form_type: str) -> str:
         mapping = {
@@ -305,13 +347,24 @@ class PhysicalAIScout:
         records: list[dict] = []
         cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
 
+        # 전체 피드 동시 다운로드 → 이후 파싱은 이미 받은 bytes 기준
+        fetched = self._fetcher.fetch_all([f["url"] for f in feeds])
+
         for feed_config in feeds:
             feed_name = feed_config["name"]
             feed_url = feed_config["url"]
             feed_scope = feed_config.get("scope", "Case")
 
+            result = fetched.get(feed_url)
+            if result is None or not result.ok:
+                log.warning(f"RSS 다운로드 실패 ({feed_name}): {result.error if result else 'no result'}")
+                continue
+            if result.not_modified:
+                log.info(f"RSS 변경 없음 ({feed_name}) — 파싱 스킵")
+                continue
+
             try:
-                parsed = feedparser.parse(feed_url)
+                parsed = feedparser.parse(result.content, response_headers=result.headers)
                 if parsed.bozo and parsed.bozo_exception:
                     log.warning(f"RSS 파싱 경고 ({feed_name}): {parsed.bozo_exception}")
 
@@ -324,9 +377,10 @@ class PhysicalAIScout:
                     if not title or not link:
                         continue
 
-                    # 관련성 검증 (키워드 필터)
+                    # 관련성 검증 + 카테고리 + 키워드 태그 (단일 스캔)
                     combined_text = f"{title} {summary}"
-                    if not _is_relevant(combined_text, keywords):
+                    hits = _scan_keywords(combined_text, keywords)
+                    if STRATEGIC_GROUP not in hits:
                         continue
 
                     # 발행일 파싱
@@ -341,16 +395,19 @@ class PhysicalAIScout:
                     confidence = CONFIDENCE_WEIGHTS.get(feed_name, CONFIDENCE_WEIGHTS["RSS"])
                     record = _build_pasis_record(
                         scope=feed_scope,
-                        category=self._classify_news_category(combined_text),
+                        category=category_from_hits(hits),
                         title=title,
                         raw_content=summary[:2000],
                         source_url=link,
                         publisher=feed_name,
                         published_at=pub_dt,
                         confidence_score=confidence,
+                        extra_meta={"matched_keywords": sorted(hits[STRATEGIC_GROUP])},
                     )
                     records.append(record)
 
+                self._http_cache.update(feed_url, result.headers, result.content)
+
             except Exception as e:
                 log.error(f"RSS 수집 오류 ({feed_name}): {e}", exc_info=True)
 
@@ -358,16 +415,20 @@ class PhysicalAIScout:
         return records
 
     def _classify_news_category(self, text: str) -> str:
-        text_lower = text.lower()
-        if any(kw in text_lower for kw in ["investment", "funding", "raise", "series", "m&a", "acqui"]):
-            return "Investment"
-        if any(kw in text_lower for kw in ["deploy", "factory", "warehouse", "logistics", "poc"]):
-            return "PoC Deployment"
-        if any(kw in text_lower for kw in ["partner", "collaboration", "joint", "deal"]):
-            return "Partnership"
-        if any(kw in text_lower for kw in ["regulation", "policy", "standard", "act", "law"]):
-            return "Regulation"
-        return "Industry News"
+        return category_from_hits(_scan_keywords(text))
+
+    # ── Fetch state ────────────────────────────────────────────────────────
+
+    def commit_fetch_state(self) -> None:
+        """
+        수집 진행 상태 영속화: HTTP 검증자(ETag / Last-Modified / 본문 해시), EDGAR accession 인덱스,
+        arXiv OAI 다음 from datestamp. 수집 중에는 메모리에만 반영 → 수집 레코드 DB 저장이 끝난 뒤 호출.
+        그 전에 중단되면 다음 실행이 304·이미 본 항목으로 건너뛰지 않고 같은 항목을 다시 수집.
+        """
+        self._http_cache.save()
+        self._edgar_submissions.save()
+        self._arxiv_oai_harvester.commit()
+        log.info("수집 진행 상태 저장 (HTTP 검증자, EDGAR accession, arXiv OAI datestamp)")
 
     # ── 4. Full Run ────────────────────────────────────────────────────────
 
@@ -377,38 +438,57 @@ class PhysicalAIScout:
         save_raw: bool = True,
     ) -> list[dict]:
         """
-        전체 소스 수집 실행 후 raw 데이터 저장.
+        전체 소스 수집 실행. save_raw=True 이면 소스별 수집 직후
+        data/raw/*_scout.jsonl.gz 에 스트리밍 기록 (중간 크래시 시에도 보존).
         Returns: 통합 레코드 리스트
         """
         log.info("=== PhysicalAIScout 전체 수집 시작 ===")
         all_records: list[dict] = []
+        sink = JsonlSink(RAW_DIR, "scout") if save_raw else None
 
-        # arXiv
-        try:
-            arxiv_records = self.fetch_arxiv_papers(days_back=days_back)
-            all_records.extend(arxiv_records)
-        except Exception as e:
-            log.error(f"arXiv 수집 실패: {e}")
+        def _collect(records: list[dict]) -> None:
+            # 소스 fetch 는 레코드 목록을 한 번에 반환 → 받은 즉시 전부 기록·flush (다음 소스를 기다리며 버퍼에 남는 레코드 없음)
+            all_records.extend(records)
+            if sink is not None:
+                sink.write_many(records)
+                sink.flush()
 
-        # SEC EDGAR
         try:
-            sec_records = self.fetch_sec_filings(days_back=days_back)
-            all_records.extend(sec_records)
-        except Exception as e:
-            log.error(f"SEC EDGAR 수집 실패: {e}")
+            # arXiv (ARXIV_SOURCE_MODE: search | oai)
+            try:
+                if ARXIV_SOURCE_MODE == "oai":
+                    _collect(self.fetch_arxiv_oai(days_back=days_back))
+                else:
+                    _collect(self.fetch_arxiv_papers(days_back=days_back))
+            except Exception as e:
+                log.error(f"arXiv 수집 실패: {e}")
 
-        # RSS News
-        try:
-            rss_records = self.fetch_rss_news(days_back=days_back)
-            all_records.extend(rss_records)
-        except Exception as e:
-            log.error(f"RSS 수집 실패: {e}")
+            # SEC EDGAR
+            try:
+                _collect(self.fetch_sec_filings(days_back=days_back))
+            except Exception as e:
+                log.error(f"SEC EDGAR 수집 실패: {e}")
 
-        log.info(f"=== 전체 수집 완료: {len(all_records)}건 ===")
+            # SEC EDGAR submissions (기업별 증분) — Full-Text 결과와 같은 공시 URL은 제외
+            try:
+                sec_urls = {r["source_metadata"]["url"] for r in all_records if r["scope"] == "Market"}
+                _collect([
+                    r for r in self.fetch_sec_submissions(days_back=days_back)
+                    if r["source_metadata"]["url"] not in sec_urls
+                ])
+            except Exception as e:
+                log.error(f"SEC submissions 수집 실패: {e}")
 
-        if save_raw and all_records:
-            self._save_raw(all_records)
+            # RSS News
+            try:
+                _collect(self.fetch_rss_news(days_back=days_back))
+            except Exception as e:
+                log.error(f"RSS 수집 실패: {e}")
+        finally:
+            if sink is not None:
+                sink.close()
 
+        log.info(f"=== 전체 수집 완료: {len(all_records)}건 ===")
         return all_records
 
     # ── 5. Key Player News Feed ─────────────────────────────────────────────
@@ -428,12 +508,27 @@ class PhysicalAIScout:
         records: list[dict] = []
         cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
 
+        # 전체 Key Player 피드 동시 다운로드 (news.google.com은 호스트별 상한 적용)
+        fetched = self._fetcher.fetch_all(
+            [feed_cfg["url"] for player in players for feed_cfg in player["feeds"]]
+        )
+
         for player in players:
             company_name = player["name"]
             for feed_cfg in player["feeds"]:
                 feed_url = feed_cfg["url"]
+                result = fetched.get(feed_url)
+                if result is None or not result.ok:
+                    log.warning(
+                        f"Key Player 피드 다운로드 실패 ({company_name}): "
+                        f"{result.error if result else 'no result'}"
+                    )
+                    continue
+                if result.not_modified:
+                    log.debug(f"Key Player 피드 변경 없음 ({company_name}): {feed_url}")
+                    continue
                 try:
-                    parsed = feedparser.parse(feed_url)
+                    parsed = feedparser.parse(result.content, response_headers=result.headers)
                     for entry in parsed.entries:
                         title = getattr(entry, "title", "") or ""
                         summary = getattr(entry, "summary", "") or getattr(entry, "description", "") or ""
@@ -469,17 +564,9 @@ class PhysicalAIScout:
                             },
                         )
                         records.append(record)
+                    self._http_cache.update(feed_url, result.headers, result.content)
                 except Exception as e:
                     log.error(f"Key Player 뉴스 수집 오류 ({company_name}): {e}")
 
         log.info(f"Key Player 뉴스 수집 완료: {len(records)}건")
         return records
-
-    def _save_raw(self, records: list[dict]) -> None:
-        """raw 데이터를 data/raw/{YYYYMMDD}_scout.json 형식으로 저장."""
-        RAW_DIR.mkdir(parents=True, exist_ok=True)
-        filename = f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_scout.json"
-        filepath = RAW_DIR / filename
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(records, f, ensure_ascii=False, indent=2, default=str)
-        log.info(f"Raw 데이터 저장: {filepath}")
\ No newline at end of file
@@ -0,0 +1,292 @@
+"""
+Seen Index - 수집 신호 "이미 본 항목" 판정 (실행 간 영속)
+signal_fingerprints 테이블 + 프로세스 내 Bloom filter 전단
+
+판정 흐름:
+  1. 레코드 → url_hash = sha256(정규 URL)  ← 식별 기준
+             content_hash = sha256(정규화 제목 | 발행일 | 매체 | 본문 앞부분 shingle)  ← 보조 (URL 이 바뀐 같은 항목)
+     본문이 없으면 content_hash = url_hash (제목·날짜만 같은 템플릿 제목 항목 — `[8-K] Tesla, Inc.` 등 — 을 같은 신호로 보지 않음)
+  2. Bloom filter 에 두 해시 모두 없음 → 신규 확정 (DB 조회 없음)
+  3. 하나라도 있음 → 후보만 모아 DB 에서 배치 확인 (Bloom 오탐 제거)
+
+Bloom filter 는 첫 사용 시 signal_fingerprints 전체를 스트리밍 로드.
+로드마다 지문이 없는 market_signals 행(event_id 기준)을 백필 (부분적으로 채워진 테이블도 완성).
+레코드는 DB 저장 단계(DataArchivist) 통과 후 mark_seen() 으로 등록
+(품질 점수 미달로 저장되지 않은 신호, 근접 중복으로 링크된 사본 포함 → 재분석 비용 방지).
+"""
+import hashlib
+import logging
+import math
+import threading
+from datetime import datetime
+from typing import Iterable, Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import insert
+
+from config import SEEN_BLOOM_CAPACITY, SEEN_BLOOM_ERROR_RATE
+from database.init_db import get_session
+from database.models import MarketSignal, SignalFingerprint
+from pipeline.dedup import canonicalize_url, content_features, title_features
+
+log = logging.getLogger(__name__)
+
+_QUERY_CHUNK = 500  # IN 절 1회당 파라미터 수 (SQLite 변수 상한 대비)
+
+
+class BloomFilter:
+    """
+    hex digest(sha256) 키 전용 Bloom filter.
+    키가 이미 균일 해시이므로 앞 128bit 를 둘로 나눠 double hashing 으로 k 개 위치 산출.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self._size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, hex_key: str) -> Iterable[int]:
+        h1 = int(hex_key[:16], 16)
+        h2 = int(hex_key[16:32], 16) | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hashes))
+
+    def add(self, hex_key: str) -> None:
+        for pos in self._positions(hex_key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, hex_key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(hex_key))
+
+
+# ── Fingerprints ──────────────────────────────────────────────────────────────
+
+def url_hash(url: str) -> str:
+    return hashlib.sha256(canonicalize_url(url).encode("utf-8")).hexdigest()
+
+
+def content_hash(title: str, published_at: object, publisher: str = "", content: str = "") -> str:
+    """
+    매체명 접미사·대소문자·구두점 차이를 무시한 제목 + 발행일(YYYY-MM-DD) + 매체 + 본문 앞부분 shingle.
+    제목 또는 본문 shingle 이 없으면 빈 문자열 (호출 측에서 url_hash 로 대체 → URL 로만 식별).
+    """
+    title_part = " ".join(sorted(title_features(title)))
+    body_part = " ".join(sorted(content_features(content or "")))
+    if not title_part or not body_part:
+        return ""
+    if isinstance(published_at, datetime):
+        day = published_at.date().isoformat()
+    else:
+        day = str(published_at or "")[:10]
+    key = f"{title_part}|{day}|{(publisher or '').strip().lower()}|{body_part}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def fingerprint(
+    url: str, title: str, published_at: object, publisher: str = "", content: str = "",
+) -> tuple[str, str]:
+    """(url_hash, content_hash) — 제목·본문이 없으면 content_hash = url_hash."""
+    u_hash = url_hash(url)
+    return u_hash, content_hash(title, published_at, publisher, content) or u_hash
+
+
+def _record_keys(record: dict) -> tuple[str, str]:
+    meta = record.get("source_metadata", {})
+    return fingerprint(
+        meta.get("url", ""), record.get("title", ""), meta.get("published_at", ""),
+        meta.get("publisher", ""), record.get("raw_content", ""),
+    )
+
+
+def _chunks(items: list, size: int = _QUERY_CHUNK) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class SeenIndex:
+    """signal_fingerprints 테이블 + Bloom filter 전단."""
+
+    def __init__(
+        self,
+        capacity: int = SEEN_BLOOM_CAPACITY,
+        error_rate: float = SEEN_BLOOM_ERROR_RATE,
+    ) -> None:
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._bloom: Optional[BloomFilter] = None
+        self._lock = threading.Lock()
+        self.stats = {"checked": 0, "bloom_negative": 0, "confirmed_seen": 0, "false_positive": 0}
+
+    # ── Load ───────────────────────────────────────────────────────────────
+
+    def load(self) -> None:
+        """signal_fingerprints 전체를 Bloom filter 로 스트리밍 로드 (지문 없는 market_signals 행 백필 후)."""
+        with get_session() as session:
+            self._backfill(session)
+            total = session.query(SignalFingerprint.id).count()
+
+            # 지문 1건당 키 2개(url/content) 등록 + 실행 중 증가분 여유 2배
+            bloom = BloomFilter(max(self._capacity, total * 4), self._error_rate)
+            rows = session.query(SignalFingerprint.url_hash, SignalFingerprint.content_hash).yield_per(10_000)
+            for u_hash, c_hash in rows:
+                bloom.add(u_hash)
+                bloom.add(c_hash)
+        self._bloom = bloom
+        log.info(f"Seen index 로드: 지문 {total}건")
+
+    def _backfill(self, session: object) -> int:
+        """
+        같은 event_id 지문이 없는 market_signals 행 → 지문 등록 (이미 등록된 url_hash 제외).
+        market_signals 에는 수집 본문이 없으므로 content_hash = url_hash (URL 로만 식별).
+        """
+        rows = (
+            session.query(MarketSignal.source_url, MarketSignal.event_id)
+            .outerjoin(SignalFingerprint, SignalFingerprint.event_id == MarketSignal.event_id)
+            .filter(SignalFingerprint.id.is_(None))
+            .yield_per(10_000)
+        )
+        by_url: dict[str, str] = {}
+        for url, event_id in rows:
+            by_url.setdefault(url_hash(url or ""), event_id)
+        if not by_url:
+            return 0
+
+        existing: set[str] = set()
+        for chunk in _chunks(list(by_url)):
+            existing.update(
+                row[0] for row in
+                session.query(SignalFingerprint.url_hash).filter(SignalFingerprint.url_hash.in_(chunk))
+            )
+        now = datetime.utcnow()
+        new_rows = [
+            {"url_hash": u_hash, "content_hash": u_hash, "event_id": event_id,
+             "first_seen_at": now, "last_seen_at": now}
+            for u_hash, event_id in by_url.items()
+            if u_hash not in existing
+        ]
+        if new_rows:
+            session.execute(insert(SignalFingerprint), new_rows)
+            log.info(f"Seen index 백필: market_signals → 지문 {len(new_rows)}건")
+        return len(new_rows)
+
+    def _ensure_loaded(self) -> BloomFilter:
+        with self._lock:
+            if self._bloom is None:
+                self.load()
+            return self._bloom
+
+    # ── Query ──────────────────────────────────────────────────────────────
+
+    def filter_new(self, records: list[dict]) -> list[dict]:
+        """이미 본 레코드 제외. Bloom 음성은 DB 조회 없이 신규로 확정."""
+        if not records:
+            return records
+        bloom = self._ensure_loaded()
+
+        keys = [_record_keys(r) for r in records]
+        candidates = [i for i, (u, c) in enumerate(keys) if u in bloom or c in bloom]
+        self.stats["checked"] += len(records)
+        self.stats["bloom_negative"] += len(records) - len(candidates)
+
+        seen_positions: set[int] = set()
+        if candidates:
+            seen_urls, seen_contents = self._lookup(
+                [keys[i][0] for i in candidates], [keys[i][1] for i in candidates],
+            )
+            for i in candidates:
+                u, c = keys[i]
+                if u in seen_urls or c in seen_contents:
+                    seen_positions.add(i)
+            self.stats["confirmed_seen"] += len(seen_positions)
+            self.stats["false_positive"] += len(candidates) - len(seen_positions)
+
+        new_records = [r for i, r in enumerate(records) if i not in seen_positions]
+        if seen_positions:
+            log.info(
+                f"기존 신호 스킵: {len(seen_positions)}건 (Bloom 후보 {len(candidates)}건 중 DB 확인) "
+                f"→ 신규 처리 대상: {len(new_records)}건"
+            )
+        return new_records
+
+    def _lookup(self, url_hashes: list[str], content_hashes: list[str]) -> tuple[set[str], set[str]]:
+        seen_urls: set[str] = set()
+        seen_contents: set[str] = set()
+        with get_session() as session:
+            for chunk in _chunks(url_hashes):
+                seen_urls.update(
+                    row[0] for row in
+                    session.query(SignalFingerprint.url_hash).filter(SignalFingerprint.url_hash.in_(chunk))
+                )
+            for chunk in _chunks(content_hashes):
+                seen_contents.update(
+                    row[0] for row in
+                    session.query(SignalFingerprint.content_hash).filter(SignalFingerprint.content_hash.in_(chunk))
+                )
+        return seen_urls, seen_contents
+
+    # ── Register ───────────────────────────────────────────────────────────
+
+    def mark_seen(self, records: list[dict]) -> int:
+        """
+        레코드(+ duplicates 로 링크된 사본) 지문 등록. 기존 지문은 last_seen_at 갱신.
+        Returns: 신규 등록 건수
+        """
+        bloom = self._ensure_loaded()
+        entries: dict[str, tuple[str, Optional[str]]] = {}
+        for record in records:
+            u_hash, c_hash = _record_keys(record)
+            entries.setdefault(u_hash, (c_hash, record.get("event_id")))
+            for dup in record.get("duplicates", []):
+                d_url, d_content = fingerprint(
+                    dup.get("url", ""), dup.get("title", ""), dup.get("published_at", ""), dup.get("publisher", ""),
+                )
+                entries.setdefault(d_url, (d_content, record.get("event_id")))
+        if not entries:
+            return 0
+
+        now = datetime.utcnow()
+        hashes = list(entries)
+        with get_session() as session:
+            existing: set[str] = set()
+            for chunk in _chunks(hashes):
+                existing.update(
+                    row[0] for row in
+                    session.query(SignalFingerprint.url_hash).filter(SignalFingerprint.url_hash.in_(chunk))
+                )
+                session.query(SignalFingerprint).filter(SignalFingerprint.url_hash.in_(chunk)).update(
+                    {SignalFingerprint.last_seen_at: now}, synchronize_session=False,
+                )
+            new_rows = [
+                {"url_hash": u_hash, "content_hash": c_hash, "event_id": event_id,
+                 "first_seen_at": now, "last_seen_at": now}
+                for u_hash, (c_hash, event_id) in entries.items()
+                if u_hash not in existing
+            ]
+            if new_rows:
+                session.execute(insert(SignalFingerprint), new_rows)
+
+        with self._lock:
+            for u_hash, (c_hash, _) in entries.items():
+                bloom.add(u_hash)
+                bloom.add(c_hash)
+        added = len(entries) - len(existing)
+        log.debug(f"Seen index 등록: 신규 {added}건, 갱신 {len(existing)}건")
+        return added
+
+
+_index: Optional[SeenIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_seen_index() -> SeenIndex:
+    """프로세스 공용 SeenIndex (첫 사용 시 Bloom filter 로드)."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SeenIndex()
+        return _index
@@ -0,0 +1,129 @@
+"""
+Signal Packing - 신호 K건을 Claude 요청 1회로 묶어 분석 (packed 모드)
+요청마다 반복되는 지침 프리앰블·왕복 지연을 K건이 나눠 부담 → 신호당 오버헤드·요청 수 감소
+
+K 결정 (PackPlanner, 토큰 예산 기반):
+  - 입력: 신호 JSON 추정 토큰 합 ≤ CLAUDE_PACK_INPUT_TOKENS
+  - 출력: K × 신호당 출력 추정치 ≤ CLAUDE_PACK_MAX_TOKENS
+  - 신호당 출력 추정치는 실제 응답 usage.output_tokens 로 갱신 (EMA + 여유 25%),
+    max_tokens 잘림 발생 시 1.5배 → 이후 묶음의 K 자동 축소
+  - 상한 CLAUDE_PACK_MAX_SIGNALS
+
+응답 검증 (parse_packed_response):
+  record_signal_analyses 도구 input 의 analyses 배열 원소를 event_id 로 입력 신호와 대조,
+  analysis_schema.validate_analysis 로 필드 검증 (부가 필드 오류는 해당 필드만 제외).
+  누락·중복·필수 필드 오류 원소의 신호만 호출 측에서 단건 분석으로 재처리.
+"""
+import logging
+import threading
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import (
+    CLAUDE_PACK_MAX_SIGNALS,
+    CLAUDE_PACK_INPUT_TOKENS,
+    CLAUDE_PACK_MAX_TOKENS,
+    CLAUDE_PACK_OUTPUT_TOKENS_PER_SIGNAL,
+)
+from pipeline.analysis_schema import needs_repair, validate_analysis
+
+log = logging.getLogger(__name__)
+
+_EMA_ALPHA = 0.3
+_OUTPUT_HEADROOM = 1.25
+_MIN_OUTPUT_PER_SIGNAL = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 보수적으로 추정: ASCII 4자당 1토큰, 한글 등 비 ASCII 1자당 1토큰.
+    예산 초과 방지용 상한 추정이므로 실제보다 약간 크게 나오는 편.
+    """
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return (len(text) - non_ascii) // 4 + non_ascii + 1
+
+
+class PackPlanner:
+    """토큰 예산 기반 묶음 크기(K) 결정 + 실제 출력량 관측으로 추정치 갱신 (스레드 안전)."""
+
+    def __init__(
+        self,
+        max_signals: int = CLAUDE_PACK_MAX_SIGNALS,
+        input_tokens: int = CLAUDE_PACK_INPUT_TOKENS,
+        max_tokens: int = CLAUDE_PACK_MAX_TOKENS,
+        output_per_signal: int = CLAUDE_PACK_OUTPUT_TOKENS_PER_SIGNAL,
+    ) -> None:
+        self._max_signals = max(1, max_signals)
+        self._input_tokens = input_tokens
+        self._max_tokens = max_tokens
+        self._output_per_signal = float(output_per_signal)
+        self._lock = threading.Lock()
+
+    @property
+    def output_capacity(self) -> int:
+        """현재 출력 추정치 기준 요청당 최대 신호 수."""
+        with self._lock:
+            fit = int(self._max_tokens // self._output_per_signal)
+        return max(1, min(self._max_signals, fit))
+
+    def next_pack(self, items: list[tuple[str, str]], start: int) -> int:
+        """
+        items: [(event_id, 신호 JSON 문자열)], start 위치부터 묶을 신호 수 반환 (최소 1).
+        같은 event_id 가 묶음 안에 두 번 나오면 그 앞에서 끊음 (응답 대조 모호성 방지).
+        """
+        capacity = self.output_capacity
+        used = 0
+        ids: set[str] = set()
+        count = 0
+        for event_id, payload in items[start:start + capacity]:
+            cost = estimate_tokens(payload)
+            if count and (used + cost > self._input_tokens or event_id in ids):
+                break
+            used += cost
+            ids.add(event_id)
+            count += 1
+        return max(count, 1)
+
+    def observe(self, signals: int, output_tokens: int, truncated: bool) -> None:
+        """묶음 응답 1건 관측 → 신호당 출력 추정치 갱신."""
+        if signals <= 0:
+            return
+        with self._lock:
+            if truncated:
+                self._output_per_signal *= 1.5
+            else:
+                observed = output_tokens / signals * _OUTPUT_HEADROOM
+                self._output_per_signal += _EMA_ALPHA * (observed - self._output_per_signal)
+            self._output_per_signal = max(self._output_per_signal, _MIN_OUTPUT_PER_SIGNAL)
+
+
+# ── Response ──────────────────────────────────────────────────────────────────
+
+def parse_packed_response(data: object, expected_ids: list[str]) -> tuple[dict[str, dict], list[str]]:
+    """
+    묶음 도구 input → ({event_id: 검증된 분석 필드}, 재처리 필요 event_id 목록).
+    analyses 배열이 없으면 (도구 미호출·잘림) 전부 재처리 대상.
+    """
+    analyses = data.get("analyses") if isinstance(data, dict) else None
+    if not isinstance(analyses, list):
+        return {}, list(expected_ids)
+
+    expected = set(expected_ids)
+    results: dict[str, dict] = {}
+    rejected: set[str] = set()
+    for item in analyses:
+        if not isinstance(item, dict):
+            continue
+        event_id = str(item.get("event_id", ""))
+        if event_id not in expected or event_id in rejected:
+            continue
+        fields, problems = validate_analysis(item)
+        if event_id in results or needs_repair(problems):
+            # 같은 ID 원소가 둘 이상이면 어느 쪽도 신뢰하지 않음
+            results.pop(event_id, None)
+            rejected.add(event_id)
+            continue
+        results[event_id] = fields
+    return results, [event_id for event_id in expected_ids if event_id not in results]
@@ -0,0 +1,234 @@
+"""
+Extractive Summarizer - Claude 입력 본문을 토큰 예산 내 핵심 문장으로 압축 (CPU 전용, LLM 미사용)
+본문 앞 N자 자르기는 기사 도입부 상투 문구만 남기고 뒤쪽 수치·기업 언급을 버리는 경우가 많음 → 문장 점수 순 선택
+
+문장 점수 (배치 전체 문장을 numpy 로 한 번에 계산):
+  - centrality: 해시 단어 벡터(crc32 → 2^20 버킷, log tf × 문서 내 idf, L2 정규화) 기준 같은 문서 다른 문장들과의 평균 코사인 유사도
+                (TextRank 1회 반복에 해당하는 degree centrality), 문서 내 최댓값으로 정규화.
+                (문장, 단어) 희소 항목 배열에 np.unique / bincount 만 사용 → 배치 크기에 선형, 밀집 행렬 없음
+  - keyword:    STRATEGIC_KEYWORDS · TARGET_COMPANIES 히트 수 (3개 포화) — 문서 1회 스캔 후 히트 키워드만 문장별 확인
+  - number:     숫자(금액·비율·대수 등) 포함 여부
+  - 구독·쿠키·저작권·기자 연락처 문구와 15자 미만 문장은 감점 (다른 문장이 예산을 채우면 제외)
+선택: 점수 내림차순으로 예산(signal_pack.estimate_tokens 기준)에 들어가는 문장만 담고 원문 순서로 결합.
+      예산 이하 본문은 그대로, 결과는 결정적 (LLM 응답 캐시 키 안정).
+예산: SUMMARIZER_*_TOKENS 는 영문 본문 기준 (ASCII 4자 ≈ 1토큰, 기존 앞 N자 자르기와 같은 글자 수).
+      estimate_tokens 는 한글 1자 = 1토큰으로 세므로 그대로 쓰면 한글 본문은 영문의 1/4 글자만 남음
+      → 본문별 문자 체계 비율로 예산 확대 (script_budget: 한글 본문도 영문과 같은 글자 수 유지)
+SUMMARIZER_ENABLED=false 이면 같은 예산으로 본문 앞부분만 자름.
+"""
+import re
+import threading
+import zlib
+from functools import lru_cache
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from config import SUMMARIZER_ENABLED, STRATEGIC_KEYWORDS, TARGET_COMPANIES
+from pipeline.keyword_matcher import KeywordMatcher
+from pipeline.signal_pack import estimate_tokens
+
+_BUCKET_BITS = 20
+_MIN_SENTENCE_CHARS = 15
+_KEYWORD_SATURATION = 3
+_WEIGHTS = (0.45, 0.35, 0.20)  # centrality, keyword, number
+_MEMO_SIZE = 8192
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+|\s*\n+\s*")
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣]{2,}")
+_NUMBER_RE = re.compile(r"\d")
+_BOILERPLATE_RE = re.compile(
+    r"subscribe|newsletter|cookie|all rights reserved|click here|read more|sign up|"
+    r"무단\s*전재|재배포\s*금지|구독|[\w.+-]+@[\w-]+\.[\w.]+",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1)
+def _keyword_matcher() -> KeywordMatcher:
+    return KeywordMatcher({"keyword": STRATEGIC_KEYWORDS, "company": TARGET_COMPANIES})
+
+
+def script_budget(text: str, budget: int) -> int:
+    """영문 기준 토큰 예산 → 본문 문자 체계 반영 예산 (비 ASCII 비중만큼 확대, 같은 예산이면 같은 글자 수)."""
+    return max(budget, budget * estimate_tokens(text) // (len(text) // 4 + 1))
+
+
+def over_budget(text: str, budget: int) -> bool:
+    return bool(text) and estimate_tokens(text) > script_budget(text, budget)
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s.strip() for s in _SENTENCE_RE.split(text) if s and s.strip()]
+
+
+def head(text: str, budget: int) -> str:
+    """본문 앞부분을 토큰 예산까지 (estimate_tokens 와 같은 산식, 문자 단위)."""
+    used = 1.0
+    for i, ch in enumerate(text):
+        used += 1.0 if ord(ch) > 127 else 0.25
+        if used > budget:
+            return text[:i]
+    return text
+
+
+def _cost(sentence: str) -> int:
+    return len(sentence) // 4 + 1 if sentence.isascii() else estimate_tokens(sentence)
+
+
+def _centrality(sentences: list[str], doc_ids: np.ndarray, n_docs: int) -> np.ndarray:
+    """문장별 같은 문서 다른 문장들과의 평균 코사인 유사도 (문서 내 최댓값 = 1)."""
+    sent_idx: list[int] = []
+    buckets: list[int] = []
+    for i, sentence in enumerate(sentences):
+        for token in _TOKEN_RE.findall(sentence.lower()):
+            sent_idx.append(i)
+            buckets.append(zlib.crc32(token.encode("utf-8")))
+    n = len(sentences)
+    if not sent_idx:
+        return np.zeros(n)
+    rows = np.array(sent_idx, dtype=np.int64)
+    cols = np.array(buckets, dtype=np.int64) & ((1 << _BUCKET_BITS) - 1)
+
+    # (문장, 단어) 항목 → 같은 문서 (문서, 단어) 항목
+    entries, inverse = np.unique((rows << _BUCKET_BITS) | cols, return_inverse=True)
+    entry_rows = entries >> _BUCKET_BITS
+    entry_docs = doc_ids[entry_rows]
+    _, doc_inverse = np.unique((entry_docs << _BUCKET_BITS) | (entries & ((1 << _BUCKET_BITS) - 1)), return_inverse=True)
+    sizes = np.bincount(doc_ids, minlength=n_docs)
+
+    # log tf × 문서 내 smooth idf (배치 구성과 무관 → 같은 본문이면 같은 결과) → 문장별 L2 정규화
+    doc_freq = np.bincount(doc_inverse)[doc_inverse]
+    values = np.log1p(np.bincount(inverse)) * (np.log((1 + sizes[entry_docs]) / (1 + doc_freq)) + 1)
+    values /= np.sqrt(np.bincount(entry_rows, weights=values ** 2, minlength=n))[entry_rows]
+
+    # 문서별 단어 합 벡터와의 내적 − 자기 자신 = 같은 문서 다른 문장들과의 유사도 합
+    doc_sums = np.bincount(doc_inverse, weights=values)
+    similarity = np.bincount(entry_rows, weights=values * doc_sums[doc_inverse], minlength=n)
+    similarity -= np.bincount(entry_rows, weights=values ** 2, minlength=n)
+    centrality = similarity / np.maximum(sizes[doc_ids] - 1, 1)
+
+    peak = np.zeros(n_docs)
+    np.maximum.at(peak, doc_ids, centrality)
+    return centrality / np.where(peak > 0, peak, 1.0)[doc_ids]
+
+
+def _keyword_hits(docs: list[list[str]]) -> np.ndarray:
+    """문장별 전략 키워드·기업 히트 수. 문서 1회 스캔 후 히트한 키워드만 문장별 부분 문자열 확인 (같은 매칭 규칙)."""
+    matcher = _keyword_matcher()
+    hits: list[int] = []
+    for doc in docs:
+        found = {k.lower() for keywords in matcher.scan(" ".join(doc)).values() for k in keywords}
+        if not found:
+            hits.extend([0] * len(doc))
+            continue
+        for sentence in doc:
+            lowered = sentence.lower()
+            hits.append(sum(1 for keyword in found if keyword in lowered))
+    return np.array(hits, dtype=float)
+
+
+def score_sentences(docs: list[list[str]]) -> list[np.ndarray]:
+    """문서별 문장 목록 → 문서별 문장 점수 배열 (배치 전체 문장을 한 번에 계산)."""
+    sentences = [s for doc in docs for s in doc]
+    lengths = np.array([len(doc) for doc in docs], dtype=np.int64)
+    doc_ids = np.repeat(np.arange(len(docs), dtype=np.int64), lengths)
+
+    centrality = _centrality(sentences, doc_ids, len(docs))
+    keyword = np.minimum(_keyword_hits(docs), _KEYWORD_SATURATION) / _KEYWORD_SATURATION
+    number = np.array([_NUMBER_RE.search(s) is not None for s in sentences], dtype=float)
+    penalty = np.array(
+        [len(s) < _MIN_SENTENCE_CHARS or _BOILERPLATE_RE.search(s) is not None for s in sentences], dtype=float,
+    )
+
+    w_centrality, w_keyword, w_number = _WEIGHTS
+    scores = w_centrality * centrality + w_keyword * keyword + w_number * number - penalty
+    return np.split(scores, np.cumsum(lengths)[:-1]) if len(docs) else []
+
+
+def select_sentences(sentences: list[str], scores: np.ndarray, budget: int) -> str:
+    """
+    점수 내림차순으로 예산에 들어가는 문장 선택 → 원문 순서로 결합.
+    0점 이하 문장은 채울 문장이 없을 때만, 같은 문장 반복은 1번만.
+    """
+    costs = [_cost(s) for s in sentences]
+    chosen: list[int] = []
+    seen: set[str] = set()
+    used = 0
+    for i in np.argsort(-scores, kind="stable"):
+        if scores[i] <= 0 and chosen:
+            break
+        if used + costs[i] <= budget and sentences[i] not in seen:
+            chosen.append(int(i))
+            seen.add(sentences[i])
+            used += costs[i]
+    if not chosen:
+        return head(sentences[int(np.argmax(scores))], budget)
+    return " ".join(sentences[i] for i in sorted(chosen))
+
+
+def summarize_batch(texts: list[str], budget: int, extractive: bool = True) -> list[str]:
+    """본문 목록 → 영문 기준 토큰 예산 내 요약 목록 (본문별 script_budget, 예산 이하 본문은 그대로)."""
+    results = list(texts)
+    long_ids = [i for i, text in enumerate(texts) if over_budget(text, budget)]
+    budgets = {i: script_budget(texts[i], budget) for i in long_ids}
+    if not extractive:
+        for i in long_ids:
+            results[i] = head(texts[i], budgets[i])
+        return results
+    docs = [split_sentences(texts[i]) for i in long_ids]
+    for i, sentences, scores in zip(long_ids, docs, score_sentences(docs)):
+        results[i] = select_sentences(sentences, scores, budgets[i]) if sentences else head(texts[i], budgets[i])
+    return results
+
+
+class ExtractiveSummarizer:
+    """
+    분석기용 요약 메모 (스레드 안전). prime() 으로 배치 본문을 한 번에 점수화해 두면
+    요청 파라미터 구성 시 summarize() 는 메모 조회만 함 (메모에 없으면 그 본문만 계산).
+    """
+
+    def __init__(self, enabled: bool = SUMMARIZER_ENABLED) -> None:
+        self._enabled = enabled
+        self._memo: dict[tuple[int, str], str] = {}
+        self._lock = threading.Lock()
+        self.stats = {"texts": 0, "input_tokens": 0, "output_tokens": 0}
+
+    def prime(self, texts: list[str], budget: int) -> None:
+        """예산 초과 본문 일괄 요약 → 메모 (이미 계산한 본문 제외)."""
+        with self._lock:
+            pending = list(dict.fromkeys(
+                text for text in texts
+                if (budget, text) not in self._memo and over_budget(text, budget)
+            ))
+        if not pending:
+            return
+        summaries = summarize_batch(pending, budget, self._enabled)
+        with self._lock:
+            if len(self._memo) + len(pending) > _MEMO_SIZE:
+                self._memo.clear()
+            for text, summary in zip(pending, summaries):
+                self._memo[(budget, text)] = summary
+                self.stats["texts"] += 1
+                self.stats["input_tokens"] += estimate_tokens(text)
+                self.stats["output_tokens"] += estimate_tokens(summary)
+
+    def summarize(self, text: str, budget: int) -> str:
+        if not over_budget(text, budget):
+            return text or ""
+        with self._lock:
+            summary = self._memo.get((budget, text))
+        if summary is None:
+            summary = summarize_batch([text], budget, self._enabled)[0]
+            with self._lock:
+                self._memo[(budget, text)] = summary
+        return summary
+
+    def summary(self) -> str:
+        s = self.stats
+        ratio = s["output_tokens"] / s["input_tokens"] if s["input_tokens"] else 0.0
+        mode = "추출 요약" if self._enabled else "앞부분 자르기"
+        return f"{mode} {s['texts']}건, 추정 토큰 {s['input_tokens']} → {s['output_tokens']} ({ratio:.0%})"
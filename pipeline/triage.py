@@ -0,0 +1,237 @@
+"""
+Signal Triage - 분석 전 로컬 점수화 → LLM 분석 등급 배정
+API 예산을 실제로 저장·노출될 신호에만 사용
+
+점수 (배치 전체를 pandas/numpy 로 벡터 연산):
+  - quality:   DataArchivist.calculate_quality_score 와 동일 산식 (Metadata 40 / Authority 30 / Content 20 / Timeliness 10)
+               → MIN_QUALITY_SCORE 미달이면 저장 단계에서 버려지므로 LLM 분석 생략
+  - relevance: 전략 키워드 히트 수(3개 포화) 50% + TARGET_COMPANIES 언급 30% + 뉴스 카테고리 매칭 20%
+  - novelty:   1 − 최근 저장 신호(TRIAGE_NOVELTY_LOOKBACK_DAYS) 제목과의 최대 MinHash 유사도
+  - priority:  TRIAGE_WEIGHTS 가중합
+
+등급 (record["triage"]["tier"]):
+  full  — priority ≥ TRIAGE_FULL_MIN_PRIORITY: 기존 전체 분석 (CLAUDE_ANALYSIS_MODEL)
+  lite  — priority ≥ TRIAGE_LITE_MIN_PRIORITY: 요약·분류 중심 간이 분석 (CLAUDE_LITE_MODEL, 짧은 입력·출력)
+  local — 그 외 또는 품질 미달: LLM 호출 없이 본문 앞부분 요약 + 키워드 카테고리
+"""
+import logging
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    CONFIDENCE_WEIGHTS,
+    MIN_QUALITY_SCORE,
+    TARGET_COMPANIES,
+    TRIAGE_WEIGHTS,
+    TRIAGE_FULL_MIN_PRIORITY,
+    TRIAGE_LITE_MIN_PRIORITY,
+    TRIAGE_NOVELTY_LOOKBACK_DAYS,
+    TRIAGE_NOVELTY_MAX_REFERENCES,
+)
+from pipeline.dedup import minhash, title_features
+from pipeline.keyword_matcher import STRATEGIC_GROUP, KeywordMatcher, category_from_hits, get_matcher
+
+log = logging.getLogger(__name__)
+
+TIERS = ("full", "lite", "local")
+
+_META_FIELDS = ("url", "publisher", "published_at", "scraped_at", "confidence_score")
+_COMPANY_GROUP = "__company__"
+_SCAN_CHARS = 2000          # 키워드 스캔 범위 (제목 + 본문 앞부분)
+_SIMILARITY_CHUNK = 256     # novelty 계산 시 배치 행 단위 (메모리 상한)
+_LOCAL_SUMMARY_CHARS = 300
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?。])\s+")
+_SIGNATURE_WIDTH = len(minhash(frozenset({"_"})))
+
+
+@lru_cache(maxsize=1)
+def _company_matcher() -> KeywordMatcher:
+    return KeywordMatcher({_COMPANY_GROUP: TARGET_COMPANIES})
+
+
+# ── Scores ────────────────────────────────────────────────────────────────────
+
+def quality_scores(frame: pd.DataFrame) -> np.ndarray:
+    """DataArchivist.calculate_quality_score 의 벡터화 버전 (산식 변경 시 함께 수정)."""
+    completeness = frame[[f"has_{f}" for f in _META_FIELDS]].mean(axis=1).to_numpy()
+
+    publisher = frame["publisher"].str.lower()
+    authority = np.full(len(frame), CONFIDENCE_WEIGHTS.get("RSS", 0.60))
+    assigned = np.zeros(len(frame), dtype=bool)
+    for source_key, weight in CONFIDENCE_WEIGHTS.items():  # 선언 순서상 첫 매칭 우선
+        match = publisher.str.contains(source_key.lower(), regex=False).to_numpy() & ~assigned
+        authority[match] = weight
+        assigned |= match
+
+    richness = np.minimum(
+        frame["title_len"].to_numpy() / 50 * 0.3 + frame["content_len"].to_numpy() / 500 * 0.7, 1.0,
+    )
+
+    published = pd.to_datetime(frame["published_at"], utc=True, errors="coerce", format="ISO8601")
+    days_old = ((pd.Timestamp.now(tz="UTC") - published) // pd.Timedelta(days=1)).to_numpy(dtype=float, na_value=np.nan)
+    timeliness = np.where(np.isnan(days_old), 0.5, np.maximum(0.0, 1.0 - days_old / 60))
+
+    score = completeness * 0.40 + authority * 0.30 + richness * 0.20 + timeliness * 0.10
+    return np.round(np.minimum(score, 1.0), 3)
+
+
+def _signature_matrix(titles: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """제목 MinHash 서명 행렬 + 유효 행 마스크 (단어 없는 제목은 비교 제외)."""
+    signatures = [minhash(title_features(t)) for t in titles]
+    valid = np.array([s is not None for s in signatures], dtype=bool)
+    matrix = np.zeros((len(titles), _SIGNATURE_WIDTH), dtype=np.uint32)
+    for i, signature in enumerate(signatures):
+        if signature is not None:
+            matrix[i] = signature
+    return matrix, valid
+
+
+def max_similarity(batch: np.ndarray, references: np.ndarray) -> np.ndarray:
+    """배치 행별 references 와의 최대 추정 Jaccard (서명 일치 비율)."""
+    if len(batch) == 0 or len(references) == 0:
+        return np.zeros(len(batch))
+    result = np.empty(len(batch))
+    for start in range(0, len(batch), _SIMILARITY_CHUNK):
+        block = batch[start:start + _SIMILARITY_CHUNK]
+        result[start:start + len(block)] = (block[:, None, :] == references[None, :, :]).mean(axis=2).max(axis=1)
+    return result
+
+
+# ── Local analysis ────────────────────────────────────────────────────────────
+
+def local_analysis(record: dict) -> dict:
+    """LLM 없이 분석 필드 채움: 본문 앞 문장(최대 _LOCAL_SUMMARY_CHARS) + 키워드 기반 카테고리."""
+    content = " ".join((record.get("raw_content") or "").split())
+    summary = ""
+    for sentence in _SENTENCE_END_RE.split(content):
+        if summary and len(summary) + len(sentence) + 1 > _LOCAL_SUMMARY_CHARS:
+            break
+        summary = f"{summary} {sentence}".strip()
+    summary = summary[:_LOCAL_SUMMARY_CHARS] or record.get("title", "")
+
+    if not record.get("category"):
+        record["category"] = category_from_hits(get_matcher().scan(f"{record.get('title', '')} {content}"))
+    record.setdefault("summary", summary)
+    record.setdefault("strategic_implication", "자동 분류 신호 (LLM 분석 생략) — 필요 시 재분석.")
+    record.setdefault("key_insights", [])
+    record.setdefault("analyzed_by", "local")
+    return record
+
+
+# ── Triage ────────────────────────────────────────────────────────────────────
+
+class SignalTriage:
+    """
+    배치 단위 점수화 + 등급 배정.
+    novelty 기준 제목은 첫 호출 시 DB 에서 1회 로드, 이후 route() 한 배치 제목을 누적
+    (리플레이 청크 간에도 같은 화제 반복 유입을 낮은 novelty 로 판정).
+    """
+
+    def __init__(self) -> None:
+        self._references: Optional[np.ndarray] = None
+        self._pending = np.zeros((0, _SIGNATURE_WIDTH), dtype=np.uint32)  # 마지막 score() 배치 서명
+        self.counts = {tier: 0 for tier in TIERS}
+
+    def _load_references(self) -> np.ndarray:
+        from database.init_db import get_session
+        from database.models import MarketSignal
+
+        since = datetime.utcnow() - timedelta(days=TRIAGE_NOVELTY_LOOKBACK_DAYS)
+        try:
+            with get_session() as session:
+                titles = [
+                    row[0] for row in session.query(MarketSignal.title)
+                    .filter(MarketSignal.published_at >= since)
+                    .order_by(MarketSignal.published_at.desc())
+                    .limit(TRIAGE_NOVELTY_MAX_REFERENCES)
+                ]
+        except Exception as e:
+            log.warning(f"Triage novelty 기준 로드 실패, novelty=1.0 으로 진행: {e}")
+            titles = []
+        matrix, valid = _signature_matrix(titles)
+        return matrix[valid]
+
+    def score(self, records: list[dict]) -> pd.DataFrame:
+        """레코드별 quality / relevance / novelty / priority (입력 순서 그대로의 DataFrame)."""
+        metas = [r.get("source_metadata", {}) for r in records]
+        frame = pd.DataFrame({
+            **{f"has_{f}": [bool(m.get(f)) for m in metas] for f in _META_FIELDS},
+            "publisher": [m.get("publisher") or "" for m in metas],
+            "title_len": [len(r.get("title", "")) for r in records],
+            "content_len": [len(r.get("raw_content", "") or r.get("summary", "")) for r in records],
+            "published_at": [str(m.get("published_at") or "") for m in metas],
+        })
+        frame["quality"] = quality_scores(frame)
+
+        matcher, companies = get_matcher(), _company_matcher()
+        texts = [f"{r.get('title', '')} {(r.get('raw_content') or '')[:_SCAN_CHARS]}" for r in records]
+        hits = [matcher.scan(t) for t in texts]
+        strategic = np.array([len(h.get(STRATEGIC_GROUP, ())) for h in hits], dtype=float)
+        has_company = np.array([bool(companies.scan(t)) for t in texts], dtype=float)
+        has_category = np.array([any(g != STRATEGIC_GROUP for g in h) for h in hits], dtype=float)
+        frame["relevance"] = np.round(
+            np.minimum(strategic / 3, 1.0) * 0.5 + has_company * 0.3 + has_category * 0.2, 3,
+        )
+
+        if self._references is None:
+            self._references = self._load_references()
+        batch, valid = _signature_matrix([r.get("title", "") for r in records])
+        similarity = np.where(valid, max_similarity(batch, self._references), 0.0)
+        frame["novelty"] = np.round(1.0 - similarity, 3)
+        self._pending = batch[valid]
+
+        weights = TRIAGE_WEIGHTS
+        frame["priority"] = np.round(
+            frame["quality"] * weights["quality"]
+            + frame["relevance"] * weights["relevance"]
+            + frame["novelty"] * weights["novelty"],
+            3,
+        )
+        return frame
+
+    def route(self, records: list[dict]) -> dict[str, list[dict]]:
+        """
+        등급별 레코드 목록 {"full": [...], "lite": [...], "local": [...]} (등급 내 입력 순서 유지).
+        각 레코드에 record["triage"] = {tier, reason, quality, relevance, novelty, priority} 기록.
+        """
+        routed: dict[str, list[dict]] = {tier: [] for tier in TIERS}
+        if not records:
+            return routed
+        frame = self.score(records)
+
+        quality = frame["quality"].to_numpy()
+        priority = frame["priority"].to_numpy()
+        below_quality = quality < MIN_QUALITY_SCORE
+        tiers = np.select(
+            [below_quality, priority >= TRIAGE_FULL_MIN_PRIORITY, priority >= TRIAGE_LITE_MIN_PRIORITY],
+            ["local", "full", "lite"],
+            default="local",
+        )
+        reasons = np.where(below_quality, "quality_below_min", "priority")
+
+        columns = frame[["quality", "relevance", "novelty", "priority"]].to_dict("records")
+        for record, tier, reason, scores in zip(records, tiers, reasons, columns):
+            tier = str(tier)
+            record["triage"] = {"tier": tier, "reason": str(reason), **scores}
+            analysis_step = "analysis" if tier == "full" else "analysis-lite" if tier == "lite" else "local"
+            record["processing_pipeline"] = f"scout->triage->{analysis_step}->archivist"
+            routed[tier].append(record)
+
+        # 배정을 마친 배치 제목을 이후 route() 의 novelty 기준에 추가
+        self._references = np.concatenate([self._references, self._pending])
+        for tier in TIERS:
+            self.counts[tier] += len(routed[tier])
+        log.info(
+            f"Triage: {len(records)}건 → full {len(routed['full'])} / lite {len(routed['lite'])} / "
+            f"local {len(routed['local'])} (품질 미달 {int(below_quality.sum())}건 포함)"
+        )
+        return routed
@@ -5,11 +5,13 @@ PASIS 파이프라인 엔트리포인트
   python run_pipeline.py --once   # 즉시 1회 실행
   python run_pipeline.py --daemon # 스케줄러 데몬 시작
   python run_pipeline.py --init   # DB 초기화만 (데모 데이터 시딩)
+  python run_pipeline.py --replay "data/raw/*_scout.jsonl*"   # 저장된 원본 재처리 (수집 없음)
 """
 import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 # 프로젝트 루트를 sys.path에 추가
 sys.path.insert(0, str(Path(__file__).parent))
@@ -24,40 +26,73 @@ logging.basicConfig(
 )
 log = logging.getLogger("run_pipeline")
 
+from config import (
+    ANALYSIS_CHECKPOINT_ENABLED,
+    CLAUDE_ANALYSIS_MODE,
+    PROCESSED_DIR,
+    REPLAY_CHUNK_SIZE,
+    REPLAY_MAX_WORKERS,
+    TRIAGE_ENABLED,
+)
+
 
 def _filter_new_signals(raw_records: list[dict]) -> list[dict]:
-    """이미 DB에 존재하는 source_url 신호를 분석 전에 제외."""
-    from database.init_db import get_session
-    from database.models import MarketSignal
+    """
+    이미 본 신호를 분석·저장 전에 제외.
+    SeenIndex: Bloom filter 음성은 DB 조회 없이 신규, 양성 후보만 signal_fingerprints 배치 확인
+    (정규 URL 해시 또는 제목+발행일 해시 일치).
+    """
+    from pipeline.seen_index import get_seen_index
 
-    urls = [r.get("source_metadata", {}).get("url", "") for r in raw_records]
-    if not urls:
+    try:
+        return get_seen_index().filter_new(raw_records)
+    except Exception as e:
+        log.warning(f"Seen index 체크 실패, 전체 분석 진행: {e}")
         return raw_records
 
+
+def _triage_and_analyze(
+    analyzer: object, triage: Optional[object], records: list[dict], **analyze_kwargs: object,
+) -> list[dict]:
+    """
+    SignalTriage 등급별 분석: full·lite → analyzer.analyze_batch (등급별 프롬프트는 analyzer 가 선택),
+    local → LLM 없이 local_analysis. triage=None 이면 전체 분석.
+    local 결과도 save_processed 면 data/processed/*_analyzed 에 기록 (리플레이가 분석 생략 레코드로 재사용).
+    """
+    if triage is None:
+        return analyzer.analyze_batch(records, **analyze_kwargs) if records else []
+
+    from pipeline.triage import local_analysis
+
+    routed = triage.route(records)
+    to_llm = [r for r in records if r["triage"]["tier"] != "local"]
+    analyzed = analyzer.analyze_batch(to_llm, **analyze_kwargs) if to_llm else []
+    local = [local_analysis(r) for r in routed["local"]]
+    if local and analyze_kwargs.get("save_processed", True):
+        from pipeline.jsonl_sink import JsonlSink
+
+        with JsonlSink(PROCESSED_DIR, "analyzed") as sink:
+            for record in local:
+                sink.write(record)
+    return analyzed + local
+
+
+def _commit_fetch_state(scout: object, stored_all: bool) -> None:
+    """수집 레코드 DB 저장이 끝났을 때만 수집 진행 상태 기록 (실패 시 다음 실행에서 같은 항목 재수집)."""
+    if not stored_all:
+        log.warning("DB 저장 미완료 — 수집 진행 상태를 기록하지 않음 (다음 실행에서 재수집)")
+        return
     try:
-        with get_session() as session:
-            existing_urls = {
-                row[0] for row in
-                session.query(MarketSignal.source_url)
-                .filter(MarketSignal.source_url.in_(urls))
-                .all()
-            }
-        new_records = [
-            r for r in raw_records
-            if r.get("source_metadata", {}).get("url", "") not in existing_urls
-        ]
-        skipped = len(raw_records) - len(new_records)
-        if skipped > 0:
-            log.info(f"기존 신호 스킵: {skipped}건 (이미 DB 존재) → 신규 분석 대상: {len(new_records)}건")
-        return new_records
+        scout.commit_fetch_state()
     except Exception as e:
-        log.warning(f"DB 체크 실패, 전체 분석 진행: {e}")
-        return raw_records
+        log.error(f"수집 진행 상태 저장 오류: {e}")
 
 
-def run_once() -> dict:
+def run_once(analysis_mode: str = CLAUDE_ANALYSIS_MODE) -> dict:
     """
     데이터 수집 → 분석 → DB 저장 → 주간 리포트 생성 1회 실행.
+    분석 결과는 ANALYSIS_CHECKPOINT_ENABLED 시 신호별 저널 기록 + 마이크로 배치 저장 (중단 후 다음 실행에서 재개).
+    analysis_mode: realtime (동시 호출) | packed (K건/요청 묶음) | batch (Message Batches, 완료까지 대기)
     Returns: 수행 결과 summary dict
     """
     log.info("=== PASIS 파이프라인 1회 실행 시작 ===")
@@ -65,9 +100,15 @@ def run_once() -> dict:
     from pipeline.scout import PhysicalAIScout
     from pipeline.analyzer import StrategicAnalyzer
     from pipeline.archivist import DataArchivist
+    from pipeline.checkpoint import AnalysisCheckpoint
+    from pipeline.dedup import NearDuplicateDetector
     from pipeline.scheduler import _generate_and_save_weekly_report
+    from pipeline.triage import SignalTriage
 
     result = {"inserted": 0, "updated": 0, "errors": [], "total_collected": 0}
+    # 수집분이 모두 DB 에 저장됐는지 — 아닐 때는 수집 진행 상태(HTTP 검증자·EDGAR accession·OAI datestamp)를
+    # 기록하지 않음 → 다음 실행이 같은 항목을 다시 수집
+    stored_all = True
 
     # Step 1: 수집
     try:
@@ -75,6 +116,9 @@ def run_once() -> dict:
         raw_records = scout.run_all(days_back=14, save_raw=True)
         result["total_collected"] = len(raw_records)
         log.info(f"Step 1 완료: {len(raw_records)}건 수집")
+        # 교차 소스 근접 중복: 클러스터당 대표 1건만 분석, 나머지는 duplicates 로 링크
+        detector = NearDuplicateDetector()
+        raw_records = detector.cluster(raw_records)
     except Exception as e:
         log.error(f"Step 1 수집 오류: {e}")
         result["errors"].append(f"수집: {e}")
@@ -82,35 +126,64 @@ def run_once() -> dict:
 
     # Step 1b: Key Player 뉴스 피드 (Claude 분석 없이 직접 DB 저장)
     try:
-        news_records = scout.fetch_key_player_news(days_back=14)
+        news_records = _filter_new_signals(detector.cluster(scout.fetch_key_player_news(days_back=14)))
         if news_records:
             from pipeline.archivist import DataArchivist as _DA
             archivist_direct = _DA()
-            archivist_direct.run_pipeline(news_records)
+            news_result = archivist_direct.run_pipeline(news_records)
+            if not news_result.get("stored", True):
+                result["errors"].extend(f"뉴스 피드 저장: {e}" for e in news_result.get("errors", []))
+                stored_all = False
             log.info(f"뉴스 피드 직접 저장: {len(news_records)}건")
     except Exception as e:
         log.error(f"Step 1b 뉴스 피드 오류: {e}")
         result["errors"].append(f"뉴스 피드: {e}")
+        stored_all = False
 
     if not raw_records:
         log.warning("수집 결과 없음. 파이프라인 중단.")
+        _commit_fetch_state(scout, stored_all)
         return result
 
-    # Step 2: 분석 (신규 신호만)
+    # Step 2: 분석 (신규 신호만, triage 등급별 full / lite / local)
+    #   체크포인트: 분석 1건마다 저널 기록 + 마이크로 배치 DB 저장, 중단된 이전 실행의 분석 결과는 재분석 없이 재사용
+    archivist = DataArchivist()
+    checkpoint = AnalysisCheckpoint(archivist.run_pipeline) if ANALYSIS_CHECKPOINT_ENABLED else None
     try:
         analyzer = StrategicAnalyzer()
-        new_records = _filter_new_signals(raw_records)
-        analyzed_records = analyzer.analyze_batch(new_records, save_processed=True) if new_records else []
-        log.info(f"Step 2 완료: {len(analyzed_records)}건 분석 (전체 수집 {len(raw_records)}건 중 신규)")
+        recovered = _filter_new_signals(checkpoint.resume()) if checkpoint is not None else []
+        recovered_ids = {r["event_id"] for r in recovered}
+        new_records = [r for r in _filter_new_signals(raw_records) if r.get("event_id") not in recovered_ids]
+        triage = SignalTriage() if TRIAGE_ENABLED else None
+        analyzed_records = recovered + _triage_and_analyze(
+            analyzer, triage, new_records, save_processed=True, mode=analysis_mode, checkpoint=checkpoint,
+        )
+        log.info(
+            f"Step 2 완료: {len(analyzed_records)}건 분석 (전체 수집 {len(raw_records)}건 중 신규"
+            f"{f', 중단 실행 재개 {len(recovered)}건' if recovered else ''})"
+        )
+        result["analysis_parse_failure_rate"] = round(analyzer.parse_failure_rate, 4)
+        result["llm_run_id"] = analyzer.run_id
     except Exception as e:
         log.error(f"Step 2 분석 오류: {e}")
         analyzed_records = raw_records  # 분석 실패 시 원본 사용
         result["errors"].append(f"분석: {e}")
 
-    # Step 3: DB 저장
+    # Step 3: DB 저장 (체크포인트 사용 시 마이크로 배치로 저장되지 않은 나머지 — 재개분·local 등급·분석 실패 원본)
     try:
-        archivist = DataArchivist()
-        ingest_result = archivist.run_pipeline(analyzed_records) if analyzed_records else {"rows_inserted": 0, "rows_updated": 0, "errors": []}
+        if checkpoint is not None:
+            checkpoint.stage(checkpoint.unstaged(analyzed_records))
+            if not checkpoint.close():
+                result["errors"].append("저장: 일부 레코드 DB 저장 실패 (분석 저널 유지, 다음 실행에서 재개)")
+                stored_all = False
+            ingest_result = checkpoint.ingest
+            log.info(f"분석 체크포인트: {checkpoint.summary()}")
+        elif analyzed_records:
+            ingest_result = archivist.run_pipeline(analyzed_records)
+            # archivist 는 DB 오류를 예외 대신 stored=False 로 알림
+            stored_all = stored_all and ingest_result.get("stored", True)
+        else:
+            ingest_result = {"rows_inserted": 0, "rows_updated": 0, "errors": []}
         result["inserted"] = ingest_result.get("rows_inserted", 0)
         result["updated"] = ingest_result.get("rows_updated", 0)
         result["errors"].extend(ingest_result.get("errors", []))
@@ -118,6 +191,8 @@ def run_once() -> dict:
     except Exception as e:
         log.error(f"Step 3 저장 오류: {e}")
         result["errors"].append(f"저장: {e}")
+        stored_all = False
+    _commit_fetch_state(scout, stored_all)
 
     # Step 4: 주간 리포트
     try:
@@ -131,6 +206,88 @@ def run_once() -> dict:
     return result
 
 
+def _chunked(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    chunk: list[dict] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_replay(
+    patterns: list[str],
+    max_workers: int = REPLAY_MAX_WORKERS,
+    chunk_size: int = REPLAY_CHUNK_SIZE,
+    include_existing: bool = False,
+    reanalyze: bool = False,
+    analysis_mode: str = CLAUDE_ANALYSIS_MODE,
+) -> dict:
+    """
+    저장된 raw/processed 파일을 스트리밍으로 재처리 (웹 수집 없음).
+    청크 단위: [DB 기존 신호 필터] → [분석] → [DB 저장]
+
+    - *_scout.jsonl* / *_scout.json : 원본 → 분석 후 저장
+    - *_analyzed.jsonl* / *_analyzed.json : 이미 분석된 레코드는 분석 생략 (reanalyze=True 시 재분석)
+    - include_existing=True : DB에 이미 있는 신호도 재분석·갱신 (프롬프트·점수 규칙 변경 검증용)
+
+    Returns: 수행 결과 summary dict
+    """
+    log.info(f"=== PASIS 리플레이 시작: {patterns} (workers={max_workers}) ===")
+
+    from pipeline.analyzer import StrategicAnalyzer
+    from pipeline.archivist import DataArchivist
+    from pipeline.dedup import NearDuplicateDetector
+    from pipeline.jsonl_sink import iter_records
+    from pipeline.triage import SignalTriage
+
+    analyzer = StrategicAnalyzer()
+    archivist = DataArchivist()
+    triage = SignalTriage() if TRIAGE_ENABLED else None
+    result = {"read": 0, "analyzed": 0, "inserted": 0, "updated": 0, "errors": []}
+    detector = NearDuplicateDetector()
+
+    for chunk in _chunked(iter_records(patterns), chunk_size):
+        result["read"] += len(chunk)
+
+        # 리플레이 입력 간 중복 (동일·근접 중복 기사가 여러 파일에 존재) 제거
+        unique = detector.cluster(chunk)
+
+        records = unique if include_existing else _filter_new_signals(unique)
+        if not records:
+            continue
+
+        to_analyze, already = [], []
+        for record in records:
+            (already if record.get("analyzed_by") and not reanalyze else to_analyze).append(record)
+        try:
+            analyzed = _triage_and_analyze(
+                analyzer, triage, to_analyze, save_processed=True, max_workers=max_workers, mode=analysis_mode,
+            )
+            result["analyzed"] += len(analyzed)
+        except Exception as e:
+            log.error(f"리플레이 분석 오류: {e}")
+            result["errors"].append(f"분석: {e}")
+            analyzed = to_analyze
+
+        try:
+            ingest_result = archivist.run_pipeline(already + analyzed)
+            result["inserted"] += ingest_result.get("rows_inserted", 0)
+            result["updated"] += ingest_result.get("rows_updated", 0)
+            result["errors"].extend(ingest_result.get("errors", []))
+        except Exception as e:
+            log.error(f"리플레이 저장 오류: {e}")
+            result["errors"].append(f"저장: {e}")
+
+        log.info(f"리플레이 진행: 읽음={result['read']}, 분석={result['analyzed']}, "
+                 f"신규={result['inserted']}, 갱신={result['updated']}")
+
+    log.info(f"=== PASIS 리플레이 완료: {result} ===")
+    return result
+
+
 def init_db_only() -> None:
     """DB 초기화 + 데모 데이터 시딩만 실행."""
     from database.init_db import init_db
@@ -147,6 +304,18 @@ def main() -> None:
                        help="스케줄러 데몬 모드 (주간 자동 실행)")
     group.add_argument("--init", action="store_true",
                        help="DB 초기화만 실행")
+    group.add_argument("--replay", nargs="+", metavar="PATH_OR_GLOB",
+                       help="저장된 raw/processed 파일 재처리 (수집 없음)")
+    parser.add_argument("--workers", type=int, default=REPLAY_MAX_WORKERS,
+                        help=f"리플레이 분석 동시 실행 수 (기본 {REPLAY_MAX_WORKERS})")
+    parser.add_argument("--include-existing", action="store_true",
+                        help="리플레이 시 DB에 이미 있는 신호도 재처리")
+    parser.add_argument("--reanalyze", action="store_true",
+                        help="리플레이 시 분석 완료 레코드도 Claude 재분석")
+    parser.add_argument("--analysis-mode", choices=["realtime", "packed", "batch"],
+                        default=CLAUDE_ANALYSIS_MODE,
+                        help="신호 분석 방식: realtime (동시 호출) | packed (K건/요청 묶음) "
+                             "| batch (Message Batches, 비용 50%%)")
     args = parser.parse_args()
 
     # DB 항상 초기화 (테이블 없으면 생성)
@@ -156,11 +325,20 @@ def main() -> None:
     if args.init:
         from database.init_db import init_db as full_init
         full_init(seed_demo_data=True)
+    elif args.replay:
+        result = run_replay(
+            args.replay,
+            max_workers=args.workers,
+            include_existing=args.include_existing,
+            reanalyze=args.reanalyze,
+            analysis_mode=args.analysis_mode,
+        )
+        log.info(f"리플레이 결과: {result}")
     elif args.daemon:
         from pipeline.scheduler import start_scheduler
         start_scheduler()
     else:
-        result = run_once()
+        result = run_once(analysis_mode=args.analysis_mode)
         log.info(f"실행 결과: {result}")
 
 
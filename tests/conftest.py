@@ -0,0 +1,39 @@
+"""
+pytest 공용 설정 — 저장소 루트를 import 경로에 추가하고, DB·API 키를 테스트용으로 격리.
+config 는 import 시점에 환경변수를 읽으므로 다른 모듈 import 전에 설정.
+"""
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='pasis-test-')}/pasis.db"
+os.environ["ANTHROPIC_API_KEY"] = ""
+
+
+@pytest.fixture
+def locked_db(monkeypatch):
+    """DataArchivist 의 DB 세션을 'database is locked' 로 실패시키는 스위치 (locked_db.locked = False 로 해제)."""
+    from database.init_db import get_engine, get_session
+    from database.models import Base
+    from pipeline import archivist
+
+    Base.metadata.create_all(get_engine())
+
+    class Switch:
+        locked = True
+
+    @contextmanager
+    def session():
+        if Switch.locked:
+            raise RuntimeError("database is locked")
+        with get_session() as s:
+            yield s
+
+    monkeypatch.setattr(archivist, "get_session", session)
+    return Switch
@@ -0,0 +1,68 @@
+"""tool-use 출력 추출·필드별 검증·repair 판정 (pipeline/analysis_schema.py)."""
+from types import SimpleNamespace
+
+from pipeline.analysis_schema import (
+    ANALYSIS_TOOL,
+    PACKED_ANALYSIS_TOOL,
+    needs_repair,
+    tool_choice,
+    tool_input,
+    validate_analysis,
+)
+
+
+def _message(*blocks) -> SimpleNamespace:
+    return SimpleNamespace(content=list(blocks))
+
+
+def _tool_use(name: str, input_) -> SimpleNamespace:
+    return SimpleNamespace(type="tool_use", name=name, input=input_)
+
+
+def test_tool_input_picks_named_tool_call():
+    message = _message(
+        SimpleNamespace(type="text", text="분석 결과입니다."),
+        _tool_use(PACKED_ANALYSIS_TOOL["name"], {"analyses": []}),
+        _tool_use(ANALYSIS_TOOL["name"], {"summary": "요약"}),
+    )
+    assert tool_input(message, ANALYSIS_TOOL) == {"summary": "요약"}
+    assert tool_input(message, PACKED_ANALYSIS_TOOL) == {"analyses": []}
+
+
+def test_tool_input_missing_or_malformed():
+    assert tool_input(_message(SimpleNamespace(type="text", text="{}")), ANALYSIS_TOOL) is None
+    assert tool_input(_message(_tool_use(ANALYSIS_TOOL["name"], "raw")), ANALYSIS_TOOL) is None
+    assert tool_input(SimpleNamespace(content=None), ANALYSIS_TOOL) is None
+
+
+def test_tool_choice_forces_tool():
+    assert tool_choice(ANALYSIS_TOOL) == {"type": "tool", "name": "record_signal_analysis"}
+
+
+def test_validate_analysis_salvages_valid_fields():
+    fields, problems = validate_analysis({
+        "summary": "  요약  ",
+        "strategic_implication": "시사점",
+        "key_insights": ["기술", 3, " ", "시장"],
+        "category": "Rumor",
+        "lgu_relevance_type": "Direct Impact",
+        "extra": "ignored",
+    })
+    assert fields == {
+        "summary": "요약",
+        "strategic_implication": "시사점",
+        "key_insights": ["기술", "시장"],
+        "lgu_relevance_type": "Direct Impact",
+    }
+    assert problems == ["category"]
+    assert not needs_repair(problems)
+
+
+def test_validate_analysis_requires_summary_and_implication():
+    fields, problems = validate_analysis({"summary": "", "key_insights": [], "category": "M&A"})
+    assert fields == {"category": "M&A"}
+    assert problems == ["summary", "strategic_implication", "key_insights", "lgu_relevance_type"]
+    assert needs_repair(problems)
+
+    _, problems = validate_analysis("not json")
+    assert needs_repair(problems)
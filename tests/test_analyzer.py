@@ -0,0 +1,58 @@
+"""분석 결과 병합 — analyzed_by 에 실제 응답 모델 기록 (pipeline/analyzer.py)."""
+from types import SimpleNamespace
+
+import pytest
+
+from pipeline.analysis_schema import ANALYSIS_TOOL, PACKED_ANALYSIS_TOOL
+from pipeline.analyzer import StrategicAnalyzer
+
+_FIELDS = {
+    "summary": "요약",
+    "strategic_implication": "시사점",
+    "key_insights": ["a", "b", "c"],
+    "category": "Investment",
+    "lgu_relevance_type": "Direct Impact",
+}
+
+
+def _message(model: str, tool: dict, input_: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        model=model,
+        stop_reason="tool_use",
+        content=[SimpleNamespace(type="tool_use", name=tool["name"], input=input_)],
+        usage=SimpleNamespace(output_tokens=300),
+    )
+
+
+@pytest.fixture
+def analyzer():
+    return StrategicAnalyzer()
+
+
+def test_apply_analysis_records_response_model(analyzer):
+    signal = {"event_id": "e1", "title": "t"}
+
+    merged = analyzer._apply_analysis(signal, _message("claude-lite-model", ANALYSIS_TOOL, _FIELDS))
+
+    assert merged["analyzed_by"] == "claude-lite-model"
+    assert merged["summary"] == "요약"
+
+
+def test_apply_analysis_falls_back_to_request_model(analyzer):
+    message = _message("", ANALYSIS_TOOL, _FIELDS)
+
+    merged = analyzer._apply_analysis({"event_id": "e1"}, message, {"model": "claude-requested"})
+
+    assert merged["analyzed_by"] == "claude-requested"
+
+
+def test_packed_results_record_response_model(analyzer, monkeypatch):
+    pack = [{"event_id": "e1", "title": "a"}, {"event_id": "e2", "title": "b"}]
+    reply = _message("claude-pack-model", PACKED_ANALYSIS_TOOL, {
+        "analyses": [{"event_id": "e1", **_FIELDS}, {"event_id": "e2", **_FIELDS}],
+    })
+    monkeypatch.setattr(analyzer, "_call_claude", lambda **kwargs: reply)
+
+    results = analyzer._analyze_pack(pack, ['{"event_id": "e1"}', '{"event_id": "e2"}'])
+
+    assert [r["analyzed_by"] for r in results] == ["claude-pack-model", "claude-pack-model"]
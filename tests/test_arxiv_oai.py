@@ -0,0 +1,121 @@
+"""arXiv OAI-PMH 레코드 파싱·신규 논문 판정·진행 상태 보류 (pipeline/arxiv_source.py)."""
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from pipeline import arxiv_source
+from pipeline.arxiv_source import ArxivOaiHarvester, _parse_oai_record, is_new_submission
+
+_NS = 'xmlns="http://www.openarchives.org/OAI/2.0/"'
+_ARXIV_NS = 'xmlns="http://arxiv.org/OAI/arXiv/"'
+
+
+def _record(arxiv_id: str, created: str, updated: str = "", datestamp: str = "2026-10-10", deleted: bool = False) -> str:
+    status = ' status="deleted"' if deleted else ""
+    updated_xml = f"<updated>{updated}</updated>" if updated else ""
+    return f"""
+    <record>
+      <header{status}><identifier>oai:arXiv.org:{arxiv_id}</identifier><datestamp>{datestamp}</datestamp></header>
+      <metadata>
+        <arXiv {_ARXIV_NS}>
+          <id>{arxiv_id}</id><created>{created}</created>{updated_xml}
+          <authors>
+            <author><keyname>Kim</keyname><forenames>Minji</forenames></author>
+            <author><keyname>Lee</keyname></author>
+          </authors>
+          <title>Humanoid   robot
+            manipulation</title>
+          <categories>cs.RO cs.AI</categories>
+          <abstract>We study whole-body control.</abstract>
+        </arXiv>
+      </metadata>
+    </record>"""
+
+
+def _page(records: list[str], token: str = "") -> ET.Element:
+    token_xml = f"<resumptionToken>{token}</resumptionToken>" if token else "<resumptionToken/>"
+    return ET.fromstring(f"<OAI-PMH {_NS}><ListRecords>{''.join(records)}{token_xml}</ListRecords></OAI-PMH>")
+
+
+def _parse(xml: str) -> dict:
+    return _parse_oai_record(ET.fromstring(f"<wrapper {_NS}>{xml}</wrapper>").find("{http://www.openarchives.org/OAI/2.0/}record"))
+
+
+def test_parse_oai_record_fields():
+    entry = _parse(_record("2610.01234", "2026-10-08", datestamp="2026-10-09"))
+    assert entry["arxiv_id"] == "2610.01234"
+    assert entry["title"] == "Humanoid robot manipulation"
+    assert entry["published"] == datetime(2026, 10, 8, tzinfo=timezone.utc)
+    assert entry["updated"] is None
+    assert entry["primary_category"] == "cs.RO"
+    assert entry["categories"] == ["cs.RO", "cs.AI"]
+    assert entry["authors"] == ["Minji Kim", "Lee"]
+    assert entry["datestamp"] == "2026-10-09"
+
+
+def test_parse_oai_record_skips_deleted():
+    assert _parse(_record("2610.01234", "2026-10-08", deleted=True)) is None
+
+
+def test_is_new_submission_uses_version_not_created_date():
+    from_dt = datetime(2026, 10, 10, tzinfo=timezone.utc)
+    # from 직전 제출·직후 공개된 v1 → 신규 (created < from 이어도 누락 금지)
+    v1 = _parse(_record("2610.00001", "2026-10-08"))
+    # 오래된 논문의 v2 개정 → 제외
+    revision = _parse(_record("2401.00002", "2024-01-05", updated="2026-10-09"))
+    # from 이후 제출된 논문이 공개 전에 v2 까지 나온 경우 → 포함
+    fresh_revision = _parse(_record("2610.00003", "2026-10-11", updated="2026-10-12"))
+    assert is_new_submission(v1, from_dt)
+    assert not is_new_submission(revision, from_dt)
+    assert is_new_submission(fresh_revision, from_dt)
+
+
+def _harvester(tmp_path, pages: list[ET.Element]) -> ArxivOaiHarvester:
+    harvester = ArxivOaiHarvester(state_path=tmp_path / "state.json")
+    responses = iter(pages)
+    harvester._fetch = lambda params: next(responses)
+    return harvester
+
+
+def test_harvest_follows_resumption_token_and_defers_state(tmp_path):
+    state = tmp_path / "state.json"
+    state.write_text(json.dumps({"last_datestamp": "2026-10-10"}))
+    harvester = _harvester(tmp_path, [
+        _page([_record("2610.00001", "2026-10-08", datestamp="2026-10-11")], token="next"),
+        _page([
+            _record("2401.00002", "2024-01-05", updated="2026-10-11", datestamp="2026-10-12"),
+            _record("2610.00004", "2026-10-11", datestamp="2026-10-12", deleted=True),
+        ]),
+    ])
+
+    entries = harvester.harvest()
+
+    assert [e["arxiv_id"] for e in entries] == ["2610.00001"]
+    # 수집 직후에는 상태 파일 미변경 → DB 저장 후 commit() 에서만 기록
+    assert json.loads(state.read_text())["last_datestamp"] == "2026-10-10"
+    harvester.commit()
+    assert json.loads(state.read_text())["last_datestamp"] == "2026-10-12"
+
+
+def test_fetch_bounds_retry_after_loop(monkeypatch):
+    harvester = ArxivOaiHarvester()
+    calls = []
+
+    def busy(*args, **kwargs):
+        calls.append(1)
+        resp = requests.Response()
+        resp.status_code = 503
+        resp.headers["Retry-After"] = "1"
+        return resp
+
+    monkeypatch.setattr(harvester._session, "get", busy)
+    monkeypatch.setattr(harvester._bucket, "acquire", lambda tokens=1.0: 0.0)
+    monkeypatch.setattr(arxiv_source.time, "sleep", lambda sec: None)
+    fetch_once = ArxivOaiHarvester._fetch.retry_with(stop=lambda state: True)
+
+    with pytest.raises(Exception):
+        fetch_once(harvester, {"verb": "ListRecords"})
+    assert len(calls) == arxiv_source._OAI_MAX_RETRY_AFTER_ATTEMPTS + 1
@@ -0,0 +1,125 @@
+"""분석 결과 저널·마이크로 배치 저장·중단 실행 재개 (pipeline/checkpoint.py)."""
+import json
+from datetime import datetime
+
+from database.init_db import get_session
+from database.models import MarketSignal
+from pipeline.archivist import DataArchivist
+from pipeline.checkpoint import AnalysisCheckpoint
+
+
+class _Archive:
+    """DataArchivist.run_pipeline 대체 — fail=True 이면 ingest_batch 처럼 예외 없이 stored=False 반환."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches: list[list[str]] = []
+
+    def __call__(self, records: list[dict]) -> dict:
+        if self.fail:
+            return {"rows_inserted": 0, "rows_updated": 0, "errors": ["database is locked"], "stored": False}
+        self.batches.append([r["event_id"] for r in records])
+        return {"rows_inserted": len(records), "rows_updated": 0, "errors": [], "stored": True}
+
+
+def _result(event_id: str, analyzed_by: str = "claude", summary: str = "요약") -> dict:
+    return {"event_id": event_id, "analyzed_by": analyzed_by, "summary": summary}
+
+
+def _checkpoint(tmp_path, archive, micro_batch: int = 2) -> AnalysisCheckpoint:
+    return AnalysisCheckpoint(archive, directory=tmp_path, micro_batch=micro_batch, fsync=False)
+
+
+def test_record_journals_paid_results_and_archives_in_micro_batches(tmp_path):
+    archive = _Archive()
+    checkpoint = _checkpoint(tmp_path, archive)
+
+    checkpoint.record(_result("e1"))
+    checkpoint.record(_result("e2", analyzed_by="fallback"))  # 미분석 → 저널 제외, 저장 대상
+    checkpoint.record(_result("e3"))
+
+    [journal] = tmp_path.glob("*.jsonl")
+    assert [json.loads(line)["event_id"] for line in journal.read_text().splitlines()] == ["e1", "e3"]
+    assert archive.batches == [["e1", "e2"]]
+
+    assert checkpoint.close()
+    assert archive.batches == [["e1", "e2"], ["e3"]]
+    assert checkpoint.stats == {"journaled": 2, "resumed": 0, "archived": 3, "micro_batches": 2}
+    assert checkpoint.ingest["rows_inserted"] == 3
+    assert list(tmp_path.glob("*.jsonl")) == []
+
+
+def test_failed_save_keeps_journal_and_next_run_resumes(tmp_path):
+    crashed = _checkpoint(tmp_path, _Archive(fail=True), micro_batch=10)
+    crashed.record(_result("e1", summary="첫 분석"))
+    crashed.record(_result("e2"))
+    crashed.record(_result("e1", summary="재분석"))
+    assert not crashed.close()
+    assert crashed.stats["archived"] == 0
+    assert crashed.ingest["errors"] == []
+    # 이전 실행 저널 (다른 시각·pid) + 강제 종료로 잘린 마지막 줄
+    [journal] = tmp_path.glob("*.jsonl")
+    journal = journal.rename(tmp_path / "20261001_000000_1.jsonl")
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"event_id": "e9", "summ')
+
+    archive = _Archive()
+    checkpoint = _checkpoint(tmp_path, archive, micro_batch=10)
+    resumed = checkpoint.resume()
+
+    # event_id 기준 마지막 기록만, 마지막 기록 순서
+    assert [(r["event_id"], r["summary"]) for r in resumed] == [("e2", "요약"), ("e1", "재분석")]
+    assert checkpoint.unstaged([_result("e1"), _result("e4")]) == [_result("e1"), _result("e4")]
+    checkpoint.stage(resumed)
+    assert checkpoint.unstaged([_result("e1"), _result("e4")]) == [_result("e4")]
+
+    assert checkpoint.close()
+    assert archive.batches == [["e2", "e1"]]
+    assert list(tmp_path.glob("*.jsonl")) == []
+
+
+def test_flush_failure_keeps_pending_for_retry(tmp_path):
+    archive = _Archive(fail=True)
+    checkpoint = _checkpoint(tmp_path, archive, micro_batch=1)
+
+    checkpoint.record(_result("e1"))
+    assert checkpoint.stats["archived"] == 0
+
+    archive.fail = False
+    checkpoint.record(_result("e2"))
+    assert archive.batches == [["e1", "e2"]]
+    assert checkpoint.close()
+
+
+def _signal(event_id: str) -> dict:
+    return {
+        "event_id": event_id,
+        "analyzed_by": "claude",
+        "title": f"Figure AI expands humanoid pilot program with automaker ({event_id})",
+        "scope": "Market",
+        "summary": "Figure AI 가 완성차 공장 파일럿을 확대. " * 20,
+        "source_metadata": {
+            "url": f"https://techcrunch.com/2026/10/12/{event_id}",
+            "publisher": "TechCrunch",
+            "published_at": datetime.utcnow().isoformat(),
+            "scraped_at": datetime.utcnow().isoformat(),
+            "confidence_score": 0.9,
+        },
+    }
+
+
+def test_real_archivist_failure_keeps_journal_and_retries(tmp_path, locked_db):
+    checkpoint = _checkpoint(tmp_path, DataArchivist().run_pipeline, micro_batch=1)
+
+    checkpoint.record(_signal("ckpt-1"))
+    assert checkpoint.stats["archived"] == 0
+    assert not checkpoint.close()
+    assert len(list(tmp_path.glob("*.jsonl"))) == 1
+
+    # 같은 archivist 인스턴스 재시도 — 롤백된 레코드가 실행 내 중복 제거로 빠지지 않아야 함
+    locked_db.locked = False
+    assert checkpoint.close()
+    assert checkpoint.ingest["rows_inserted"] == 1
+    assert list(tmp_path.glob("*.jsonl")) == []
+    with get_session() as session:
+        assert session.query(MarketSignal).filter_by(event_id="ckpt-1").count() == 1
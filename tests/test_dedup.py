@@ -0,0 +1,91 @@
+"""URL 정규화·결정적 event_id·근접 중복 클러스터링 (pipeline/dedup.py)."""
+import uuid
+
+from pipeline.dedup import NearDuplicateDetector, canonicalize_url, event_id_for_url, title_entities
+
+_BODY = (
+    "Figure AI said on Tuesday it closed a new funding round led by existing investors, "
+    "bringing total capital raised to more than two billion dollars as the humanoid robot "
+    "maker expands pilot deployments with automotive and logistics customers."
+)
+
+
+def _record(title: str, url: str, content: str = "", confidence: float = 0.5, publisher: str = "") -> dict:
+    return {
+        "event_id": event_id_for_url(url),
+        "title": title,
+        "raw_content": content,
+        "source_metadata": {"url": url, "publisher": publisher, "confidence_score": confidence},
+    }
+
+
+def test_canonicalize_url_normalizes_host_tracking_and_fragment():
+    assert canonicalize_url(
+        "http://www.TechCrunch.com/2026/03/01/foo/?utm_source=rss&b=2&fbclid=x&a=1#top"
+    ) == "https://techcrunch.com/2026/03/01/foo?a=1&b=2"
+    assert canonicalize_url("https://example.com:8443/a/") == "https://example.com:8443/a"
+    assert canonicalize_url("") == ""
+
+
+def test_canonicalize_url_strips_arxiv_version():
+    expected = "https://arxiv.org/abs/2603.01234"
+    assert canonicalize_url("https://arxiv.org/pdf/2603.01234v2.pdf") == expected
+    assert canonicalize_url("http://export.arxiv.org/abs/2603.01234v1") == expected
+
+
+def test_event_id_for_url_is_deterministic_across_url_variants():
+    a = event_id_for_url("https://techcrunch.com/2026/03/01/foo")
+    b = event_id_for_url("http://www.techcrunch.com/2026/03/01/foo/?utm_medium=social")
+    assert a == b
+    assert uuid.UUID(a).version == 5
+    assert uuid.UUID(event_id_for_url("")).version == 4
+
+
+def test_title_entities_picks_companies_and_numbers():
+    assert title_entities("Figure AI raises $1.5B in Series C - TechCrunch") == {"Figure AI", "1", "5b"}
+
+
+def test_cluster_merges_publisher_suffix_variants_and_keeps_best_representative():
+    detector = NearDuplicateDetector()
+    weak = _record("Figure AI raises new funding for humanoid robots - Google News",
+                   "https://news.google.com/a", confidence=0.3, publisher="Google News")
+    strong = _record("Figure AI raises new funding for humanoid robots | The Robot Report",
+                     "https://therobotreport.com/figure", confidence=0.9)
+
+    reps = detector.cluster([weak, strong])
+
+    assert reps == [strong]
+    assert [d["url"] for d in strong["duplicates"]] == ["https://news.google.com/a"]
+    assert strong["duplicates"][0]["publisher"] == "Google News"
+
+
+def test_cluster_merges_rewritten_titles_by_content():
+    detector = NearDuplicateDetector()
+    a = _record("Humanoid maker Figure closes mega round", "https://a.example/1", content=_BODY)
+    b = _record("Figure AI funding: what it means for robotics", "https://b.example/2", content=_BODY)
+
+    assert len(detector.cluster([a, b])) == 1
+
+
+def test_cluster_keeps_templated_filing_titles_apart():
+    detector = NearDuplicateDetector()
+    template = "[8-K] {} — Current report pursuant to Section 13 or 15(d) of the Securities Exchange Act"
+    records = [
+        _record(template.format("Tesla"), "https://sec.gov/1"),
+        _record(template.format("NVIDIA"), "https://sec.gov/2"),
+        _record("Figure AI humanoid robot startup raises $1.5B series C round led by investors", "https://a.example/3"),
+        _record("Figure AI humanoid robot startup raises $2B series C round led by investors", "https://b.example/4"),
+    ]
+
+    assert len(detector.cluster(records)) == 4
+
+
+def test_cluster_links_later_calls_to_settled_clusters():
+    detector = NearDuplicateDetector()
+    first = _record("Figure AI raises new funding for humanoid robots", "https://a.example/1")
+    detector.cluster([first])
+
+    again = _record("Figure AI raises new funding for humanoid robots", "http://www.a.example/1/?utm_source=x")
+
+    assert detector.cluster([again]) == []
+    assert len(first["duplicates"]) == 1
@@ -0,0 +1,124 @@
+"""SEC EDGAR submissions 파싱·accession 인덱스 보류·Full-Text 페이지네이션 (pipeline/edgar.py)."""
+import json
+
+from pipeline.edgar import (
+    EDGAR_PAGE_SIZE,
+    EdgarFullTextHarvester,
+    EdgarSubmissionsPoller,
+    _normalize_company,
+)
+
+
+class _FakeClient:
+    """URL·params → 응답 JSON. 호출 기록 유지."""
+
+    def __init__(self, responder):
+        self._responder = responder
+        self.calls = []
+
+    def get_json(self, url, params=None, conditional=True):
+        self.calls.append((url, dict(params or {})))
+        return self._responder(url, params or {})
+
+
+def _submissions(name: str = "Tesla, Inc.") -> dict:
+    return {
+        "name": name,
+        "filings": {"recent": {
+            "accessionNumber": ["0001-26-000003", "0001-26-000002", "0001-26-000001"],
+            "filingDate": ["2026-10-12", "2026-10-11", "2026-09-01"],
+            "form": ["8-K", "4", "10-Q"],
+            "reportDate": ["", "2026-10-10", "2026-06-30"],
+            "primaryDocDescription": ["8-K", "FORM 4", "10-Q"],
+        }},
+    }
+
+
+def _poller(tmp_path, client) -> EdgarSubmissionsPoller:
+    return EdgarSubmissionsPoller(
+        client,
+        cik_map_path=tmp_path / "cik_map.json",
+        seen_path=tmp_path / "seen.json",
+        max_workers=2,
+    )
+
+
+def test_normalize_company_strips_suffixes():
+    assert _normalize_company("Tesla, Inc.") == "tesla"
+    assert _normalize_company("AMAZON COM INC") == "amazon"
+    assert _normalize_company("The Boeing Company") == "the boeing"
+
+
+def test_poll_parses_recent_filings_by_form_and_date(tmp_path):
+    poller = _poller(tmp_path, _FakeClient(lambda url, params: _submissions()))
+
+    filings = poller.poll({"Tesla": "1318605"}, ["8-K", "10-Q"], since="2026-10-01")
+
+    assert filings == [{
+        "cik": "1318605",
+        "entity_name": "Tesla, Inc.",
+        "adsh": "0001-26-000003",
+        "form_type": "8-K",
+        "file_date": "2026-10-12",
+        "period_of_report": "2026-10-12",  # reportDate 없음 → 제출일
+        "file_description": "8-K",
+    }]
+
+
+def test_poll_dedups_co_filed_accessions(tmp_path):
+    poller = _poller(tmp_path, _FakeClient(lambda url, params: _submissions()))
+
+    filings = poller.poll({"Tesla": "1318605", "SpaceX": "1181412"}, ["8-K"], since="2026-10-01")
+
+    assert [f["adsh"] for f in filings] == ["0001-26-000003"]
+
+
+def test_mark_seen_filters_in_memory_and_defers_file_until_save(tmp_path):
+    seen_path = tmp_path / "seen.json"
+    client = _FakeClient(lambda url, params: _submissions())
+    poller = _poller(tmp_path, client)
+
+    poller.mark_seen(["0001-26-000003"])
+
+    assert poller.poll({"Tesla": "1318605"}, ["8-K"], since="2026-10-01") == []
+    # DB 저장 전에는 인덱스 파일 미기록 → 중단 시 다음 실행에서 재수집
+    assert not seen_path.exists()
+    poller.save()
+    assert json.loads(seen_path.read_text()) == ["0001-26-000003"]
+    # 재시작 후에도 인덱스 유지
+    assert _poller(tmp_path, client).poll({"Tesla": "1318605"}, ["8-K"], since="2026-10-01") == []
+
+
+def test_resolve_ciks_matches_normalized_titles_and_caches_misses(tmp_path):
+    tickers = {
+        "0": {"cik_str": 1318605, "ticker": "TSLA", "title": "Tesla, Inc."},
+        "1": {"cik_str": 1018724, "ticker": "AMZN", "title": "AMAZON COM INC"},
+    }
+    client = _FakeClient(lambda url, params: tickers)
+    poller = _poller(tmp_path, client)
+
+    assert poller.resolve_ciks(["Tesla", "Amazon", "Figure AI"]) == {"Tesla": "1318605", "Amazon": "1018724"}
+    cached = json.loads((tmp_path / "cik_map.json").read_text())
+    assert cached["Figure AI"]["cik"] is None
+
+    # 캐시 적중 (미상장 기업도 재해석 주기 전까지) → 추가 요청 없음
+    poller.resolve_ciks(["Tesla", "Figure AI"])
+    assert len(client.calls) == 1
+
+
+def test_full_text_search_paginates_and_dedups_by_adsh():
+    def responder(url, params):
+        offset = params.get("from", 0)
+        hits = [{"_source": {"adsh": f"A-{offset + i}"}} for i in range(EDGAR_PAGE_SIZE if offset == 0 else 20)]
+        if params["forms"] == "10-K":
+            hits = [{"_source": {"adsh": "A-0"}}]
+        return {"hits": {"total": {"value": EDGAR_PAGE_SIZE + 20}, "hits": hits}}
+
+    client = _FakeClient(responder)
+    harvester = EdgarFullTextHarvester(client, max_workers=2, max_pages=5)
+
+    sources = harvester.search(["humanoid"], ["8-K", "10-K"], "2026-10-01", "2026-10-12")
+
+    assert len(sources) == EDGAR_PAGE_SIZE + 20
+    offsets = sorted(params.get("from", 0) for _, params in client.calls if params["forms"] == "8-K")
+    assert offsets == [0, EDGAR_PAGE_SIZE]
@@ -0,0 +1,176 @@
+"""Message Batch 제출·상태 파일 재개·대기 상한 (pipeline/message_batch.py, StrategicAnalyzer batch 모드)."""
+from functools import partial
+from types import SimpleNamespace
+
+import pytest
+
+from pipeline import analyzer as analyzer_module
+from pipeline.analysis_schema import ANALYSIS_TOOL
+from pipeline.analyzer import StrategicAnalyzer
+from pipeline.message_batch import BatchWaitTimeout, MessageBatchRunner
+
+_FIELDS = {
+    "summary": "요약",
+    "strategic_implication": "시사점",
+    "key_insights": ["a", "b", "c"],
+    "category": "Investment",
+    "lgu_relevance_type": "Direct Impact",
+}
+
+
+def _message() -> SimpleNamespace:
+    return SimpleNamespace(
+        model="claude-batch-model",
+        stop_reason="tool_use",
+        content=[SimpleNamespace(type="tool_use", name=ANALYSIS_TOOL["name"], input=dict(_FIELDS))],
+        usage=SimpleNamespace(input_tokens=100, output_tokens=50),
+    )
+
+
+class _Batches:
+    """client.messages.batches 대역 — 제출 요청 기록, 배치별 상태·결과 지정."""
+
+    def __init__(self) -> None:
+        self.submitted: dict[str, list[str]] = {}
+        self.status: dict[str, str] = {}
+        self.errored: set[str] = set()
+        self.fail_create = False
+
+    def create(self, requests: list[dict]) -> SimpleNamespace:
+        if self.fail_create:
+            raise RuntimeError("overloaded")
+        batch_id = f"msgbatch_{len(self.submitted) + 1}"
+        self.submitted[batch_id] = [r["custom_id"] for r in requests]
+        self.status.setdefault(batch_id, "ended")
+        return SimpleNamespace(id=batch_id)
+
+    def retrieve(self, batch_id: str) -> SimpleNamespace:
+        counts = SimpleNamespace(processing=1, succeeded=0, errored=0)
+        return SimpleNamespace(processing_status=self.status[batch_id], request_counts=counts)
+
+    def results(self, batch_id: str) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(custom_id=custom_id, result=(
+                SimpleNamespace(type="errored") if custom_id in self.errored
+                else SimpleNamespace(type="succeeded", message=_message())
+            ))
+            for custom_id in self.submitted[batch_id]
+        ]
+
+
+def _client(batches: _Batches) -> SimpleNamespace:
+    client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+    client.with_options = lambda **kwargs: client
+    return client
+
+
+def _signal(event_id: str) -> dict:
+    return {"event_id": event_id, "title": f"Humanoid news {event_id}", "raw_content": "body", "scope": "Tech"}
+
+
+def _runner(tmp_path, batches: _Batches, max_wait: float = 60.0) -> MessageBatchRunner:
+    return MessageBatchRunner(_client(batches), state_dir=tmp_path, poll_interval=0.0, max_wait=max_wait)
+
+
+def test_submit_persists_state_for_restart(tmp_path):
+    batches = _Batches()
+    batch_id = _runner(tmp_path, batches).submit(
+        [("e1", {"model": "m"}), ("e2", {"model": "m"})], {"e1": _signal("e1"), "e2": _signal("e2")},
+    )
+
+    restarted = _runner(tmp_path, batches)
+    assert restarted.pending_batch_ids() == [batch_id]
+    assert list(restarted.load_signals(batch_id)) == ["e1", "e2"]
+    restarted.complete(batch_id)
+    assert restarted.pending_batch_ids() == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_submit_failure_leaves_no_state(tmp_path):
+    batches = _Batches()
+    batches.fail_create = True
+
+    with pytest.raises(RuntimeError):
+        _runner(tmp_path, batches).submit([("e1", {})], {"e1": _signal("e1")})
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_wait_timeout_keeps_state(tmp_path):
+    batches = _Batches()
+    runner = _runner(tmp_path, batches, max_wait=0.0)
+    batches.status["msgbatch_1"] = "in_progress"
+    batch_id = runner.submit([("e1", {})], {"e1": _signal("e1")})
+
+    with pytest.raises(BatchWaitTimeout):
+        runner.wait(batch_id)
+    assert runner.pending_batch_ids() == [batch_id]
+
+
+def test_wait_maps_errored_requests_to_none(tmp_path):
+    batches = _Batches()
+    batches.errored.add("e2")
+    runner = _runner(tmp_path, batches)
+    batch_id = runner.submit([("e1", {}), ("e2", {})], {"e1": _signal("e1"), "e2": _signal("e2")})
+
+    results = runner.wait(batch_id)
+
+    assert results["e1"].model == "claude-batch-model"
+    assert results["e2"] is None
+
+
+@pytest.fixture
+def batch_analyzer(tmp_path, monkeypatch):
+    """batch 모드 분석기 — 배치 클라이언트 대역, 상태 디렉터리 tmp_path, 폴링 대기 없음."""
+    batches = _Batches()
+    analyzer = StrategicAnalyzer()
+    analyzer._client = _client(batches)
+    monkeypatch.setattr(
+        analyzer_module, "MessageBatchRunner",
+        partial(MessageBatchRunner, state_dir=tmp_path, poll_interval=0.0),
+    )
+    return analyzer, batches
+
+
+def test_resume_collects_in_flight_batch_and_excludes_its_signals(tmp_path, batch_analyzer):
+    analyzer, batches = batch_analyzer
+    # 이전 실행: e1·e2 제출 후 대기 상한 초과로 종료
+    previous = _runner(tmp_path, batches)
+    previous.submit([("e1", {}), ("e2", {})], {"e1": _signal("e1"), "e2": _signal("e2")})
+
+    results = list(analyzer._analyze_via_message_batch([_signal("e2"), _signal("e3")], executor=None))
+
+    # 재개분(e1, e2) → 신규분(e3) 순서, 재개 배치 신호 e2 는 다시 제출하지 않음
+    assert [r["event_id"] for r in results] == ["e1", "e2", "e3"]
+    assert all(r["analyzed_by"] == "claude-batch-model" for r in results)
+    assert batches.submitted["msgbatch_2"] == ["e3"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_errored_batch_requests_fall_back_to_realtime(batch_analyzer, monkeypatch):
+    analyzer, batches = batch_analyzer
+    batches.errored.add("e2")
+    realtime = []
+    monkeypatch.setattr(analyzer, "_analyze_one", lambda signal, purpose=None: realtime.append(signal["event_id"]) or signal)
+
+    results = list(analyzer._analyze_via_message_batch([_signal("e1"), _signal("e2")], executor=None))
+
+    assert [r["event_id"] for r in results] == ["e1", "e2"]
+    assert realtime == ["e2"]
+
+
+def test_wait_timeout_returns_nothing_and_resumes_next_run(tmp_path, batch_analyzer, monkeypatch):
+    analyzer, batches = batch_analyzer
+    monkeypatch.setattr(
+        analyzer_module, "MessageBatchRunner",
+        partial(MessageBatchRunner, state_dir=tmp_path, poll_interval=0.0, max_wait=0.0),
+    )
+    batches.status["msgbatch_1"] = "in_progress"
+
+    assert list(analyzer._analyze_via_message_batch([_signal("e1")], executor=None)) == []
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    # 다음 실행: 배치 완료 → 재개해 수집, 같은 신호는 재제출 없음
+    batches.status["msgbatch_1"] = "ended"
+    results = list(analyzer._analyze_via_message_batch([_signal("e1")], executor=None))
+    assert [r["event_id"] for r in results] == ["e1"]
+    assert list(batches.submitted) == ["msgbatch_1"]
@@ -0,0 +1,117 @@
+"""토큰 버킷·rate limit 헤더 여유분·AIMD 동시성 제한 (pipeline/ratelimit.py)."""
+import pytest
+
+from pipeline import ratelimit
+from pipeline.ratelimit import AdaptiveConcurrencyLimiter, TokenBucket, headroom_from_headers
+
+
+class _Clock:
+    """time.monotonic / time.sleep 대체 — sleep 은 시계만 전진."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, sec: float) -> None:
+        self.slept.append(sec)
+        self.now += sec
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_token_bucket_spaces_requests_by_interval(clock):
+    bucket = TokenBucket.per_interval(3.0)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(3.0)
+    clock.now += 10.0  # 유휴 시간이 길어도 capacity 이상 적립되지 않음
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(3.0)
+
+
+def test_token_bucket_allows_burst_up_to_capacity(clock):
+    bucket = TokenBucket(rate=10, capacity=10)
+
+    waits = [bucket.acquire() for _ in range(11)]
+
+    assert waits[:10] == [0.0] * 10
+    assert waits[10] == pytest.approx(0.1)
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_headroom_from_headers_uses_tightest_ratio():
+    headers = {
+        "anthropic-ratelimit-requests-limit": "100",
+        "anthropic-ratelimit-requests-remaining": "80",
+        "anthropic-ratelimit-output-tokens-limit": "10000",
+        "anthropic-ratelimit-output-tokens-remaining": "500",
+        "anthropic-ratelimit-input-tokens-limit": "bogus",
+        "anthropic-ratelimit-input-tokens-remaining": "1",
+    }
+    assert headroom_from_headers(headers) == pytest.approx(0.05)
+    assert headroom_from_headers({}) is None
+
+
+def _headers(remaining: int) -> dict:
+    return {
+        "anthropic-ratelimit-requests-limit": "100",
+        "anthropic-ratelimit-requests-remaining": str(remaining),
+    }
+
+
+def test_limiter_additive_increase_and_low_headroom_decrease():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=4)
+
+    limiter.on_success(_headers(90))
+    limiter.on_success()  # 헤더 없음 → 증가
+    assert limiter.limit == 2  # 2 + 1/2 + 1/2.5 = 2.9
+    limiter.on_success(_headers(90))
+    assert limiter.limit == 3
+
+    limiter.on_success(_headers(30))  # low~high 사이 → 유지
+    assert limiter.limit == 3
+    limiter.on_success(_headers(5))
+    assert limiter.limit == 2
+
+    for _ in range(50):
+        limiter.on_success(_headers(90))
+    assert limiter.limit == 4
+
+
+def test_limiter_halves_once_per_pause_window(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial=16, minimum=2, default_backoff_sec=5.0)
+
+    assert limiter.on_overload(retry_after=10.0) == 10.0
+    assert limiter.on_overload() == 5.0  # 같은 정지 구간 내 동시 실패 → 추가 감소 없음
+    assert limiter.limit == 8
+
+    clock.now += 11.0
+    limiter.on_overload()
+    clock.now += 6.0
+    limiter.on_overload()
+    clock.now += 6.0
+    limiter.on_overload()
+    assert limiter.limit == 2  # minimum 하한
+
+
+def test_limiter_slot_admits_after_pause(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial=1)
+    limiter.on_overload(retry_after=0.01)
+    clock.now += 0.02
+
+    with limiter.slot():
+        assert limiter._in_flight == 1
+    assert limiter._in_flight == 0
@@ -0,0 +1,48 @@
+"""신호 묶음 분할·부분 요약 캐시 키 (pipeline/report_mapreduce.py)."""
+from pipeline.report_mapreduce import ReportPartialCache, SignalGroup, group_signals
+
+
+def _signal(event_id: str, summary: str = "요약", published_at: str = "2026-10-12") -> dict:
+    return {
+        "event_id": event_id,
+        "scope": "Market",
+        "title": f"Tesla Optimus update {event_id}",
+        "summary": summary,
+        "strategic_implication": "시사점",
+        "key_insights": ["a"],
+        "published_at": published_at,
+        "source_url": f"https://example.com/{event_id}",
+    }
+
+
+def _group(*signals: dict) -> SignalGroup:
+    return SignalGroup("2026-W42", "Market", "Tesla", 0, list(signals))
+
+
+def test_group_signals_by_week_scope_company():
+    groups = group_signals(
+        [_signal("e1"), _signal("e2", published_at="2026-10-20"), _signal("e3")], max_signals=1,
+    )
+    assert [(g.iso_week, g.company, g.part, len(g.signals)) for g in groups] == [
+        ("2026-W42", "Tesla", 0, 1), ("2026-W42", "Tesla", 1, 1), ("2026-W43", "Tesla", 0, 1),
+    ]
+
+
+def test_digest_ignores_order_but_tracks_content():
+    base = _group(_signal("e1"), _signal("e2")).digest
+    assert _group(_signal("e2"), _signal("e1")).digest == base
+    # 같은 주 재분석 — event_id 는 같고 요약·시사점만 바뀜
+    assert _group(_signal("e1", summary="재분석 요약"), _signal("e2")).digest != base
+    updated = _signal("e2")
+    updated["key_insights"] = ["a", "b"]
+    assert _group(_signal("e1"), updated).digest != base
+
+
+def test_partial_cache_misses_after_reanalysis(tmp_path):
+    cache = ReportPartialCache(root=tmp_path)
+    group = _group(_signal("e1"))
+    cache.put(group.iso_week, group.name, group.digest, {"headline": "old"})
+
+    assert cache.get(group.iso_week, group.name, group.digest) == {"headline": "old"}
+    stale = _group(_signal("e1", summary="재분석 요약"))
+    assert cache.get(stale.iso_week, stale.name, stale.digest) is None
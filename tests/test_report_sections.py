@@ -0,0 +1,83 @@
+"""섹션 응답 판정·코드블록 래핑 제거·스트리밍 조각 분할 (pipeline/report_sections.py)."""
+from pipeline.report_sections import (
+    SKIP_MARKER,
+    WEEKLY_SECTIONS,
+    SectionStreamSplitter,
+    check_section,
+    clean_report_html,
+    placeholder,
+    section_instruction,
+)
+
+_CORE = WEEKLY_SECTIONS[0]
+_OPTIONAL = WEEKLY_SECTIONS[3]
+_SECTION_HTML = '<div class="rpt-section">\n  <div class="rpt-section-title">핵심</div>\n</div>'
+
+
+def test_clean_report_html_strips_code_fence():
+    assert clean_report_html(f"```html\n{_SECTION_HTML}\n```") == _SECTION_HTML
+    assert clean_report_html(f"  {_SECTION_HTML}  ") == _SECTION_HTML
+
+
+def test_check_section_verdicts():
+    assert check_section(_SECTION_HTML, "end_turn", _CORE, "rpt") == "ok"
+    assert check_section(_SECTION_HTML, "max_tokens", _CORE, "rpt") == "truncated"
+    # 다른 리포트 접두사·하위 클래스만 있는 응답은 래퍼 없음
+    assert check_section('<div class="rpt-section-title">x</div>', "end_turn", _CORE, "rpt") == "invalid"
+    assert check_section(_SECTION_HTML, "end_turn", _CORE, "mrpt") == "invalid"
+
+
+def test_check_section_skip_only_for_optional_sections():
+    assert check_section(SKIP_MARKER, "end_turn", _OPTIONAL, "rpt") == "skip"
+    assert check_section(SKIP_MARKER, "end_turn", _CORE, "rpt") == "invalid"
+    assert check_section(SKIP_MARKER + _SECTION_HTML, "end_turn", _OPTIONAL, "rpt") == "ok"
+
+
+def test_section_instruction_mentions_skip_rule_only_when_optional():
+    assert SKIP_MARKER in section_instruction(_OPTIONAL, "rpt")
+    assert SKIP_MARKER not in section_instruction(_CORE, "rpt")
+    assert "SECTION 1" in section_instruction(_CORE, "rpt")
+
+
+def test_placeholder_is_valid_section():
+    html = placeholder(_CORE, "rpt")
+    assert check_section(html, "end_turn", _CORE, "rpt") == "ok"
+
+
+_REPORT = (
+    "```html\n"
+    '<div class="rpt-header"><div class="rpt-title">주간 리포트</div></div>\n'
+    '<div class="rpt-section">\n  <div class="rpt-section-title">핵심</div>\n'
+    '  <div class="rpt-body"><div class="rpt-card">Figure AI $1.5B</div></div>\n</div>\n'
+    '<div class="rpt-section">\n  <div class="rpt-section-title">액션</div>\n</div>\n'
+    "```"
+)
+
+
+def _split(deltas: list[str]) -> tuple[list[str], str]:
+    splitter = SectionStreamSplitter()
+    chunks = [chunk for delta in deltas for chunk in splitter.feed(delta)]
+    return chunks, splitter.close()
+
+
+def test_splitter_emits_top_level_blocks_in_any_delta_size():
+    for size in (1, 3, 7, len(_REPORT)):
+        chunks, rest = _split([_REPORT[i:i + size] for i in range(0, len(_REPORT), size)])
+        assert len(chunks) == 3
+        assert chunks[0].startswith('<div class="rpt-header">')
+        assert all(chunk.rstrip().endswith("</div>") for chunk in chunks)
+        assert rest == ""
+        # 조각을 이어 붙이면 전체 응답 정리 결과와 같음
+        assert "".join(chunks).strip() == clean_report_html(_REPORT)
+
+
+def test_splitter_holds_tag_split_across_deltas():
+    splitter = SectionStreamSplitter()
+    assert splitter.feed('<div class="rpt-section">본문</di') == []
+    assert splitter.feed("v>") == ['<div class="rpt-section">본문</div>']
+
+
+def test_splitter_close_returns_unfinished_tail():
+    chunks, rest = _split(['<div class="rpt-section">완료</div>\n<div class="rpt-section">잘린'])
+    assert chunks == ['<div class="rpt-section">완료</div>']
+    assert rest == '\n<div class="rpt-section">잘린'
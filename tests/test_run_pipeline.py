@@ -0,0 +1,109 @@
+"""수집 진행 상태 기록 조건 — DB 저장 실패 시 미기록, 다음 실행에서 재수집 (run_pipeline.run_once, scheduler.run_weekly_pipeline)."""
+import importlib
+from datetime import datetime
+from functools import partial
+
+import pytest
+
+from pipeline import checkpoint as checkpoint_module
+from pipeline import scheduler, scout
+
+
+def _signal(slug: str) -> dict:
+    return {
+        "event_id": f"run-once-{slug}",
+        "title": f"Agility Robotics signs humanoid deployment deal with logistics operator ({slug})",
+        "scope": "Market",
+        "summary": "Agility Robotics 가 물류 기업과 Digit 배치 계약. " * 20,
+        "source_metadata": {
+            "url": f"https://therobotreport.com/2026/10/12/{slug}",
+            "publisher": "The Robot Report",
+            "published_at": datetime.utcnow().isoformat(),
+            "scraped_at": datetime.utcnow().isoformat(),
+            "confidence_score": 0.9,
+        },
+    }
+
+
+class _Scout:
+    def __init__(self, records: list[dict], news: list[dict]) -> None:
+        self._records = records
+        self._news = news
+        self.committed = False
+
+    def run_all(self, **kwargs) -> list[dict]:
+        return self._records
+
+    def fetch_key_player_news(self, **kwargs) -> list[dict]:
+        return self._news
+
+    def commit_fetch_state(self) -> None:
+        self.committed = True
+
+
+class _Analyzer:
+    parse_failure_rate = 0.0
+    run_id = "test"
+
+    def analyze_batch(self, records: list[dict], **kwargs) -> list[dict]:
+        return records
+
+
+@pytest.fixture
+def run_once(tmp_path, monkeypatch):
+    """외부 호출 없는 run_once: 수집기·분석기 대역, 분석 = 입력 그대로, 체크포인트 저널은 tmp_path."""
+    monkeypatch.chdir(tmp_path)  # run_pipeline import 시 로그 파일 위치
+    run_pipeline = importlib.import_module("run_pipeline")
+    monkeypatch.setattr("pipeline.analyzer.StrategicAnalyzer", _Analyzer)
+    monkeypatch.setattr(run_pipeline, "_triage_and_analyze", lambda analyzer, triage, records, **kwargs: records)
+    monkeypatch.setattr(scheduler, "_generate_and_save_weekly_report", lambda analyzer, signals: None)
+    monkeypatch.setattr(
+        checkpoint_module, "AnalysisCheckpoint",
+        partial(checkpoint_module.AnalysisCheckpoint, directory=tmp_path / "checkpoint", fsync=False),
+    )
+
+    def run(records: list[dict], news: list[dict] = (), checkpoint: bool = True) -> tuple[dict, _Scout]:
+        fake = _Scout(records, list(news))
+        monkeypatch.setattr(scout, "PhysicalAIScout", lambda: fake)
+        monkeypatch.setattr(run_pipeline, "ANALYSIS_CHECKPOINT_ENABLED", checkpoint)
+        return run_pipeline.run_once(), fake
+
+    return run
+
+
+@pytest.mark.parametrize("checkpoint", [True, False])
+def test_failed_store_keeps_fetch_state_uncommitted(run_once, locked_db, checkpoint):
+    result, fake = run_once([_signal(f"locked-{checkpoint}")], checkpoint=checkpoint)
+
+    assert any("database is locked" in e or "저널 유지" in e for e in result["errors"])
+    assert not fake.committed
+
+
+def test_failed_news_store_keeps_fetch_state_uncommitted(run_once, locked_db):
+    result, fake = run_once([], news=[_signal("news-locked")])
+
+    assert any("database is locked" in e for e in result["errors"])
+    assert not fake.committed
+
+
+@pytest.mark.parametrize("checkpoint", [True, False])
+def test_successful_store_commits_fetch_state(run_once, locked_db, checkpoint):
+    locked_db.locked = False
+
+    result, fake = run_once([_signal(f"stored-{checkpoint}")], checkpoint=checkpoint)
+
+    assert result["inserted"] == 1
+    assert fake.committed
+
+
+@pytest.mark.parametrize("locked", [True, False])
+def test_weekly_pipeline_commits_fetch_state_only_after_store(monkeypatch, locked_db, locked):
+    locked_db.locked = locked
+    fake = _Scout([_signal(f"weekly-{locked}")], [])
+    monkeypatch.setattr(scout, "PhysicalAIScout", lambda: fake)
+    monkeypatch.setattr("pipeline.analyzer.StrategicAnalyzer", _Analyzer)
+    monkeypatch.setattr(scheduler, "_generate_and_save_weekly_report", lambda analyzer, signals: None)
+
+    scheduler.run_weekly_pipeline()
+
+    assert fake.committed is not locked
@@ -0,0 +1,70 @@
+"""지문 산출·Bloom filter·실행 간 "이미 본 항목" 판정 (pipeline/seen_index.py)."""
+import pytest
+
+from database.init_db import get_engine, get_session
+from database.models import Base, SignalFingerprint
+from pipeline.seen_index import BloomFilter, SeenIndex, content_hash, fingerprint, url_hash
+
+_BODY = "Agility Robotics began a paid deployment of Digit humanoids at a logistics warehouse in Georgia this week."
+
+
+@pytest.fixture
+def index():
+    Base.metadata.create_all(get_engine())
+    with get_session() as session:
+        session.query(SignalFingerprint).delete()
+    return SeenIndex(capacity=1000, error_rate=0.01)
+
+
+def _record(url: str, title: str = "Agility deploys Digit at warehouse", content: str = _BODY, **extra) -> dict:
+    return {
+        "event_id": extra.pop("event_id", url),
+        "title": title,
+        "raw_content": content,
+        "source_metadata": {"url": url, "published_at": "2026-10-12T09:00:00", "publisher": "Example", **extra},
+    }
+
+
+def test_content_hash_ignores_publisher_suffix_and_case():
+    a = content_hash("Agility deploys Digit at warehouse - Google News", "2026-10-12T09:00:00", "Example", _BODY)
+    b = content_hash("AGILITY deploys Digit at warehouse", "2026-10-12", "example ", _BODY)
+    assert a and a == b
+    assert content_hash("Agility deploys Digit at warehouse", "2026-10-13", "Example", _BODY) != a
+
+
+def test_fingerprint_without_body_falls_back_to_url_hash():
+    u_hash, c_hash = fingerprint("https://sec.gov/8k/1", "[8-K] Tesla, Inc.", "2026-10-12")
+    assert c_hash == u_hash == url_hash("http://www.sec.gov/8k/1/")
+
+
+def test_bloom_filter_membership():
+    bloom = BloomFilter(capacity=100, error_rate=0.01)
+    key = url_hash("https://example.com/a")
+    assert key not in bloom
+    bloom.add(key)
+    assert key in bloom
+    assert bloom.count == 1
+
+
+def test_filter_new_skips_marked_records_by_url_or_content(index):
+    first = _record("https://a.example/1")
+    assert index.filter_new([first]) == [first]
+    assert index.mark_seen([first]) == 1
+
+    same_url = _record("http://www.a.example/1/?utm_source=rss", title="Different headline entirely")
+    moved = _record("https://b.example/syndicated")           # URL 변경, 제목·날짜·매체·본문 동일
+    fresh = _record("https://c.example/2", title="Apptronik opens new factory", content="Apptronik " + _BODY)
+
+    assert index.filter_new([same_url, moved, fresh]) == [fresh]
+    assert index.stats["confirmed_seen"] == 2
+
+
+def test_mark_seen_registers_linked_duplicates_and_persists(index):
+    rep = _record("https://a.example/1")
+    rep["duplicates"] = [{"url": "https://news.google.com/x", "title": "Agility deploys Digit", "published_at": ""}]
+    assert index.mark_seen([rep]) == 2
+    # 기존 지문은 갱신만
+    assert index.mark_seen([rep]) == 0
+
+    restarted = SeenIndex(capacity=1000, error_rate=0.01)
+    assert restarted.filter_new([_record("https://news.google.com/x", content="")]) == []
@@ -0,0 +1,80 @@
+"""묶음 응답 대조·묶음 크기 결정 (pipeline/signal_pack.py)."""
+from pipeline.signal_pack import PackPlanner, estimate_tokens, parse_packed_response
+
+
+def _analysis(event_id: str, **overrides) -> dict:
+    item = {
+        "event_id": event_id,
+        "summary": "요약",
+        "strategic_implication": "시사점",
+        "key_insights": ["a", "b", "c"],
+        "category": "Investment",
+        "lgu_relevance_type": "Direct Impact",
+    }
+    item.update(overrides)
+    return item
+
+
+def test_estimate_tokens_counts_non_ascii_per_char():
+    assert estimate_tokens("abcd" * 10) == 11
+    assert estimate_tokens("휴머노이드") == 6
+
+
+def test_parse_packed_response_matches_by_event_id():
+    results, retry = parse_packed_response(
+        {"analyses": [_analysis("e2"), _analysis("e1", category="unknown")]},
+        ["e1", "e2"],
+    )
+    assert retry == []
+    assert set(results) == {"e1", "e2"}
+    assert "event_id" not in results["e1"]
+    # 부가 필드 오류는 해당 필드만 제외
+    assert "category" not in results["e1"]
+    assert results["e2"]["category"] == "Investment"
+
+
+def test_parse_packed_response_retries_missing_duplicate_and_invalid():
+    results, retry = parse_packed_response(
+        {"analyses": [
+            _analysis("e1"),
+            _analysis("e2"), _analysis("e2", summary="다른 요약"),  # 중복 → 둘 다 불신
+            _analysis("e3", summary=" "),                            # 필수 필드 오류
+            _analysis("unexpected"),                                 # 입력에 없는 ID 무시
+            "not a dict",
+        ]},
+        ["e1", "e2", "e3", "e4"],
+    )
+    assert list(results) == ["e1"]
+    assert retry == ["e2", "e3", "e4"]
+
+
+def test_parse_packed_response_without_analyses_retries_all():
+    assert parse_packed_response(None, ["e1", "e2"]) == ({}, ["e1", "e2"])
+    assert parse_packed_response({"analyses": "truncated"}, ["e1"]) == ({}, ["e1"])
+
+
+def test_next_pack_respects_input_budget_and_duplicate_ids():
+    planner = PackPlanner(max_signals=10, input_tokens=100, max_tokens=10_000, output_per_signal=500)
+    items = [("e1", "x" * 120), ("e2", "x" * 120), ("e3", "x" * 120), ("e4", "x" * 400)]
+    # 31 토큰씩 → 3건 93 토큰, 4번째는 예산 초과
+    assert planner.next_pack(items, 0) == 3
+    # 단건이 예산을 넘어도 최소 1건
+    assert planner.next_pack(items, 3) == 1
+
+    dup = [("e1", "a"), ("e2", "b"), ("e1", "c")]
+    assert planner.next_pack(dup, 0) == 2
+
+
+def test_observe_adjusts_output_capacity():
+    planner = PackPlanner(max_signals=10, input_tokens=10_000, max_tokens=4000, output_per_signal=1000)
+    assert planner.output_capacity == 4
+
+    planner.observe(signals=4, output_tokens=1600, truncated=False)
+    # 관측 400×1.25=500 → EMA 1000 + 0.3×(500-1000) = 850
+    assert planner.output_capacity == 4000 // 850
+
+    planner.observe(signals=4, output_tokens=4000, truncated=True)
+    assert planner.output_capacity == int(4000 // (850 * 1.5))
+
+    planner.observe(signals=0, output_tokens=0, truncated=True)  # 무시
+    assert planner.output_capacity == int(4000 // (850 * 1.5))
@@ -0,0 +1,76 @@
+"""문자 체계별 예산·핵심 문장 선택·앞부분 자르기 (pipeline/summarizer.py)."""
+from pipeline.signal_pack import estimate_tokens
+from pipeline.summarizer import (
+    ExtractiveSummarizer,
+    head,
+    over_budget,
+    script_budget,
+    split_sentences,
+    summarize_batch,
+)
+
+_ARTICLE = " ".join([
+    "Subscribe to our newsletter for the latest robotics news.",
+    "Figure AI raised $1.5 billion in a Series C round to scale humanoid production.",
+    "The company was founded in 2022 and is based in Sunnyvale.",
+    "Figure AI plans to deploy 1,000 humanoid robots at BMW factories by 2027.",
+    "Executives said the humanoid robots learn tasks with a vision language action model.",
+    "The weather in Sunnyvale was pleasant on the day of the announcement.",
+    "Contact the reporter at reporter@example.com with tips.",
+])
+
+
+def test_script_budget_keeps_same_characters_for_korean():
+    english = "a" * 800
+    korean = "가" * 800
+    assert script_budget(english, 100) == 100
+    # 한글 1자 = 1토큰 → 예산 확대, 같은 예산이면 영문과 같은 글자 수까지 통과
+    assert 390 <= script_budget(korean, 100) <= 401  # ≈ 영문 100토큰 글자 수 (400자)
+    assert not over_budget("가" * 390, 100)
+    assert over_budget("가" * 800, 100)
+    assert not over_budget("", 100)
+
+
+def test_head_cuts_at_budget():
+    assert head("abcd" * 10, 5) == "abcd" * 4
+    assert head("휴머노이드 로봇", 3) == "휴머"
+    assert head("short", 100) == "short"
+
+
+def test_split_sentences():
+    assert split_sentences("First one. Second one!\n\nThird?  ") == ["First one.", "Second one!", "Third?"]
+
+
+def test_summarize_batch_prefers_key_sentences_in_original_order():
+    [summary] = summarize_batch([_ARTICLE], 45)
+
+    assert estimate_tokens(summary) <= 46
+    assert "$1.5 billion" in summary
+    assert "1,000 humanoid robots" in summary
+    assert "newsletter" not in summary
+    assert "reporter@example.com" not in summary
+    assert summary.index("$1.5 billion") < summary.index("1,000 humanoid robots")
+
+
+def test_summarize_batch_keeps_short_texts_and_positions():
+    texts = ["짧은 본문", _ARTICLE, ""]
+    results = summarize_batch(texts, 45)
+    assert results[0] == "짧은 본문"
+    assert results[1] != _ARTICLE
+    assert results[2] == ""
+    # 배치 구성과 무관한 결정적 결과 (LLM 응답 캐시 키 안정)
+    assert summarize_batch([_ARTICLE], 45) == [results[1]]
+
+
+def test_summarize_batch_head_mode():
+    assert summarize_batch([_ARTICLE], 20, extractive=False) == [head(_ARTICLE, 20)]
+
+
+def test_summarizer_memo_matches_direct_summary():
+    summarizer = ExtractiveSummarizer(enabled=True)
+    summarizer.prime([_ARTICLE, _ARTICLE, "short"], 45)
+
+    assert summarizer.stats["texts"] == 1
+    assert summarizer.summarize(_ARTICLE, 45) == summarize_batch([_ARTICLE], 45)[0]
+    assert summarizer.summarize("short", 45) == "short"
+    assert summarizer.summarize(None, 45) == ""
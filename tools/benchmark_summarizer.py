@@ -0,0 +1,154 @@
+"""
+추출 요약(pipeline/summarizer.py) 벤치마크 — 속도·압축률·정보 보존율
+본문 앞부분 자르기(기존 방식, 같은 토큰 예산)와 비교.
+
+사용법:
+  python tools/benchmark_summarizer.py                                   # 합성 기사 1000건
+  python tools/benchmark_summarizer.py --input "data/raw/*_scout.jsonl*"  # 저장된 수집 원본
+  python tools/benchmark_summarizer.py --synthetic 5000 --repeat 3
+
+측정 (예산별):
+  - 배치 처리 시간: summarize_batch 1회 (문장 점수 벡터 연산) vs 본문 1건씩 호출
+  - 압축률: 예산 초과 본문의 추정 토큰 합 (입력 → 출력)
+  - 보존율: 원문의 숫자 토큰 / 전략 키워드·기업 히트 중 출력에 남은 비율 (추출 요약 vs 앞부분 자르기)
+"""
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import SUMMARIZER_LITE_TOKENS, SUMMARIZER_REPORT_TOKENS, SUMMARIZER_SIGNAL_TOKENS
+from pipeline.jsonl_sink import iter_records
+from pipeline.signal_pack import estimate_tokens
+from pipeline.summarizer import _keyword_matcher, over_budget, summarize_batch
+
+_NUMBER_TOKEN_RE = re.compile(r"\d[\d,.]*%?")
+
+_LEADS = [
+    "Subscribe to our newsletter for the latest robotics news.",
+    "By Staff Writer, newsroom@example.com.",
+    "This article was updated on Monday.",
+    "Sign up for our weekly briefing.",
+]
+_FILLER = [
+    "The company did not respond to a request for comment.",
+    "Industry observers have followed the sector closely for several years.",
+    "The announcement came during a press event held earlier this week.",
+    "Executives described the move as part of a broader strategy.",
+    "More details are expected to be shared in the coming months.",
+    "Competitors in the region are pursuing similar programs with varying results.",
+    "Analysts cautioned that adoption timelines remain uncertain for most buyers.",
+    "The firm has expanded its engineering team and opened a new office this year.",
+    "Customers cited labor shortages as a key driver behind automation interest.",
+    "The report drew on interviews with operators, suppliers and integrators.",
+]
+_FACTS = [
+    "{company} raised ${amount} million in a Series {series} round to scale Humanoid production.",
+    "{company} plans Commercial Deployment of {units} robots across {sites} warehouses by 2026.",
+    "The {company} VLA Models cut task failure rates by {pct}% in Sim-to-Real trials.",
+    "{company} signed a PoC with a logistics operator covering {units} units and {sites} sites.",
+    "Revenue from robotics as a service at {company} grew {pct}% year over year.",
+]
+_COMPANIES = ["Figure AI", "NVIDIA", "Agility Robotics", "Apptronik", "Boston Dynamics", "Tesla"]
+
+
+def synthetic_corpus(count: int, seed: int = 7) -> list[str]:
+    """도입부 상투 문구 + 일반 문장 사이에 수치·키워드 문장이 뒤쪽에 섞인 합성 기사."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        sentences = rng.sample(_LEADS, 2) + rng.sample(_FILLER, rng.randint(3, 8))
+        for template in rng.sample(_FACTS, rng.randint(1, 3)):
+            sentences.insert(rng.randint(3, len(sentences)), template.format(
+                company=rng.choice(_COMPANIES), amount=rng.randint(50, 900), series=rng.choice("ABCD"),
+                units=rng.randint(10, 5000), sites=rng.randint(2, 40), pct=rng.randint(5, 80),
+            ))
+        sentences += rng.sample(_FILLER, rng.randint(2, 6))
+        texts.append(" ".join(sentences))
+    return texts
+
+
+def load_corpus(patterns: list[str]) -> list[str]:
+    return [r.get("raw_content") or "" for r in iter_records(patterns) if r.get("raw_content")]
+
+
+def _retention(sources: list[str], outputs: list[str]) -> tuple[float, float]:
+    """(숫자 토큰 보존율, 키워드·기업 히트 보존율) — 원문 기준 고유 항목."""
+    matcher = _keyword_matcher()
+    kept_numbers = total_numbers = kept_keywords = total_keywords = 0
+    for source, output in zip(sources, outputs):
+        numbers = set(_NUMBER_TOKEN_RE.findall(source))
+        total_numbers += len(numbers)
+        kept_numbers += len(numbers & set(_NUMBER_TOKEN_RE.findall(output)))
+        keywords = {k for found in matcher.scan(source).values() for k in found}
+        total_keywords += len(keywords)
+        kept_keywords += len(keywords & {k for found in matcher.scan(output).values() for k in found})
+    return (
+        kept_numbers / total_numbers if total_numbers else 1.0,
+        kept_keywords / total_keywords if total_keywords else 1.0,
+    )
+
+
+def _timed(fn: object, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def benchmark(texts: list[str], budget: int, repeat: int) -> dict:
+    long_texts = [t for t in texts if over_budget(t, budget)]
+    batch_sec, extracted = _timed(lambda: summarize_batch(long_texts, budget), repeat)
+    single_sec, _ = _timed(lambda: [summarize_batch([t], budget)[0] for t in long_texts], repeat)
+    head_sec, heads = _timed(lambda: summarize_batch(long_texts, budget, extractive=False), repeat)
+    tokens_in = sum(estimate_tokens(t) for t in long_texts)
+    return {
+        "budget": budget,
+        "long": len(long_texts),
+        "batch_sec": batch_sec,
+        "single_sec": single_sec,
+        "head_sec": head_sec,
+        "tokens_in": tokens_in,
+        "tokens_out": sum(estimate_tokens(t) for t in extracted),
+        "extract_retention": _retention(long_texts, extracted),
+        "head_retention": _retention(long_texts, heads),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추출 요약 벤치마크")
+    parser.add_argument("--input", nargs="+", metavar="PATH_OR_GLOB", help="수집 원본 JSONL (raw_content 사용)")
+    parser.add_argument("--synthetic", type=int, default=1000, help="--input 없을 때 합성 기사 수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 (최솟값 사용)")
+    args = parser.parse_args()
+
+    texts = load_corpus(args.input) if args.input else synthetic_corpus(args.synthetic)
+    if not texts:
+        print("본문이 있는 레코드가 없습니다.")
+        return
+    print(f"본문 {len(texts)}건 (평균 {sum(map(len, texts)) / len(texts):.0f}자, "
+          f"{'수집 원본' if args.input else '합성'})\n")
+    print(f"{'예산':>5} {'대상':>6} {'배치(s)':>8} {'건별(s)':>8} {'건/s':>8} {'앞자르기(s)':>11} "
+          f"{'압축률':>7} {'숫자 보존':>14} {'키워드 보존':>14}")
+    for budget in (SUMMARIZER_SIGNAL_TOKENS, SUMMARIZER_REPORT_TOKENS, SUMMARIZER_LITE_TOKENS):
+        r = benchmark(texts, budget, args.repeat)
+        if not r["long"]:
+            print(f"{budget:>5} {0:>6}  (예산 초과 본문 없음)")
+            continue
+        (num_x, kw_x), (num_h, kw_h) = r["extract_retention"], r["head_retention"]
+        print(
+            f"{budget:>5} {r['long']:>6} {r['batch_sec']:>8.3f} {r['single_sec']:>8.3f} "
+            f"{r['long'] / r['batch_sec']:>8.0f} {r['head_sec']:>11.3f} "
+            f"{r['tokens_out'] / r['tokens_in']:>7.0%} {num_x:>6.0%} / {num_h:>5.0%} {kw_x:>6.0%} / {kw_h:>5.0%}"
+        )
+    print("\n보존율: 추출 요약 / 앞부분 자르기 (같은 토큰 예산)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+Anthropic API 로컬 대역 서버 (오프라인 테스트용)
+Messages API + Message Batches API 의 PASIS 사용 범위만 흉내냄. 응답은 고정 분석 JSON.
+
+사용법:
+  python tools/mock_anthropic_server.py --port 8765 --batch-latency 5 --error-rate 0.1
+  ANTHROPIC_API_KEY=dummy ANTHROPIC_BASE_URL=http://127.0.0.1:8765 \\
+      CLAUDE_ANALYSIS_MODE=batch python run_pipeline.py --replay "data/raw/*_scout.jsonl*"
+
+지원 엔드포인트:
+  POST /v1/messages                          즉시 응답
+  POST /v1/messages/batches                  배치 생성 (batch-latency 초 후 ended)
+  GET  /v1/messages/batches/{id}             배치 상태
+  GET  /v1/messages/batches/{id}/results     결과 JSONL (error-rate 비율만큼 errored)
+
+packed 모드 요청(user 메시지에 event_id 포함 신호 배열)은 event_id 별 원소 배열로 응답
+(--pack-drop-rate 비율만큼 원소 누락 → 단건 재처리 경로 검증).
+tools 가 포함된 요청은 tool_use 블록으로 응답 (--tool-error-rate 로 필수 필드 누락 → repair 경로 검증).
+리포트 부분 요약 도구(record_signal_digest) 요청은 headline / key_facts / implication 으로 응답.
+섹션 분할 리포트 요청은 해당 섹션 HTML 로 응답 (--truncate-rate 비율만큼 max_tokens 잘림 → 섹션 재요청 검증).
+단일 생성 리포트 요청(system 에 섹션 래퍼 지침, 섹션 지시 없음)은 6개 섹션 HTML 로 응답.
+도구 없는 리포트 요청은 --report-latency × (max_tokens / 8192) 초 지연 (단일·섹션 생성 소요 시간 비교용).
+"stream": true 요청은 SSE 이벤트로 응답 (텍스트를 조각내 지연을 나눠 전송 → 점진 렌더링 검증).
+
+배치 상태는 서버 프로세스 메모리에 유지 → 클라이언트 재시작 후 재개 시나리오 검증 가능.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+_BATCH_PATH_RE = re.compile(r"^/v1/messages/batches/([\w-]+)(/results)?$")
+_REPORT_PREFIX_RE = re.compile(r'class="(m?rpt)-section"')
+_SECTION_RE = re.compile(r"SECTION (\d+) 하나만 작성[\s\S]*?class=\"(m?rpt)-section\"")
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _packed_event_ids(params: dict) -> Optional[list[str]]:
+    """packed 모드 요청이면 user 메시지의 신호 배열에서 event_id 목록 추출."""
+    messages = params.get("messages") or [{}]
+    content = messages[-1].get("content", "")
+    if not isinstance(content, str) or "[" not in content:
+        return None
+    try:
+        items = json.loads(content[content.index("["):content.rindex("]") + 1])
+    except ValueError:
+        return None
+    if not isinstance(items, list) or not all(isinstance(i, dict) and "event_id" in i for i in items):
+        return None
+    return [i["event_id"] for i in items]
+
+
+def _last_user_text(params: dict) -> str:
+    content = (params.get("messages") or [{}])[-1].get("content", "")
+    if isinstance(content, list):
+        return "\n".join(c.get("text", "") for c in content if isinstance(c, dict))
+    return content if isinstance(content, str) else ""
+
+
+def _section_message(params: dict, truncate_rate: float) -> Optional[tuple[str, str]]:
+    """섹션 분할 리포트 요청이면 (섹션 HTML, stop_reason)."""
+    match = _SECTION_RE.search(_last_user_text(params))
+    if match is None:
+        return None
+    number, prefix = match.group(1), match.group(2)
+    if params.get("max_tokens", 0) <= 2048 and random.random() < truncate_rate:
+        return f'<div class="{prefix}-section">\n  <div class="{prefix}-section-title">SECTION {number}', "max_tokens"
+    return _section_html(prefix, int(number)), "end_turn"
+
+
+def _section_html(prefix: str, number: int) -> str:
+    return (
+        f'<div class="{prefix}-section">\n'
+        f'  <div class="{prefix}-section-title">SECTION {number} (mock)</div>\n'
+        f'  <div class="{prefix}-body">대역 서버 섹션 본문입니다.</div>\n'
+        f"</div>"
+    )
+
+
+def _report_message(params: dict) -> Optional[str]:
+    """단일 생성 리포트 요청이면 6개 섹션 HTML."""
+    system = params.get("system") or ""
+    if isinstance(system, list):
+        system = "\n".join(b.get("text", "") for b in system if isinstance(b, dict))
+    match = _REPORT_PREFIX_RE.search(system)
+    if match is None:
+        return None
+    return "```html\n" + "\n\n".join(_section_html(match.group(1), n) for n in range(1, 7)) + "\n```"
+
+
+def _is_repair(params: dict) -> bool:
+    content = (params.get("messages") or [{}])[-1].get("content")
+    return isinstance(content, list) and any(c.get("type") == "tool_result" for c in content)
+
+
+def _fake_message(
+    params: dict, pack_drop_rate: float = 0.0, tool_error_rate: float = 0.0, truncate_rate: float = 0.0,
+) -> dict:
+    """
+    요청 프롬프트와 무관한 고정 분석 결과.
+    tools 가 있으면 첫 도구 호출(tool_use)로, 없으면 JSON 텍스트로 응답.
+    packed 요청은 event_id 별 원소 배열로 응답, pack_drop_rate 비율만큼 원소 누락.
+    tool_error_rate 비율만큼 summary 를 비운 도구 input 반환 (repair 재요청에는 항상 정상 응답).
+    """
+    analysis = {
+        "summary": "LGU+ 관점: 오프라인 대역 서버가 생성한 요약입니다.",
+        "strategic_implication": "LGU+ 관점: 대역 서버 응답 — 실제 분석 아님.",
+        "key_insights": ["인사이트 1: mock", "인사이트 2: mock", "인사이트 3: mock"],
+        "category": "Industry News",
+        "lgu_relevance_type": "Future Opportunity",
+    }
+    tools = params.get("tools") or []
+    event_ids = _packed_event_ids(params)
+    section = None if tools else _section_message(params, truncate_rate)
+    if section is None and not tools:
+        report = _report_message(params)
+        section = (report, "end_turn") if report is not None else None
+    if section is not None:
+        event_ids = None
+        payload = None
+    elif tools and tools[0]["name"] == "record_signal_digest":
+        event_ids = None
+        payload = {
+            "headline": "" if random.random() < tool_error_rate else "LGU+ 관점: 대역 서버 부분 요약입니다.",
+            "key_facts": [{"fact": "mock 사실", "source_url": "https://example.com", "published_at": "2026-01-01"}],
+            "implication": "LGU+ 관점: 대역 서버 응답 — 실제 요약 아님.",
+        }
+    elif event_ids is not None:
+        payload: object = [{"event_id": e, **analysis} for e in event_ids if random.random() >= pack_drop_rate]
+    else:
+        payload = dict(analysis)
+        if not _is_repair(params) and random.random() < tool_error_rate:
+            payload["summary"] = ""
+
+    if section is not None:
+        content = [{"type": "text", "text": section[0]}]
+        stop_reason = section[1]
+    elif tools:
+        tool_input = {"analyses": payload} if isinstance(payload, list) else payload
+        content = [{"type": "tool_use", "id": f"toolu_{uuid.uuid4().hex[:24]}",
+                    "name": tools[0]["name"], "input": tool_input}]
+        stop_reason = "tool_use"
+    else:
+        content = [{"type": "text", "text": json.dumps(payload, ensure_ascii=False)}]
+        stop_reason = "end_turn"
+    return {
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": params.get("model", "mock"),
+        "content": content,
+        "stop_reason": stop_reason,
+        "stop_sequence": None,
+        "usage": {"input_tokens": 100, "output_tokens": 100 * len(event_ids or [None])},
+    }
+
+
+class MockState:
+    def __init__(
+        self, batch_latency: float, error_rate: float, pack_drop_rate: float = 0.0, tool_error_rate: float = 0.0,
+        truncate_rate: float = 0.0, report_latency: float = 0.0,
+    ) -> None:
+        self.batch_latency = batch_latency
+        self.truncate_rate = truncate_rate
+        self.report_latency = report_latency
+        self.error_rate = error_rate
+        self.pack_drop_rate = pack_drop_rate
+        self.tool_error_rate = tool_error_rate
+        self.batches: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def create_batch(self, requests: list[dict]) -> dict:
+        now = time.time()
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:24]}"
+        results = []
+        for req in requests:
+            if random.random() < self.error_rate:
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": "api_error", "message": "mock failure"}}}
+            else:
+                result = {"type": "succeeded", "message": _fake_message(
+                    req.get("params", {}), self.pack_drop_rate, self.tool_error_rate, self.truncate_rate)}
+            results.append({"custom_id": req["custom_id"], "result": result})
+        random.shuffle(results)  # 실제 API 처럼 결과 순서 비보장
+        with self.lock:
+            self.batches[batch_id] = {"created": now, "results": results}
+        return self.batch_object(batch_id, base_url="")
+
+    def batch_object(self, batch_id: str, base_url: str) -> dict:
+        batch = self.batches[batch_id]
+        ended = time.time() - batch["created"] >= self.batch_latency
+        results = batch["results"]
+        succeeded = sum(1 for r in results if r["result"]["type"] == "succeeded")
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else len(results),
+                "succeeded": succeeded if ended else 0,
+                "errored": len(results) - succeeded if ended else 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": _iso(batch["created"]),
+            "ended_at": _iso(batch["created"] + self.batch_latency) if ended else None,
+            "expires_at": _iso(batch["created"] + timedelta(hours=24).total_seconds()),
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{base_url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+
+def _sse_events(message: dict) -> list[tuple[str, dict]]:
+    """완성 응답 → 스트리밍 이벤트 목록 (텍스트는 200자 단위 text_delta)."""
+    start = {**message, "content": [], "stop_reason": None,
+             "usage": {**message["usage"], "output_tokens": 0}}
+    events: list[tuple[str, dict]] = [("message_start", {"type": "message_start", "message": start})]
+    for index, block in enumerate(message["content"]):
+        if block["type"] == "text":
+            events.append(("content_block_start", {
+                "type": "content_block_start", "index": index, "content_block": {"type": "text", "text": ""}}))
+            text = block["text"]
+            for offset in range(0, len(text), 200):
+                events.append(("content_block_delta", {
+                    "type": "content_block_delta", "index": index,
+                    "delta": {"type": "text_delta", "text": text[offset:offset + 200]}}))
+        else:
+            events.append(("content_block_start", {
+                "type": "content_block_start", "index": index, "content_block": {**block, "input": {}}}))
+            events.append(("content_block_delta", {
+                "type": "content_block_delta", "index": index,
+                "delta": {"type": "input_json_delta", "partial_json": json.dumps(block["input"], ensure_ascii=False)}}))
+        events.append(("content_block_stop", {"type": "content_block_stop", "index": index}))
+    events.append(("message_delta", {
+        "type": "message_delta", "delta": {"stop_reason": message["stop_reason"], "stop_sequence": None},
+        "usage": {"output_tokens": message["usage"]["output_tokens"]}}))
+    events.append(("message_stop", {"type": "message_stop"}))
+    return events
+
+
+def make_handler(state: MockState) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt: str, *args: object) -> None:
+            pass
+
+        def _base_url(self) -> str:
+            return f"http://{self.headers.get('Host')}"
+
+        def _send_json(self, status: int, payload: object) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_stream(self, message: dict, delay: float) -> None:
+            events = _sse_events(message)
+            deltas = max(1, sum(1 for event, _ in events if event == "content_block_delta"))
+            self.send_response(200)
+            self.send_header("content-type", "text/event-stream")
+            self.end_headers()
+            for event, data in events:
+                if event == "content_block_delta":
+                    time.sleep(delay / deltas)
+                self.wfile.write(f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+        def _not_found(self) -> None:
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("content-length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            path = self.path.split("?")[0]
+            if path == "/v1/messages":
+                delay = 0.0
+                if state.report_latency and not body.get("tools"):
+                    delay = state.report_latency * min(body.get("max_tokens", 0), 8192) / 8192
+                message = _fake_message(body, state.pack_drop_rate, state.tool_error_rate, state.truncate_rate)
+                if body.get("stream"):
+                    self._send_stream(message, delay)
+                    return
+                time.sleep(delay)
+                self._send_json(200, message)
+            elif path == "/v1/messages/batches":
+                batch = state.create_batch(body.get("requests", []))
+                self._send_json(200, batch)
+            else:
+                self._not_found()
+
+        def do_GET(self) -> None:
+            match = _BATCH_PATH_RE.match(self.path.split("?")[0])
+            if not match or match.group(1) not in state.batches:
+                self._not_found()
+                return
+            batch_id = match.group(1)
+            if not match.group(2):
+                self._send_json(200, state.batch_object(batch_id, self._base_url()))
+                return
+            if state.batch_object(batch_id, "")["processing_status"] != "ended":
+                self._send_json(400, {"type": "error", "error": {
+                    "type": "invalid_request_error", "message": "batch not ended"}})
+                return
+            lines = "\n".join(json.dumps(r, ensure_ascii=False) for r in state.batches[batch_id]["results"])
+            body = (lines + "\n").encode("utf-8")
+            self.send_response(200)
+            self.send_header("content-type", "application/binary")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Anthropic API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--batch-latency", type=float, default=5.0, help="배치 처리 완료까지 걸리는 시간(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="배치 요청별 errored 비율 (0.0~1.0)")
+    parser.add_argument("--pack-drop-rate", type=float, default=0.0,
+                        help="packed 응답에서 원소를 누락할 비율 (0.0~1.0)")
+    parser.add_argument("--tool-error-rate", type=float, default=0.0,
+                        help="단건 분석 도구 input 의 summary 를 비울 비율 (repair 경로 검증)")
+    parser.add_argument("--truncate-rate", type=float, default=0.0,
+                        help="섹션 분할 리포트 응답을 max_tokens 로 자를 비율 (섹션 재요청 검증)")
+    parser.add_argument("--report-latency", type=float, default=0.0,
+                        help="도구 없는 리포트 요청 지연(초) — max_tokens 8192 기준, 비례 축소")
+    args = parser.parse_args()
+
+    state = MockState(
+        args.batch_latency, args.error_rate, args.pack_drop_rate, args.tool_error_rate,
+        args.truncate_rate, args.report_latency,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state))
+    print(f"Mock Anthropic API: http://{args.host}:{args.port} (batch-latency={args.batch_latency}s)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -169,6 +169,37 @@ def category_treemap(df: pd.DataFrame) -> Figure:
     return fig
 
 
+def llm_weekly_cost_chart(df: pd.DataFrame) -> Figure:
+    """주별 Claude 비용 (분석 / 리포트 누적 막대) + 신호당 비용 라인."""
+    if df.empty or "week" not in df.columns:
+        return _empty_fig("호출 원장 데이터 없음")
+
+    fig = go.Figure()
+    fig.add_bar(
+        x=df["week"], y=df["analysis_cost_usd"], name="신호 분석",
+        marker_color="#1A1AEA", hovertemplate="분석 $%{y:.2f}<extra></extra>",
+    )
+    fig.add_bar(
+        x=df["week"], y=df["report_cost_usd"], name="리포트",
+        marker_color="#E4002B", hovertemplate="리포트 $%{y:.2f}<extra></extra>",
+    )
+    fig.add_scatter(
+        x=df["week"], y=df["cost_per_signal"], name="신호당 비용", yaxis="y2",
+        mode="lines+markers", line=dict(color="#F5A623", width=2.5),
+        hovertemplate="신호당 $%{y:.4f}<extra></extra>",
+    )
+    fig.update_xaxes(tickformat="%Y-%m-%d", tickangle=-30)
+    fig.update_layout(
+        **CHART_THEME,
+        barmode="stack",
+        title="주간 Claude 비용 (USD)",
+        yaxis=dict(title="주간 비용"),
+        yaxis2=dict(title="신호당 비용", overlaying="y", side="right", showgrid=False),
+        legend=dict(orientation="h", y=-0.2),
+    )
+    return fig
+
+
 def _empty_fig(message: str) -> Figure:
     """빈 데이터용 빈 Figure."""
     fig = go.Figure()
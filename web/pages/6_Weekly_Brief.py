@@ -35,6 +35,10 @@ def _extract_body(html: str) -> tuple[str, str]:
     return css, body.strip()
 
 
+def _fmt_stat(value: float | None, pattern: str) -> str:
+    return pattern.format(value) if value is not None else "N/A"
+
+
 @st.cache_data(ttl=300)
 def load_latest_report() -> dict | None:
     from database.init_db import get_session
@@ -68,30 +72,53 @@ def load_signals_for_report(days_back: int = 90) -> list[dict]:
         return [] if df.empty else df.to_dict("records")
 
 
+@st.cache_data(ttl=300)
+def load_llm_cost_stats() -> tuple:
+    """호출 원장 집계: (최근 7일 요약, 주별 비용, 최근 28일 용도별 통계)."""
+    from database.init_db import get_session
+    from database.queries import get_llm_cost_summary, get_llm_purpose_stats, get_llm_weekly_costs
+    with get_session() as session:
+        return (
+            get_llm_cost_summary(session, days_back=7),
+            get_llm_weekly_costs(session, weeks=12),
+            get_llm_purpose_stats(session, days_back=28),
+        )
+
+
+def _render_report(html: str) -> str:
+    """리포트 HTML → 본문 마크다운 (CSS 포함)."""
+    css, body = _extract_body(html)
+    style = f"<style>{css}</style>" if css else ""
+    return f'{style}<div class="pasis-report-body">{body}</div>'
+
+
 def _generate_report() -> str:
+    """섹션 조각을 받는 대로 본문 자리에 누적 렌더링 → 완료 후 DB 저장."""
     from pipeline.analyzer import StrategicAnalyzer
-    from pipeline.scheduler import _generate_and_save_weekly_report
+    from pipeline.scheduler import _save_weekly_report
     signals = load_signals_for_report(days_back=90)
     if not signals:
         return "데이터 없음: 먼저 파이프라인을 실행하세요."
-    analyzer = StrategicAnalyzer()
-    _generate_and_save_weekly_report(analyzer, signals, force=True)
-    return "생성 완료"
+
+    section_title("브리핑 본문 (생성 중)")
+    progress = st.empty()
+    progress.caption("Claude 분석 중... 첫 섹션을 기다리는 중입니다.")
+    body_slot = st.empty()
+    html_report = ""
+    for count, piece in enumerate(StrategicAnalyzer().stream_weekly_report(signals), start=1):
+        html_report += piece
+        body_slot.markdown(_render_report(html_report), unsafe_allow_html=True)
+        progress.caption(f"Claude 분석 중... 섹션 {count}개 수신")
+    progress.caption("저장 중...")
+    iso_week = _save_weekly_report(signals, html_report)
+    return f"생성 완료: {iso_week}"
 
 
 # ── 사이드바 ─────────────────────────────────────────────────────────────────
 with st.sidebar:
     sidebar_brand("📰", "Weekly Brief")
 
-    if st.button("주간 리포트 재생성", use_container_width=True, type="primary"):
-        with st.spinner("Claude 분석 중... (30~90초)"):
-            try:
-                msg = _generate_report()
-                st.success(msg)
-                st.cache_data.clear()
-                st.rerun()
-            except Exception as e:
-                st.error(f"오류: {e}")
+    regenerate = st.button("주간 리포트 재생성", use_container_width=True, type="primary")
 
     st.divider()
     st.caption(
@@ -115,6 +142,16 @@ page_header(
     tags=["자동 생성", "Claude AI", "SCR 방법론", "LGU+ 전략", "매주 월요일"],
 )
 
+# 재생성: 섹션이 도착하는 대로 본문을 그리고, 저장 후 새 리포트로 다시 로드
+if regenerate:
+    try:
+        msg = _generate_report()
+        st.success(msg)
+        st.cache_data.clear()
+        st.rerun()
+    except Exception as e:
+        st.error(f"오류: {e}")
+
 report = load_latest_report()
 
 if not report:
@@ -146,10 +183,7 @@ section_title("브리핑 본문")
 html_content = report.get("full_report_html", "")
 
 if html_content and len(html_content) > 100:
-    css, body = _extract_body(html_content)
-    if css:
-        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-    st.markdown(f'<div class="pasis-report-body">{body}</div>', unsafe_allow_html=True)
+    st.markdown(_render_report(html_content), unsafe_allow_html=True)
 else:
     st.warning("리포트 내용이 없습니다. 사이드바에서 재생성해 주세요.")
     signals = load_signals_for_report(days_back=90)
@@ -161,6 +195,34 @@ else:
 
 st.divider()
 
+# ── LLM 비용 · 지연 ───────────────────────────────────────────────────────────
+section_title("LLM 비용 · 지연 (최근 7일)")
+try:
+    cost_summary, weekly_costs, purpose_stats = load_llm_cost_stats()
+except Exception as e:
+    cost_summary, weekly_costs, purpose_stats = {}, None, None
+    st.caption(f"호출 원장 조회 실패: {e}")
+
+if cost_summary:
+    m1, m2, m3, m4, m5 = st.columns(5)
+    m1.metric("Claude 비용", _fmt_stat(cost_summary["cost_usd"], "${:.2f}"), help=f"호출 {cost_summary['calls']}회")
+    m2.metric("신호당 비용", _fmt_stat(cost_summary["cost_per_signal"], "${:.4f}"),
+              help=f"분석 신호 {cost_summary['signals']}건 (repair 포함, 리포트 제외)")
+    m3.metric("지연 p50", _fmt_stat(cost_summary["latency_p50_ms"], "{:,.0f}ms"))
+    m4.metric("지연 p95", _fmt_stat(cost_summary["latency_p95_ms"], "{:,.0f}ms"))
+    m5.metric("리포트 잘림률", _fmt_stat(cost_summary["report_truncation_rate"], "{:.0%}"),
+              help=f"stop_reason=max_tokens 비율 (리포트 {cost_summary['report_calls']}회)")
+
+    from web.components.charts import llm_weekly_cost_chart
+    st.plotly_chart(llm_weekly_cost_chart(weekly_costs), use_container_width=True)
+    if purpose_stats is not None and not purpose_stats.empty:
+        st.caption("용도별 호출 통계 (최근 28일)")
+        st.dataframe(purpose_stats, use_container_width=True, hide_index=True)
+else:
+    st.caption("최근 7일 Claude 호출 기록이 없습니다 (llm_call_ledger).")
+
+st.divider()
+
 # ── 다운로드 ──────────────────────────────────────────────────────────────────
 col_dl1, col_dl2 = st.columns(2)
 with col_dl1:
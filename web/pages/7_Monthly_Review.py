@@ -77,15 +77,19 @@ def load_signals_for_report(days_back: int = 31) -> list[dict]:
         return [] if df.empty else df.to_dict("records")
 
 
+def _render_report(html: str) -> str:
+    """리포트 HTML → 본문 마크다운 (CSS 포함)."""
+    css, body = _extract_body(html)
+    style = f"<style>{css}</style>" if css else ""
+    return f'{style}<div class="pasis-monthly-body">{body}</div>'
+
+
 def _generate_report() -> str:
-    """월간 리포트 즉시 생성 후 DB 저장."""
-    import calendar
-    from datetime import datetime
-    from collections import Counter
+    """섹션 조각을 받는 대로 본문 자리에 누적 렌더링 → 완료 후 DB 저장."""
     from pipeline.analyzer import StrategicAnalyzer
-    from database.init_db import get_session, get_engine
-    from database.models import Base, MonthlyReport
-    from config import CLAUDE_MODEL
+    from pipeline.scheduler import _save_monthly_report
+    from database.init_db import get_engine
+    from database.models import Base
 
     Base.metadata.create_all(get_engine())
 
@@ -93,51 +97,25 @@ def _generate_report() -> str:
     if not signals:
         return "데이터 없음: 먼저 파이프라인을 실행하세요."
 
-    analyzer = StrategicAnalyzer()
-    html_report = analyzer.generate_monthly_report(signals)
-
-    now = datetime.utcnow()
-    month_key   = f"{now.year}-{now.month:02d}"
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    last_day    = calendar.monthrange(now.year, now.month)[1]
-    month_end   = now.replace(day=last_day, hour=23, minute=59, second=59, microsecond=0)
-    scope_counts = Counter(s.get("scope", "") for s in signals)
-
-    with get_session() as session:
-        existing = session.query(MonthlyReport).filter_by(month_key=month_key).first()
-        if existing:
-            session.delete(existing)
-            session.flush()
-        report = MonthlyReport(
-            month_key=month_key,
-            month_start=month_start,
-            month_end=month_end,
-            total_signals=len(signals),
-            market_signals=scope_counts.get("Market", 0),
-            tech_signals=scope_counts.get("Tech", 0),
-            case_signals=scope_counts.get("Case", 0),
-            policy_signals=scope_counts.get("Policy", 0),
-            full_report_html=html_report,
-            model_used=CLAUDE_MODEL,
-            generated_at=now,
-        )
-        session.add(report)
-    return "생성 완료"
+    section_title("월간 전략 리뷰 본문 (생성 중)")
+    progress = st.empty()
+    progress.caption("Claude 분석 중... 첫 섹션을 기다리는 중입니다.")
+    body_slot = st.empty()
+    html_report = ""
+    for count, piece in enumerate(StrategicAnalyzer().stream_monthly_report(signals), start=1):
+        html_report += piece
+        body_slot.markdown(_render_report(html_report), unsafe_allow_html=True)
+        progress.caption(f"Claude 분석 중... 섹션 {count}개 수신")
+    progress.caption("저장 중...")
+    month_key = _save_monthly_report(signals, html_report)
+    return f"생성 완료: {month_key}"
 
 
 # ── 사이드바 ─────────────────────────────────────────────────────────────────
 with st.sidebar:
     sidebar_brand("📋", "Monthly Review")
 
-    if st.button("월간 리포트 재생성", use_container_width=True, type="primary"):
-        with st.spinner("Claude 분석 중... (60~120초)"):
-            try:
-                msg = _generate_report()
-                st.success(msg)
-                st.cache_data.clear()
-                st.rerun()
-            except Exception as e:
-                st.error(f"오류: {e}")
+    regenerate = st.button("월간 리포트 재생성", use_container_width=True, type="primary")
 
     st.divider()
     st.caption(
@@ -162,6 +140,16 @@ page_header(
     tags=["Bain Style", "SCR 방법론", "월간 분석", "Claude AI", "전략 포지셔닝"],
 )
 
+# 재생성: 섹션이 도착하는 대로 본문을 그리고, 저장 후 새 리포트로 다시 로드
+if regenerate:
+    try:
+        msg = _generate_report()
+        st.success(msg)
+        st.cache_data.clear()
+        st.rerun()
+    except Exception as e:
+        st.error(f"오류: {e}")
+
 report = load_latest_monthly_report()
 
 if not report:
@@ -192,10 +180,7 @@ section_title("월간 전략 리뷰 본문")
 html_content = report.get("full_report_html", "")
 
 if html_content and len(html_content) > 100:
-    css, body = _extract_body(html_content)
-    if css:
-        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-    st.markdown(f'<div class="pasis-monthly-body">{body}</div>', unsafe_allow_html=True)
+    st.markdown(_render_report(html_content), unsafe_allow_html=True)
 else:
     st.warning("리포트 내용이 없습니다. 사이드바에서 재생성해 주세요.")
     signals = load_signals_for_report(days_back=31)